@@ -0,0 +1,73 @@
+"""
+Compare generator-based construction of numerical semigroups against the
+product-of-generators sieve it replaced.
+
+Run from the repository root:
+
+    python benchmarks/bench_generators.py
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.pocketpartition.core.apery import apery_set_from_generators, gaps_mask_from_apery_set
+from src.pocketpartition.utils.helpers import remove_sum_of_two_elements
+
+CASES = [
+    {3, 5},
+    {5, 7, 9},
+    {11, 13, 17, 19},
+    {13, 17, 19, 23, 29},
+    {101, 103, 107, 109, 113},
+    {1001, 1297, 1543, 2011},
+    {4001, 4003, 4007, 4013, 4019, 4021},
+]
+
+# The sieve is skipped once the product of the generators exceeds this bound.
+SIEVE_LIMIT = 10 ** 6
+
+
+def sieve_gaps(generators):
+    """The previous implementation: sieve every integer below the product of the generators."""
+    semigroup = set()
+    reduced_gens = remove_sum_of_two_elements(set(generators))
+    bound = 1
+    for gen in reduced_gens:
+        bound *= gen
+    for i in range(bound):
+        for g in reduced_gens:
+            if i - g in semigroup or i - g == 0:
+                semigroup.add(i)
+                break
+    return set(range(1, bound)) - semigroup
+
+
+def apery_gaps(generators):
+    return gaps_mask_from_apery_set(apery_set_from_generators(generators))
+
+
+def best_of(func, arg, repeat=3):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(arg)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    print(f"{'generators':<40} {'sieve (s)':>12} {'apery (s)':>12}")
+    for gens in CASES:
+        product = 1
+        for g in gens:
+            product *= g
+        sieve_time = best_of(sieve_gaps, gens) if product <= SIEVE_LIMIT else None
+        apery_time = best_of(apery_gaps, gens)
+        sieve_col = f"{sieve_time:12.5f}" if sieve_time is not None else f"{'skipped':>12}"
+        print(f"{str(sorted(gens)):<40} {sieve_col} {apery_time:12.5f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,286 @@
+"""
+Benchmark suite for the core algorithms, with stored baselines.
+
+Every benchmark is run over a list of sizes, so the results record how each
+algorithm scales. Interning is switched off while timing, so every call
+builds and computes from scratch instead of hitting an instance cache.
+
+Run from the repository root:
+
+    python benchmarks/run_benchmarks.py                   # print timings
+    python benchmarks/run_benchmarks.py --compare         # compare with benchmarks/baselines.json
+    python benchmarks/run_benchmarks.py --save            # overwrite the baselines
+    python benchmarks/run_benchmarks.py --filter genus    # only benchmarks whose name contains 'genus'
+
+Every timing is the best of several rounds, and the spread between the best
+and the worst round is stored next to each baseline as its noise ratio. With
+--compare the exit status is 1 when some timing is slower than its baseline
+by more than --threshold (a ratio, 1.5 by default) times that noise ratio, so
+sizes that time unsteadily get a wider tolerance. --save takes at least
+SAVE_REPEAT rounds.
+
+Baselines are machine dependent; regenerate them with --save on the machine
+that runs the comparison, and again in the same change whenever a measured
+kernel is rewritten, so that --compare never reports against stale numbers.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import time
+from itertools import islice
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.pocketpartition.core.numerical_set import NumericalSet
+from src.pocketpartition.core.numerical_semigroup import NumericalSemigroup
+from src.pocketpartition.core.numerical_functions import get_gap_poset
+from src.pocketpartition.core.genus import WithGenus, CountWithGenus, IterWithGenus
+from src.pocketpartition.core.batch import batch_invariants
+from src.pocketpartition.core.kunz import KunzPolyhedron
+from src.pocketpartition.core.apery import invariants_from_generators, _generator_invariants
+from src.pocketpartition.core.partition import Partition
+from src.pocketpartition.core.poset import Poset
+from src.pocketpartition.visualization.tikz import generate_hasse_tikz, generate_ferrers_tikz
+from src.pocketpartition.utils.cache import configure_interning
+
+BASELINES = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baselines.json')
+SAVE_REPEAT = 9
+
+# Semigroups generated by n, n + 1, ..., 2n - 1 minus every third generator,
+# which have multiplicity n and Frobenius number growing with n.
+def _semigroup(n):
+    return NumericalSemigroup(generators=[k for k in range(n, 2 * n) if k % 3 or k == n] + [2 * n + 1])
+
+def _fresh(S):
+    # A new instance with no cached results.
+    return NumericalSemigroup._from_mask(S._mask, validate=False)
+
+def bench_generators(n):
+    generators = [n * n + 1] + [n * n + 1 + k * n for k in range(1, n)]
+    return lambda: NumericalSemigroup(generators=generators)
+
+def bench_atom_monoid_gaps(n):
+    # A numerical set with Frobenius number about 4n that is not a semigroup.
+    T = NumericalSet(gaps=[k for k in range(1, 4 * n) if k % 3])
+    return lambda: NumericalSet._from_mask(T._mask, validate=False).atom_monoid_gaps()
+
+def bench_minimal_generating_set(n):
+    S = _semigroup(n)
+    return lambda: _fresh(S).minimal_generating_set()
+
+def bench_pseudofrobenius_numbers(n):
+    S = _semigroup(n)
+    return lambda: _fresh(S).pseudofrobenius_numbers()
+
+def bench_with_genus(g):
+    return lambda: WithGenus(g)
+
+def bench_count_with_genus(g):
+    return lambda: CountWithGenus(g)
+
+def bench_poset_construction(n):
+    elements, relations = _semigroup(n).gap_poset()
+    return lambda: Poset(elements, relations)
+
+def bench_cover_relations(n):
+    elements, relations = _semigroup(n).gap_poset()
+    def run():
+        Poset(elements, relations, validate=False).cover_relations()
+    return run
+
+def bench_hasse_tikz(n):
+    P = get_gap_poset(_semigroup(n))
+    elements, covers = sorted(P.elements), sorted(P.cover_relations())
+    return lambda: generate_hasse_tikz(elements, covers)
+
+def bench_ferrers_tikz(n):
+    hooks = Partition(_semigroup(n).partition()).hook_lengths()
+    return lambda: generate_ferrers_tikz(hooks, display_hooks=True)
+
+def _kunz_rows(m, count=20000):
+    # Kunz tuples of depth at most 2 drawn with a fixed seed, all of them points.
+    points = list(KunzPolyhedron(m).integer_points(depth=2))
+    rng = random.Random(m)
+    return [rng.choice(points) for _ in range(count)]
+
+def bench_kunz_is_points(m):
+    P, rows = KunzPolyhedron(m), _kunz_rows(m)
+    return lambda: P.is_points(rows)
+
+def bench_kunz_is_point_loop(m):
+    P, rows = KunzPolyhedron(m), _kunz_rows(m)
+    return lambda: [P.is_point(row) for row in rows]
+
+def _genus_sample(g, count=5000):
+    # The first semigroups of genus g in traversal order.
+    return list(islice(IterWithGenus(g), count))
+
+def bench_batch_invariants(g):
+    semigroups = _genus_sample(g)
+    return lambda: batch_invariants(semigroups)
+
+def bench_batch_invariant_methods(g):
+    semigroups = _genus_sample(g)
+    def run():
+        for S in semigroups:
+            S = _fresh(S)
+            S.frobenius_number, S.genus, S.multiplicity(), S.type(), S.depth()
+            S.minimal_generating_set(), S.effective_weight(), S.apery_weight()
+    return run
+
+def bench_invariants_from_generators(n):
+    # Four generators between n and 1.1 n, drawn with a fixed seed. The
+    # memoized results are dropped so every call builds the Apéry set.
+    rng = random.Random(n)
+    generators = rng.sample(range(n, n + n // 10), 4)
+    def run():
+        _generator_invariants.cache_clear()
+        invariants_from_generators(generators)
+    return run
+
+BENCHMARKS = [
+    ('generators', bench_generators, [4, 8, 16, 32]),
+    ('atom_monoid_gaps', bench_atom_monoid_gaps, [25, 50, 100, 200]),
+    ('minimal_generating_set', bench_minimal_generating_set, [8, 16, 32, 64]),
+    ('pseudofrobenius_numbers', bench_pseudofrobenius_numbers, [8, 16, 32, 64]),
+    ('with_genus', bench_with_genus, [10, 12, 14, 16]),
+    ('count_with_genus', bench_count_with_genus, [14, 16, 18, 20]),
+    ('poset_construction', bench_poset_construction, [8, 16, 32, 64]),
+    ('cover_relations', bench_cover_relations, [8, 16, 32, 64]),
+    ('hasse_tikz', bench_hasse_tikz, [8, 16, 32, 64]),
+    ('ferrers_tikz', bench_ferrers_tikz, [8, 16, 32, 64]),
+    ('kunz_is_points', bench_kunz_is_points, [4, 8, 12, 16]),
+    ('kunz_is_point_loop', bench_kunz_is_point_loop, [4, 8, 12, 16]),
+    ('batch_invariants', bench_batch_invariants, [10, 14, 18, 22]),
+    ('batch_invariant_methods', bench_batch_invariant_methods, [10, 14, 18, 22]),
+    ('invariants_from_generators', bench_invariants_from_generators, [10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6]),
+]
+
+def time_call(func, repeat=5, min_time=0.05):
+    """
+    Time a callable: the best of repeat rounds, each looping until min_time has passed.
+
+    Returns:
+    tuple: (best, noise) where best is the best time per call in seconds and
+    noise is the ratio of the worst round to the best one.
+    """
+    rounds = []
+    for _ in range(repeat):
+        calls = 0
+        start = time.perf_counter()
+        while True:
+            func()
+            calls += 1
+            elapsed = time.perf_counter() - start
+            if elapsed >= min_time:
+                break
+        rounds.append(elapsed / calls)
+    best = min(rounds)
+    return best, max(rounds) / best
+
+def run(name_filter=None, repeat=5):
+    """
+    Run the benchmarks.
+
+    Returns:
+    tuple: (results, noise), two dictionaries mapping each benchmark name to a
+    dictionary from size (as a string) to the best seconds per call and to the
+    ratio of the worst round to the best one.
+    """
+    configure_interning('off')
+    try:
+        results = {}
+        noise = {}
+        for name, setup, sizes in BENCHMARKS:
+            if name_filter and name_filter not in name:
+                continue
+            results[name] = {}
+            noise[name] = {}
+            for size in sizes:
+                seconds, spread = time_call(setup(size), repeat=repeat)
+                results[name][str(size)] = seconds
+                noise[name][str(size)] = spread
+                print(f"{name:<26} {size:>6} {seconds * 1e3:12.4f} ms  (worst round {spread:.2f}x)", flush=True)
+        return results, noise
+    finally:
+        configure_interning('weak')
+
+def compare(results, baselines, threshold, noise=None):
+    """
+    Compare results with baselines.
+
+    A timing is a regression when it is slower than its baseline by more than
+    threshold times the noise ratio recorded with the baseline (1 if none was).
+
+    Returns:
+    list of tuple: (name, size, baseline, current, ratio) for every timing slower than its tolerance.
+    """
+    noise = noise or {}
+    regressions = []
+    for name, timings in results.items():
+        for size, seconds in timings.items():
+            baseline = baselines.get(name, {}).get(size)
+            if baseline is None:
+                continue
+            ratio = seconds / baseline
+            limit = threshold * noise.get(name, {}).get(size, 1.0)
+            marker = ' <-- slower' if ratio > limit else ''
+            print(f"{name:<26} {size:>6} {baseline * 1e3:12.4f} ms {seconds * 1e3:12.4f} ms {ratio:7.2f}x / {limit:.2f}x{marker}")
+            if ratio > limit:
+                regressions.append((name, size, baseline, seconds, ratio))
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--filter', help='only run benchmarks whose name contains this string')
+    parser.add_argument('--repeat', type=int, default=5, help=f'timing rounds per size (default 5, at least {SAVE_REPEAT} with --save)')
+    parser.add_argument('--save', action='store_true', help='store the results as the new baselines')
+    parser.add_argument('--compare', action='store_true', help='compare the results with the baselines')
+    parser.add_argument('--threshold', type=float, default=1.5, help='slowdown ratio flagged as a regression (default 1.5)')
+    parser.add_argument('--baselines', default=BASELINES, help='baselines file (default benchmarks/baselines.json)')
+    parser.add_argument('--output', help='also write the results to this JSON file')
+    args = parser.parse_args(argv)
+
+    repeat = max(args.repeat, SAVE_REPEAT) if args.save else args.repeat
+    results, noise = run(args.filter, repeat)
+    document = {
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'repeat': repeat,
+        'results': results,
+        'noise': noise,
+    }
+    if args.output:
+        with open(args.output, 'w') as handle:
+            json.dump(document, handle, indent=2, sort_keys=True)
+
+    status = 0
+    if args.compare:
+        with open(args.baselines) as handle:
+            stored = json.load(handle)
+        print()
+        regressions = compare(results, stored['results'], args.threshold, stored.get('noise'))
+        if regressions:
+            print(f"\n{len(regressions)} timing(s) slower than {args.threshold}x the baseline times its noise ratio.")
+            status = 1
+        else:
+            print(f"\nNo timing slower than {args.threshold}x the baseline times its noise ratio.")
+    if args.save:
+        if args.filter and os.path.exists(args.baselines):
+            # Keep the baselines of the benchmarks that were not run.
+            with open(args.baselines) as handle:
+                stored = json.load(handle)
+            stored['results'].update(results)
+            stored.setdefault('noise', {}).update(noise)
+            stored.update({key: value for key, value in document.items() if key not in ('results', 'noise')})
+            document = stored
+        with open(args.baselines, 'w') as handle:
+            json.dump(document, handle, indent=2, sort_keys=True)
+            handle.write('\n')
+    return status
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -10,10 +10,38 @@ from .core.kunz import (
     kunz_tuple
 )
 from .core.partition import Partition
-from .core.random_numerical import RandomNumericalSemigroupWithGenus
+from .core.apery import (
+    frobenius_number_from_generators,
+    genus_from_generators,
+    type_from_generators,
+    invariants_from_generators
+)
+from .core.random_numerical import RandomNumericalSemigroupWithGenus, RandomNumericalSemigroupsWithGenus
 from .core.genus import (
     WithGenus,
-    WithMaxGenus
+    WithMaxGenus,
+    IterWithGenus,
+    IterWithMaxGenus,
+    CountWithGenus,
+    CountsWithMaxGenus,
+    MapWithGenus
+)
+from .core.frobenius import WithFrobeniusNumber, IterWithFrobeniusNumber, CountWithFrobeniusNumber
+from .core.semigroup_partitions import (
+    IterSemigroupPartitions,
+    IterSemigroupPartitionsWithMaxSize,
+    CountSemigroupPartitions,
+    CountsSemigroupPartitionsWithMaxSize
+)
+from .core.atom_monoid import IterNumericalSetsWithAtomMonoid, CountNumericalSetsWithAtomMonoid
+from .core.batch import batch_invariants, InvariantTable
+from .core.catalog import build_catalog, SemigroupCatalog
+from .utils.profiling import profile, _profile_from_environment
+from .utils.cache import (
+    configure_interning,
+    intern_stats,
+    cache_stats,
+    clear_intern_pools
 )
 
 __all__ = [
@@ -21,11 +49,41 @@ __all__ = [
     'NumericalSemigroup',
     'Partition',
     'RandomNumericalSemigroupWithGenus',
+    'RandomNumericalSemigroupsWithGenus',
     'get_atom_monoid',
     'get_partition',
     'get_gap_poset',
     'get_void_poset',
     'kunz_tuple',
+    'frobenius_number_from_generators',
+    'genus_from_generators',
+    'type_from_generators',
+    'invariants_from_generators',
     'WithGenus',
-    'WithMaxGenus'
+    'WithMaxGenus',
+    'IterWithGenus',
+    'IterWithMaxGenus',
+    'CountWithGenus',
+    'CountsWithMaxGenus',
+    'MapWithGenus',
+    'WithFrobeniusNumber',
+    'IterWithFrobeniusNumber',
+    'CountWithFrobeniusNumber',
+    'IterSemigroupPartitions',
+    'IterSemigroupPartitionsWithMaxSize',
+    'CountSemigroupPartitions',
+    'CountsSemigroupPartitionsWithMaxSize',
+    'IterNumericalSetsWithAtomMonoid',
+    'CountNumericalSetsWithAtomMonoid',
+    'batch_invariants',
+    'InvariantTable',
+    'build_catalog',
+    'SemigroupCatalog',
+    'configure_interning',
+    'intern_stats',
+    'cache_stats',
+    'clear_intern_pools',
+    'profile'
 ]
+
+_profile_from_environment()
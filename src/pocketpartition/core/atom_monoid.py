@@ -0,0 +1,127 @@
+__all__ = ['IterNumericalSetsWithAtomMonoid', 'CountNumericalSetsWithAtomMonoid']
+
+from .numerical_set import NumericalSet
+from ..utils.bitset import bits_to_list
+from ..utils.parallel import resolve_processes, parallel_map
+
+# The atom monoid A(T) = {x : x + T is contained in T} of a numerical set T is a
+# numerical semigroup contained in T with the same Frobenius number F. So the
+# numerical sets with A(T) = S are T = S with some set X of gaps of S other
+# than F added, and A(T) = S holds exactly when
+#
+#   (1) every x in X has x + s in T for all s in S (S is inside A(T)), and
+#   (2) every x in X has a witness t in T with x + t a gap of T (x is not in A(T)).
+#
+# The gaps of S are decided from the largest down, so when x is decided every
+# gap of T above it is known. By (1), a new gap y of T forces every y - s
+# (s in S) to be a gap as well; since S is closed under addition one shift of
+# the reversed elements of S finds all of them at once, so these forced gaps
+# are filled in immediately and (1) never fails later. For (2), the witnesses
+# of x are the t with x + t a known gap and t not a gap; a t that is still
+# undecided may become a gap later. An x whose witnesses are all undecided
+# stays pending, and the branch dies when a pending x loses its last witness,
+# so every leaf of the search is a solution.
+
+def _search_data(S):
+    F = S.frobenius_number
+    full = (1 << (F + 1)) - 1
+    elements = ~S._mask & full & ~1
+    # Bit F - s is set for every nonzero element s <= F, so (reversed >> (F - y))
+    # has bit y - s set for every element s < y.
+    reversed_elements = int(format(elements, f'0{F + 1}b')[::-1], 2)
+    order = [g for g in reversed(bits_to_list(S._mask)) if g != F]
+    undecided = [0] * (len(order) + 1)
+    for k in range(len(order) - 1, -1, -1):
+        undecided[k] = undecided[k + 1] | (1 << order[k])
+    root_gaps = (1 << F) | (reversed_elements & undecided[0])
+    return F, full, reversed_elements, order, undecided, root_gaps
+
+def _children(data, k, gaps, pending):
+    # The consistent ways to decide order[k], as (gaps, pending) pairs.
+    F, full, reversed_elements, order, undecided, _ = data
+    y = order[k]
+    if (gaps >> y) & 1:
+        # Already forced to be a gap.
+        return [(gaps, pending)]
+    remaining = undecided[k + 1] & ~gaps
+    children = []
+
+    # y in T
+    witnesses = (gaps >> y) & ~gaps & full
+    if witnesses:
+        new_pending = [x for x in pending if not (gaps >> (x + y)) & 1]
+        if not witnesses & ~remaining:
+            new_pending.append(y)
+        children.append((gaps, new_pending))
+
+    # y a gap of T, and so every y - s
+    new_gaps = gaps | (1 << y) | ((reversed_elements >> (F - y)) & remaining)
+    if all((new_gaps >> x) & ~new_gaps & full for x in pending):
+        children.append((new_gaps, pending))
+    return children
+
+def _count(data, k, gaps, pending):
+    if k == len(data[3]):
+        return 1
+    return sum(_count(data, k + 1, child_gaps, child_pending) for child_gaps, child_pending in _children(data, k, gaps, pending))
+
+def _iter(data, k, gaps, pending):
+    if k == len(data[3]):
+        yield gaps
+        return
+    for child_gaps, child_pending in _children(data, k, gaps, pending):
+        yield from _iter(data, k + 1, child_gaps, child_pending)
+
+def IterNumericalSetsWithAtomMonoid(S):
+    """
+    Iterate over the numerical sets whose atom monoid is S.
+
+    Parameters:
+    S (NumericalSemigroup): The numerical semigroup.
+
+    Yields:
+    NumericalSet: Each numerical set T with get_atom_monoid(T) == S.
+    """
+    if not S._mask:
+        yield NumericalSet._from_mask(0)
+        return
+    data = _search_data(S)
+    for gaps in _iter(data, 0, data[5], []):
+        yield NumericalSet._from_mask(gaps)
+
+def _count_task(task):
+    S, k, gaps, pending = task
+    return _count(_search_data(S), k, gaps, pending)
+
+def CountNumericalSetsWithAtomMonoid(S, processes=1, split_depth=None):
+    """
+    Count the numerical sets whose atom monoid is S.
+
+    With more than one process the first split_depth decisions (by default
+    enough for about sixteen subtrees per worker) are expanded in the calling
+    process and the subtrees are counted in a process pool.
+
+    Parameters:
+    S (NumericalSemigroup): The numerical semigroup.
+    processes (int or None): Number of worker processes; None uses every CPU.
+    split_depth (int or None): Number of gaps decided before the subtrees are handed out.
+
+    Returns:
+    int: The number of numerical sets T with get_atom_monoid(T) == S.
+    """
+    if not S._mask:
+        return 1
+    data = _search_data(S)
+    root = (0, data[5], [])
+    processes = resolve_processes(processes)
+    if processes == 1:
+        return _count(data, *root)
+
+    if split_depth is None:
+        split_depth = (processes * 16).bit_length()
+    split_depth = min(split_depth, len(data[3]))
+    frontier = [root]
+    for k in range(split_depth):
+        frontier = [(k + 1, gaps, pending) for _, g, p in frontier for gaps, pending in _children(data, k, g, p)]
+    tasks = ((S, k, gaps, pending) for k, gaps, pending in frontier)
+    return sum(parallel_map(_count_task, tasks, processes=processes, ordered=False))
@@ -0,0 +1,289 @@
+__all__ = ['InvariantTable', 'batch_invariants', 'BATCH_INVARIANTS']
+
+from array import array
+from itertools import islice
+from ..utils.bitset import bits_to_list, popcount
+
+BATCH_INVARIANTS = (
+    'frobenius_number',
+    'genus',
+    'multiplicity',
+    'type',
+    'depth',
+    'minimal_generating_set',
+    'effective_weight',
+    'apery_weight',
+)
+
+# Invariants that need the pass over the positions, and the weights that need a second one.
+_APERY_INVARIANTS = {'type', 'minimal_generating_set', 'effective_weight', 'apery_weight'}
+_WEIGHT_INVARIANTS = {'effective_weight', 'apery_weight'}
+
+_TYPECODES = {16: 'H', 32: 'I', 64: 'Q'}
+
+class _PackedChunk:
+    """
+    A chunk of gap masks side by side in one integer, one lane of bits per mask.
+
+    The lanes are a power of two wide and wider than F + g + 1 >= F + m for
+    every semigroup of the chunk, so each element up to F + m sits inside
+    its lane, and bits past the top of a lane stand for elements. A set of
+    positions per semigroup is then one packed integer, and a shift, mask or
+    addition acts on every semigroup of the chunk at once.
+    """
+
+    def __init__(self, masks):
+        needed = max(mask.bit_length() + popcount(mask) for mask in masks) + 1
+        bits = 16
+        while bits < needed:
+            bits *= 2
+        self.bits = bits
+        self.length = len(masks)
+        self.lane = (1 << bits) - 1
+        self.ones = ((1 << (bits * self.length)) - 1) // self.lane
+        self.gaps = int.from_bytes(b''.join(mask.to_bytes(bits // 8, 'little') for mask in masks), 'little')
+
+    def above(self, s):
+        # Positions s and up in every lane.
+        return self.ones * (self.lane ^ ((1 << s) - 1))
+
+    def spread(self, x):
+        # Every lane whose lowest bit is set in x, filled with ones.
+        return (x & self.ones) * self.lane
+
+    def values(self, x):
+        """
+        Unpack the lanes of a packed integer.
+
+        Returns:
+        list of int: The value held in each lane.
+        """
+        data = x.to_bytes(self.length * self.bits // 8, 'little')
+        typecode = _TYPECODES.get(self.bits)
+        if typecode is None:
+            size = self.bits // 8
+            return [int.from_bytes(data[i:i + size], 'little') for i in range(0, len(data), size)]
+        lanes = array(typecode)
+        lanes.frombytes(data)
+        return lanes.tolist()
+
+    def counts(self, x):
+        """
+        Count the set bits of every lane, by adding neighbouring fields of
+        doubling width until each lane holds its own count.
+
+        Returns:
+        list of int: The number of set bits in each lane.
+        """
+        total = self.bits * self.length
+        width = 1
+        while width < self.bits:
+            fields = ((1 << total) - 1) // ((1 << (2 * width)) - 1) * ((1 << width) - 1)
+            x = (x & fields) + ((x >> width) & fields)
+            width *= 2
+        return self.values(x)
+
+class InvariantTable:
+    """
+    Columnar table of numerical semigroup invariants.
+
+    Every scalar invariant is an array('q') column, one entry per semigroup.
+    The minimal generating sets are stored as one flat array('q') of values
+    plus an array('q') of row offsets. Arrays support the buffer protocol, so
+    numpy.frombuffer(table['genus'], dtype='int64') gives a zero-copy view.
+    """
+
+    def __init__(self, invariants):
+        self._invariants = tuple(invariants)
+        self._columns = {name: array('q') for name in self._invariants if name != 'minimal_generating_set'}
+        if 'minimal_generating_set' in self._invariants:
+            self._generator_values = array('q')
+            self._generator_offsets = array('q', [0])
+        self._length = 0
+
+    @property
+    def invariants(self):
+        return self._invariants
+
+    def __len__(self):
+        return self._length
+
+    def __repr__(self):
+        return f"InvariantTable(rows={self._length}, invariants={list(self._invariants)})"
+
+    def __getitem__(self, name):
+        return self.column(name)
+
+    def column(self, name):
+        """
+        Return a column of the table.
+
+        Parameters:
+        name (str): The invariant.
+
+        Returns:
+        array or list: The array('q') column of a scalar invariant, or the list
+        of minimal generating sets for 'minimal_generating_set'.
+        """
+        if name not in self._invariants:
+            raise KeyError(f"The table has no column {name!r}.")
+        if name == 'minimal_generating_set':
+            return [self.generators(i) for i in range(self._length)]
+        return self._columns[name]
+
+    def generators(self, i):
+        """
+        Return the minimal generating set of row i.
+
+        Parameters:
+        i (int): The row.
+
+        Returns:
+        list of int: The minimal generating set.
+        """
+        start, end = self._generator_offsets[i], self._generator_offsets[i + 1]
+        return self._generator_values[start:end].tolist()
+
+    def ragged_generators(self):
+        """
+        Return the minimal generating sets in their flat storage.
+
+        Returns:
+        tuple: (values, offsets), where the generators of row i are values[offsets[i]:offsets[i + 1]].
+        """
+        return self._generator_values, self._generator_offsets
+
+    def row(self, i):
+        """
+        Return one row of the table.
+
+        Parameters:
+        i (int): The row.
+
+        Returns:
+        dict: The invariants of the i-th semigroup.
+        """
+        return {
+            name: self.generators(i) if name == 'minimal_generating_set' else self._columns[name][i]
+            for name in self._invariants
+        }
+
+    def rows(self):
+        for i in range(self._length):
+            yield self.row(i)
+
+    def to_dict(self):
+        """
+        Return the table as a dictionary of lists.
+
+        Returns:
+        dict: A dictionary mapping each invariant to the list of its values.
+        """
+        return {name: list(self.column(name)) for name in self._invariants}
+
+    def _append_chunk(self, masks):
+        chunk = _PackedChunk(masks)
+        bits, ones, gaps = chunk.bits, chunk.ones, chunk.gaps
+        elements = (ones * chunk.lane) & ~gaps
+        nonzero = elements & ~ones
+        # The lowest bit of every lane of nonzero, which is the multiplicity.
+        smallest = nonzero & ~(nonzero - ones)
+        multiplicity = chunk.counts(smallest - ones)
+        # Smearing each lane down from its top gap leaves F + 1 set bits.
+        smear, shift = gaps, 1
+        while shift < bits:
+            smear |= (smear >> shift) & ~chunk.above(bits - shift)
+            shift *= 2
+        frobenius = [count - 1 for count in chunk.counts(smear)]
+
+        columns = self._columns
+        if 'frobenius_number' in columns:
+            columns['frobenius_number'].fromlist(frobenius)
+        if 'genus' in columns:
+            columns['genus'].fromlist(chunk.counts(gaps))
+        if 'multiplicity' in columns:
+            columns['multiplicity'].fromlist(multiplicity)
+        if 'depth' in columns:
+            columns['depth'].extend(-(-(f + 1) // m) for f, m in zip(frobenius, multiplicity))
+
+        if _APERY_INVARIANTS.intersection(self._invariants):
+            # One pass over the positions s: the sums x + s of two nonzero
+            # elements, the gaps x with x + s an element for every nonzero
+            # element s (the pseudo-Frobenius numbers), and the elements
+            # shifted up by the multiplicity, so that the Apéry set is what
+            # they miss. Past F + 1 nothing changes: a position above F + m
+            # is m plus a nonzero element, which the shift already finds.
+            sums = shifted = 0
+            pseudo = gaps
+            largest = max(frobenius)
+            for s in range(1, largest + 2):
+                has_s = chunk.spread(nonzero >> s)
+                above = chunk.above(s)
+                sums |= (nonzero << s) & above & has_s
+                pseudo &= (elements >> s) | chunk.above(bits - s) | ~has_s
+                shifted |= (elements << s) & above & chunk.spread(smallest >> s)
+            minimal = nonzero & ~sums & ~(shifted & ~smallest)
+            if 'type' in columns:
+                columns['type'].fromlist(chunk.counts(pseudo))
+            if 'minimal_generating_set' in self._invariants:
+                for lane in chunk.values(minimal):
+                    self._generator_values.extend(bits_to_list(lane))
+                    self._generator_offsets.append(len(self._generator_values))
+            if _WEIGHT_INVARIANTS.intersection(self._invariants):
+                # Both weights add, over the gaps x, how many positions of a
+                # set lie below x: the minimal generators, and the nonzero
+                # Apéry elements with m in place of 0. The counts are kept
+                # per lane and updated one position at a time.
+                apery = (elements & ~shifted & ~ones) | smallest
+                effective_weight = apery_weight = generators_below = apery_below = 0
+                for x in range(1, largest + 1):
+                    is_gap = chunk.spread(gaps >> x)
+                    effective_weight += generators_below & is_gap
+                    apery_weight += apery_below & is_gap
+                    generators_below += (minimal >> x) & ones
+                    apery_below += (apery >> x) & ones
+                if 'effective_weight' in columns:
+                    columns['effective_weight'].fromlist(chunk.values(effective_weight))
+                if 'apery_weight' in columns:
+                    columns['apery_weight'].fromlist(chunk.values(apery_weight))
+        self._length += len(masks)
+
+def batch_invariants(semigroups, invariants=None, chunk_size=4096):
+    """
+    Compute invariants of many numerical semigroups into a columnar table.
+
+    The semigroups are consumed in chunks of chunk_size gap masks, which are
+    packed side by side into one integer with a lane per semigroup. Every
+    invariant is then computed for the whole chunk with big-integer shifts,
+    masks and additions, in passes over the positions up to the largest
+    Frobenius number of the chunk rather than over the semigroups; only the
+    columns are unpacked row by row. For 5000 semigroups of genus 10 to 22
+    this is 5 to 8 times faster than calling the methods (the batch_invariants
+    and batch_invariant_methods benchmarks). The input can be a list or a lazy
+    iterator such as IterWithGenus(g).
+
+    Parameters:
+    semigroups (iterable of NumericalSemigroup): The semigroups.
+    invariants (list of str or None): The invariants to compute, from BATCH_INVARIANTS; by default all of them.
+    chunk_size (int): Number of semigroups processed per pass.
+
+    Returns:
+    InvariantTable: The table with one row per semigroup, in input order.
+
+    Raises:
+    ValueError: If an unknown invariant is requested.
+    """
+    invariants = BATCH_INVARIANTS if invariants is None else tuple(invariants)
+    unknown = set(invariants) - set(BATCH_INVARIANTS)
+    if unknown:
+        raise ValueError(f"Unknown invariants: {sorted(unknown)}. Choose from {BATCH_INVARIANTS}.")
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be a positive integer.")
+
+    table = InvariantTable(invariants)
+    semigroups = iter(semigroups)
+    while True:
+        masks = [S._mask for S in islice(semigroups, chunk_size)]
+        if not masks:
+            return table
+        table._append_chunk(masks)
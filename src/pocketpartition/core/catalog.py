@@ -0,0 +1,262 @@
+__all__ = ['SemigroupCatalog', 'build_catalog']
+
+import mmap
+import struct
+from bisect import bisect_left
+from .genus import _root_state, _walk, _split_tree, _TASK_BUDGET
+from .numerical_semigroup import NumericalSemigroup
+from ..utils.parallel import resolve_processes, parallel_worklist
+
+# On-disk layout, all integers little-endian:
+#
+#   header   magic, max_genus, record width in bytes, record count, bucket
+#            count and the byte offset of the records
+#   buckets  one (genus, multiplicity, frobenius_number, start, count) entry per
+#            nonempty class, sorted by (genus, multiplicity, frobenius_number)
+#   records  the gap bitmasks, width bytes each, in bucket order and sorted by
+#            mask value inside a bucket
+#
+# The Frobenius number is a signed field, as it is -1 for the semigroup of all
+# nonnegative integers.
+#
+# Records of one genus, and of one genus and multiplicity, are therefore
+# contiguous, and a query by Frobenius number reads one range per multiplicity.
+# The record section starts on an 8-byte boundary, so when width is 1, 2, 4 or
+# 8 it can be mapped directly as an unsigned integer array, for example with
+# numpy.memmap(path, dtype='<u8', offset=catalog.records_offset, shape=(len(catalog),)).
+
+_MAGIC = b'PPCAT\x00\x02\x00'
+_HEADER = struct.Struct('<8sHHQQQ')
+_BUCKET = struct.Struct('<HHiQQ')
+
+def _record_width(max_genus):
+    # Gaps are below 2g, so the masks of genus at most g fit in 2g bits.
+    needed = max(1, -(-2 * max_genus // 8))
+    for width in (1, 2, 4, 8):
+        if needed <= width:
+            return width
+    return -(-needed // 8) * 8
+
+def _add_node(buckets, state, genus, width):
+    _, conductor, multiplicity, mask = state
+    # The root of the tree, of genus 0, is kept with conductor 1 as a traversal
+    # state, but its Frobenius number is -1.
+    key = (genus, multiplicity, conductor - 1 if genus else -1)
+    bucket = buckets.get(key)
+    if bucket is None:
+        bucket = buckets[key] = bytearray()
+    bucket += mask.to_bytes(width, 'little')
+
+def _catalog_task(task):
+    state, genus, max_genus, width = task
+    buckets = {}
+    leftovers = []
+    for node, node_genus in _walk(state, genus, max_genus, _TASK_BUDGET, leftovers):
+        _add_node(buckets, node, node_genus, width)
+    return buckets, [(child, child_genus, max_genus, width) for child, child_genus in leftovers]
+
+def build_catalog(path, max_genus, processes=1, tasks_per_process=16):
+    """
+    Enumerate the numerical semigroups of genus at most max_genus into a catalog file.
+
+    The semigroup tree is walked once (split into subtrees over a process
+    pool when processes > 1). Each node is filed as a fixed-width gap bitmask
+    under its (genus, multiplicity, Frobenius number) class, which is read
+    directly off the traversal state. The file content does not depend on
+    the number of processes.
+
+    Parameters:
+    path (str): The file to write.
+    max_genus (int): The largest genus in the catalog.
+    processes (int or None): Number of worker processes; None uses every CPU.
+    tasks_per_process (int): How many subtrees to aim for per worker, for load balancing.
+
+    Returns:
+    int: The number of semigroups written.
+
+    Raises:
+    ValueError: If max_genus is negative or too large for the file format.
+    """
+    if not isinstance(max_genus, int) or not 0 <= max_genus < 1 << 15:
+        raise ValueError("max_genus must be a nonnegative integer below 32768.")
+    processes = resolve_processes(processes)
+    width = _record_width(max_genus)
+
+    buckets = {}
+    if processes == 1:
+        for state, genus in _walk(_root_state(max_genus), 0, max_genus):
+            _add_node(buckets, state, genus, width)
+    else:
+        tasks, internal = _split_tree(max_genus, processes * tasks_per_process)
+        for state, genus in internal:
+            _add_node(buckets, state, genus, width)
+        work = [(state, genus, max_genus, width) for state, genus in tasks]
+        for partial in parallel_worklist(_catalog_task, work, processes):
+            for key, data in partial.items():
+                bucket = buckets.get(key)
+                if bucket is None:
+                    buckets[key] = data
+                else:
+                    bucket += data
+
+    keys = sorted(buckets)
+    total = sum(len(data) for data in buckets.values()) // width
+    table_end = _HEADER.size + _BUCKET.size * len(keys)
+    records_offset = -(-table_end // 8) * 8
+    with open(path, 'wb') as handle:
+        handle.write(_HEADER.pack(_MAGIC, max_genus, width, total, len(keys), records_offset))
+        start = 0
+        for key in keys:
+            count = len(buckets[key]) // width
+            handle.write(_BUCKET.pack(*key, start, count))
+            start += count
+        handle.write(b'\x00' * (records_offset - table_end))
+        for key in keys:
+            data = buckets.pop(key)
+            records = sorted(
+                (data[i:i + width] for i in range(0, len(data), width)),
+                key=lambda record: int.from_bytes(record, 'little'),
+            )
+            handle.write(b''.join(records))
+    return total
+
+class SemigroupCatalog:
+    """
+    Read-only view of a catalog file written by build_catalog.
+
+    The file is memory-mapped and only the bucket table is parsed on opening;
+    records are decoded when they are accessed, so queries return lazily and
+    only touch the pages they read.
+
+    Usage:
+        with SemigroupCatalog('genus30.cat') as catalog:
+            for S in catalog.query(genus=20, multiplicity=5):
+                ...
+    """
+
+    def __init__(self, path):
+        self._file = open(path, 'rb')
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # An empty file cannot be mapped.
+            self._file.close()
+            raise ValueError(f"{path} is not a semigroup catalog.")
+        if len(self._map) < _HEADER.size or self._map[:len(_MAGIC)] != _MAGIC:
+            self.close()
+            raise ValueError(f"{path} is not a semigroup catalog.")
+        _, self._max_genus, self._width, self._length, n_buckets, self._records_offset = _HEADER.unpack_from(self._map, 0)
+        self._buckets = [
+            _BUCKET.unpack_from(self._map, _HEADER.size + i * _BUCKET.size)
+            for i in range(n_buckets)
+        ]
+        self._keys = [bucket[:3] for bucket in self._buckets]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        if not self._map.closed:
+            self._map.close()
+        self._file.close()
+
+    def __repr__(self):
+        return f"SemigroupCatalog(max_genus={self._max_genus}, semigroups={self._length})"
+
+    def __len__(self):
+        return self._length
+
+    @property
+    def max_genus(self):
+        return self._max_genus
+
+    @property
+    def width(self):
+        return self._width
+
+    @property
+    def records_offset(self):
+        return self._records_offset
+
+    def mask(self, i):
+        """
+        Return the gap bitmask of the i-th record.
+        """
+        if not 0 <= i < self._length:
+            raise IndexError("catalog index out of range")
+        start = self._records_offset + i * self._width
+        return int.from_bytes(self._map[start:start + self._width], 'little')
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += self._length
+        return NumericalSemigroup._from_mask(self.mask(i), validate=False)
+
+    def _ranges(self, genus, multiplicity, frobenius_number):
+        if genus is None:
+            buckets = self._buckets
+        else:
+            lo = bisect_left(self._keys, (genus,))
+            hi = bisect_left(self._keys, (genus + 1,))
+            if multiplicity is not None:
+                lo = bisect_left(self._keys, (genus, multiplicity), lo, hi)
+                hi = bisect_left(self._keys, (genus, multiplicity + 1), lo, hi)
+            buckets = self._buckets[lo:hi]
+        ranges = []
+        for g, m, f, start, count in buckets:
+            if multiplicity is not None and m != multiplicity:
+                continue
+            if frobenius_number is not None and f != frobenius_number:
+                continue
+            if ranges and ranges[-1][1] == start:
+                ranges[-1][1] = start + count
+            else:
+                ranges.append([start, start + count])
+        return ranges
+
+    def count(self, genus=None, multiplicity=None, frobenius_number=None):
+        """
+        Count the semigroups matching a query, from the bucket table alone.
+
+        Parameters:
+        genus (int or None): Restrict to this genus.
+        multiplicity (int or None): Restrict to this multiplicity.
+        frobenius_number (int or None): Restrict to this Frobenius number.
+
+        Returns:
+        int: The number of matching semigroups.
+        """
+        return sum(end - start for start, end in self._ranges(genus, multiplicity, frobenius_number))
+
+    def masks(self, genus=None, multiplicity=None, frobenius_number=None):
+        """
+        Iterate over the gap bitmasks matching a query.
+
+        Parameters are as in count.
+
+        Yields:
+        int: The gap bitmask of each matching semigroup.
+        """
+        width = self._width
+        for start, end in self._ranges(genus, multiplicity, frobenius_number):
+            offset = self._records_offset + start * width
+            for i in range(end - start):
+                yield int.from_bytes(self._map[offset + i * width:offset + (i + 1) * width], 'little')
+
+    def query(self, genus=None, multiplicity=None, frobenius_number=None):
+        """
+        Iterate over the numerical semigroups matching a query.
+
+        Records are grouped by genus, then multiplicity, then Frobenius number,
+        and sorted by gap bitmask inside each group.
+
+        Parameters are as in count.
+
+        Yields:
+        NumericalSemigroup: Each matching semigroup.
+        """
+        for mask in self.masks(genus, multiplicity, frobenius_number):
+            yield NumericalSemigroup._from_mask(mask, validate=False)
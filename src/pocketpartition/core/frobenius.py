@@ -0,0 +1,142 @@
+__all__ = ['WithFrobeniusNumber', 'IterWithFrobeniusNumber', 'CountWithFrobeniusNumber']
+
+from ..core.numerical_semigroup import NumericalSemigroup
+from ..utils.bitset import bits_to_list
+from ..utils.parallel import resolve_processes, parallel_worklist
+
+# Streaming traversal of the Frobenius tree.
+#
+# The numerical semigroups with Frobenius number F form a tree rooted at the
+# ordinary semigroup with gaps 1, ..., F: the parent of any other S is S minus
+# its multiplicity m, and the children of S are S with a special gap p < m,
+# p != F, added, so that p becomes the new multiplicity.
+#
+# A node is the pair (mask, candidates), where mask is the gap bitmask and
+# candidates has bit x set for the x < m with x + s a non-gap for every
+# nonzero element s <= F. These are the pseudo-Frobenius numbers below m (all
+# of them but F at the root), and the special gaps that give children are the
+# candidates x with 2x a non-gap. Adding p keeps a candidate x < p exactly
+# when x + p is not a gap, since the other elements are all larger than x and
+# p, so the child's candidates come from the parent's with two shifts and no
+# pass over the semigroup.
+
+def _root_state(F):
+    return ((1 << (F + 1)) - 2, (1 << F) - 2)
+
+def _special_gaps(state):
+    mask, candidates = state
+    return [p for p in bits_to_list(candidates) if not (mask >> (2 * p)) & 1]
+
+def _child_state(state, p):
+    mask, candidates = state
+    mask &= ~(1 << p)
+    below = candidates & ((1 << p) - 1)
+    return (mask, below & ~(mask >> p))
+
+def _walk(state, budget=None, leftovers=None):
+    """
+    Depth-first pre-order walk of the subtree below a node.
+
+    The path to the current node has at most F nodes, so memory stays
+    O(F^2) bits however many semigroups are visited. If a budget is given, the
+    walk stops after that many nodes and appends the roots of the branches it
+    did not enter to leftovers.
+
+    Yields:
+    tuple: The state of every node of the subtree.
+    """
+    yield state
+    stack = [(state, iter(_special_gaps(state)))]
+    visited = 1
+    while stack:
+        if budget is not None and visited >= budget:
+            for parent, special_gaps in stack:
+                leftovers.extend(_child_state(parent, p) for p in special_gaps)
+            return
+        parent, special_gaps = stack[-1]
+        p = next(special_gaps, None)
+        if p is None:
+            stack.pop()
+            continue
+        child = _child_state(parent, p)
+        yield child
+        visited += 1
+        if child[1]:
+            stack.append((child, iter(_special_gaps(child))))
+
+def _count_subtree(state, budget=None, leftovers=None):
+    return sum(1 for _ in _walk(state, budget, leftovers))
+
+def _to_semigroup(state):
+    return NumericalSemigroup._from_mask(state[0], validate=False)
+
+def _nodes_with_frobenius_number(F):
+    if F == -1:
+        return [(0, 0)]
+    if F < 1:
+        return []
+    return _walk(_root_state(F))
+
+def IterWithFrobeniusNumber(F):
+    """
+    Iterate over the numerical semigroups with Frobenius number F without storing them.
+
+    The Frobenius tree is walked depth first on gap bitmasks, and a
+    NumericalSemigroup is only built for the nodes that are yielded.
+
+    Parameters:
+    F (int): The Frobenius number, -1 for the semigroup of all nonnegative integers.
+
+    Yields:
+    NumericalSemigroup: Each numerical semigroup with Frobenius number F, in depth-first order.
+    """
+    for state in _nodes_with_frobenius_number(F):
+        yield _to_semigroup(state)
+
+def WithFrobeniusNumber(F):
+    """
+    List the numerical semigroups with Frobenius number F.
+
+    Parameters:
+    F (int): The Frobenius number.
+
+    Returns:
+    list of NumericalSemigroup: The numerical semigroups with Frobenius number F.
+    """
+    return list(IterWithFrobeniusNumber(F))
+
+_TASK_BUDGET = 20000
+
+def _count_task(state):
+    leftovers = []
+    return _count_subtree(state, _TASK_BUDGET, leftovers), leftovers
+
+def CountWithFrobeniusNumber(F, processes=1, tasks_per_process=16):
+    """
+    Count the numerical semigroups with Frobenius number F.
+
+    With more than one process the top of the tree is expanded breadth first
+    until there are enough subtrees, which are counted in a process pool. As
+    in CountsWithMaxGenus, a worker stops after a fixed node budget and sends
+    back the branches it did not enter.
+
+    Parameters:
+    F (int): The Frobenius number.
+    processes (int or None): Number of worker processes; None uses every CPU.
+    tasks_per_process (int): How many subtrees to aim for per worker, for load balancing.
+
+    Returns:
+    int: The number of numerical semigroups with Frobenius number F.
+    """
+    if F < 1:
+        return 1 if F == -1 else 0
+    processes = resolve_processes(processes)
+    if processes == 1:
+        return _count_subtree(_root_state(F))
+
+    count = 0
+    frontier = [_root_state(F)]
+    while frontier and len(frontier) < processes * tasks_per_process:
+        count += len(frontier)
+        frontier = [_child_state(state, p) for state in frontier for p in _special_gaps(state)]
+    return count + sum(parallel_worklist(_count_task, frontier, processes))
@@ -1,7 +1,10 @@
-__all__ = ['WithGenus', 'WithMaxGenus']
+__all__ = ['WithGenus', 'WithMaxGenus', 'IterWithGenus', 'IterWithMaxGenus', 'CountWithGenus', 'CountsWithMaxGenus', 'MapWithGenus']
 
+import heapq
+from math import comb
 from collections import deque
 from ..core.numerical_semigroup import NumericalSemigroup
+from ..utils.parallel import resolve_processes, parallel_worklist
 
 def bfs_to_depth(root, depth):
     if depth < 0:
@@ -42,4 +45,259 @@ def WithGenus(g):
     return bfs_to_depth(NumericalSemigroup(generators={1}), g)
 
 def WithMaxGenus(g):
-    return bfs_up_to_depth(NumericalSemigroup(generators={1}), g)
\ No newline at end of file
+    return bfs_up_to_depth(NumericalSemigroup(generators={1}), g)
+
+# Streaming traversal of the semigroup tree.
+#
+# A node is the tuple (dec, conductor, multiplicity, mask), where dec[y] is the
+# number of pairs (a, b) with a <= b, a + b = y and a, b in S (Fromentin-Hivert
+# decomposition numbers) and mask is the gap bitmask. The effective generators
+# are the x in [conductor, conductor + multiplicity) with dec[x] == 1, and
+# removing one of them only updates dec above x. Every node up to genus g has
+# its effective generators below 3g, so dec is sized once from the genus bound.
+
+def _root_state(max_genus):
+    size = 3 * max_genus + 3
+    return ([y // 2 + 1 for y in range(size)], 1, 1, 0)
+
+def _effective_generators(state):
+    dec, conductor, multiplicity, _ = state
+    return [x for x in range(conductor, conductor + multiplicity) if dec[x] == 1]
+
+def _child_state(state, x):
+    dec, conductor, multiplicity, mask = state
+    child_dec = dec[:x] + [dec[y] - (dec[y - x] > 0) for y in range(x, len(dec))]
+    if x == multiplicity:
+        multiplicity += 1
+    return (child_dec, x + 1, multiplicity, mask | (1 << x))
+
+def _walk(state, genus, max_genus, budget=None, leftovers=None):
+    """
+    Depth-first pre-order walk of the subtree below a node, down to max_genus.
+
+    Only the path to the current node is kept, so memory is O(max_genus^2)
+    regardless of how many nodes are visited. If a budget is given, the walk
+    stops after that many nodes and appends the roots of the branches it did
+    not enter to leftovers, shallowest (largest) first.
+
+    Yields:
+    tuple: (state, genus) for every node of the subtree.
+    """
+    yield state, genus
+    if genus >= max_genus:
+        return
+    stack = [(state, iter(_effective_generators(state)))]
+    visited = 1
+    while stack:
+        if budget is not None and visited >= budget:
+            for depth, (parent, generators) in enumerate(stack):
+                leftovers.extend((_child_state(parent, x), genus + depth + 1) for x in generators)
+            return
+        parent, generators = stack[-1]
+        x = next(generators, None)
+        if x is None:
+            stack.pop()
+            continue
+        child = _child_state(parent, x)
+        child_genus = genus + len(stack)
+        yield child, child_genus
+        visited += 1
+        if child_genus < max_genus:
+            stack.append((child, iter(_effective_generators(child))))
+
+def _count_subtree(state, genus, max_genus, counts, budget=None, leftovers=None):
+    """
+    Add the number of nodes of each genus in the subtree below a node to counts.
+
+    Nodes of the last genus are counted from their parents' effective
+    generators without being built. budget and leftovers are passed to _walk.
+    """
+    if genus >= max_genus:
+        counts[genus] += 1
+        return counts
+    for node, node_genus in _walk(state, genus, max_genus - 1, budget, leftovers):
+        counts[node_genus] += 1
+        if node_genus == max_genus - 1:
+            counts[max_genus] += len(_effective_generators(node))
+    return counts
+
+def _to_semigroup(state):
+    return NumericalSemigroup._from_mask(state[3], validate=False)
+
+def IterWithGenus(g):
+    """
+    Iterate over the numerical semigroups of genus g without storing them.
+
+    The semigroup tree is walked depth first on decomposition-number arrays,
+    and a NumericalSemigroup is only built for the nodes that are yielded.
+
+    Parameters:
+    g (int): The genus.
+
+    Yields:
+    NumericalSemigroup: Each numerical semigroup of genus g.
+    """
+    if g < 0:
+        return
+    for state, genus in _walk(_root_state(g), 0, g):
+        if genus == g:
+            yield _to_semigroup(state)
+
+def IterWithMaxGenus(g):
+    """
+    Iterate over the numerical semigroups of genus at most g without storing them.
+
+    Parameters:
+    g (int): The maximum genus.
+
+    Yields:
+    NumericalSemigroup: Each numerical semigroup of genus at most g, in depth-first order.
+    """
+    if g < 0:
+        return
+    for state, _ in _walk(_root_state(g), 0, g):
+        yield _to_semigroup(state)
+
+# Parallel sharding.
+#
+# The tree is first cut into subtrees by repeatedly expanding the frontier node
+# with the largest estimated subtree. A node with k effective generators and d
+# levels left is estimated at sum(C(k, i), i <= d), the subtree size if its
+# children had k-1, k-2, ..., 0 effective generators; on the real tree this
+# tracks subtree sizes closely in log scale. The subtrees are handed to the
+# pool one at a time, largest first. Since the estimate can still be far off,
+# a worker also stops after a fixed node budget and sends back the branches it
+# did not enter, which go to the front of the queue to be picked up by idle
+# workers.
+
+_TASK_BUDGET = 20000
+
+def _split_tree(max_genus, min_tasks):
+    """
+    Cut the tree into subtrees rooted at the nodes of a frontier.
+
+    Parameters:
+    max_genus (int): The genus bound of the enumeration.
+    min_tasks (int): The number of subtrees to aim for.
+
+    Returns:
+    tuple: (tasks, internal) where tasks is a list of (state, genus) subtree
+    roots, largest estimate first, and internal is a list of (state, genus)
+    for the nodes above the frontier.
+    """
+    def estimate(state, genus):
+        k = len(_effective_generators(state))
+        depth = max_genus - genus
+        return sum(comb(k, i) for i in range(min(k, depth) + 1))
+
+    root = _root_state(max_genus)
+    heap = [(-estimate(root, 0), 0, root, 0)]
+    tasks = []
+    internal = []
+    counter = 1
+    while heap and len(heap) + len(tasks) < min_tasks:
+        _, _, state, genus = heapq.heappop(heap)
+        if genus >= max_genus - 1:
+            tasks.append((state, genus))
+            continue
+        internal.append((state, genus))
+        for x in _effective_generators(state):
+            child = _child_state(state, x)
+            heapq.heappush(heap, (-estimate(child, genus + 1), counter, child, genus + 1))
+            counter += 1
+    tasks[:0] = [(state, genus) for _, _, state, genus in sorted(heap)]
+    return tasks, internal
+
+def _count_task(task):
+    state, genus, max_genus = task
+    leftovers = []
+    counts = _count_subtree(state, genus, max_genus, [0] * (max_genus + 1), _TASK_BUDGET, leftovers)
+    return counts, [(child, child_genus, max_genus) for child, child_genus in leftovers]
+
+def _map_task(task):
+    state, genus, max_genus, func = task
+    leftovers = []
+    results = [func(_to_semigroup(node))
+               for node, node_genus in _walk(state, genus, max_genus, _TASK_BUDGET, leftovers)
+               if node_genus == max_genus]
+    return results, [(child, child_genus, max_genus, func) for child, child_genus in leftovers]
+
+def CountsWithMaxGenus(g, processes=1, tasks_per_process=16):
+    """
+    Count the numerical semigroups of each genus up to g.
+
+    With more than one process the tree is split into subtrees that are
+    counted in a process pool and the per-genus counts are summed.
+
+    Parameters:
+    g (int): The maximum genus.
+    processes (int or None): Number of worker processes; None uses every CPU.
+    tasks_per_process (int): How many subtrees to aim for per worker, for load balancing.
+
+    Returns:
+    list of int: The list [n_0, n_1, ..., n_g], where n_i is the number of numerical semigroups of genus i.
+    """
+    if g < 0:
+        return []
+    processes = resolve_processes(processes)
+    if processes == 1:
+        return _count_subtree(_root_state(g), 0, g, [0] * (g + 1))
+
+    tasks, internal = _split_tree(g, processes * tasks_per_process)
+    counts = [0] * (g + 1)
+    for _, genus in internal:
+        counts[genus] += 1
+    work = [(state, genus, g) for state, genus in tasks]
+    for subtree_counts in parallel_worklist(_count_task, work, processes):
+        for genus, count in enumerate(subtree_counts):
+            counts[genus] += count
+    return counts
+
+def CountWithGenus(g, processes=1):
+    """
+    Count the numerical semigroups of genus g.
+
+    Parameters:
+    g (int): The genus.
+    processes (int or None): Number of worker processes; None uses every CPU.
+
+    Returns:
+    int: The number of numerical semigroups of genus g.
+    """
+    if g < 0:
+        return 0
+    return CountsWithMaxGenus(g, processes)[g]
+
+def MapWithGenus(g, func, processes=1, tasks_per_process=16):
+    """
+    Apply a function to every numerical semigroup of genus g, optionally in a process pool.
+
+    With the default single process everything runs in the calling process,
+    so func need not be picklable. With more processes each worker walks
+    whole subtrees and only sends back the values of func, so the semigroups
+    themselves never cross process boundaries. Results come back grouped by
+    subtree, in no particular order.
+
+    Parameters:
+    g (int): The genus.
+    func (callable): A function taking a NumericalSemigroup, picklable when processes is not 1.
+    processes (int or None): Number of worker processes; None uses every CPU.
+    tasks_per_process (int): How many subtrees to aim for per worker, for load balancing.
+
+    Yields:
+    The value of func on each numerical semigroup of genus g.
+    """
+    if g < 0:
+        return
+    processes = resolve_processes(processes)
+    if processes == 1:
+        for state, genus in _walk(_root_state(g), 0, g):
+            if genus == g:
+                yield func(_to_semigroup(state))
+        return
+
+    # The nodes above the frontier all have genus below g - 1.
+    tasks, _ = _split_tree(g, processes * tasks_per_process)
+    work = [(state, genus, g, func) for state, genus in tasks]
+    for results in parallel_worklist(_map_task, work, processes):
+        yield from results
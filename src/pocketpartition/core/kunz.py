@@ -1,42 +1,256 @@
-__all__ = ['kunz_tuple']
+__all__ = ['kunz_tuple', 'KunzPolyhedron']
 
+from array import array
 from .numerical_semigroup import NumericalSemigroup
 
 def kunz_tuple(S:NumericalSemigroup):
-  m = S.multiplicity()
-  A = S.apery_set(m)
-  kunz_tup = list()
-  for res in range(1, m):
-    for n in A:
-      if n % m == res:
-        kunz_tup.append(n // m)
-  return tuple(kunz_tup)
+  A = S._multiplicity_apery_set()
+  m = len(A)
+  return tuple(w // m for w in A[1:])
 
 
+# Typecodes of array.array for the lane widths used to pack a column of points.
+_LANES = ((16, 'H'), (32, 'I'), (64, 'Q'))
+
 class KunzPolyhedron:
     def __init__(self, m: int):
         if m <= 0:
             raise ValueError("m must be a positive integer.")
         self.m = m
         self.corner = tuple([i/m for i in range(m)])
+        self._inequalities_by_width = {}
+
+    def _inequalities(self, width):
+        """
+        List the inequalities for points with a given number of coordinates.
+
+        Every inequality has the form p[i] + p[j] + c >= p[k]. For points
+        without k_0 the indices are shifted, and the inequalities that hold for
+        every nonnegative point once k_0 = 0 are dropped.
+
+        Returns:
+        list of tuple: The quadruples (i, j, k, c).
+        """
+        inequalities = self._inequalities_by_width.get(width)
+        if inequalities is None:
+            m = self.m
+            shift = m - width
+            inequalities = []
+            for i in range(m):
+                for j in range(i, m):
+                    k, c = (i + j, 0) if i + j < m else (i + j - m, 1)
+                    if shift and (i == 0 or k == 0):
+                        continue
+                    inequalities.append((i - shift, j - shift, k - shift, c))
+            self._inequalities_by_width[width] = inequalities
+        return inequalities
+
+    def _full_point(self, p):
+        # Points may be given as Kunz tuples (k_1, ..., k_{m-1}) or with k_0 = 0 prepended.
+        if len(p) == self.m - 1:
+            return (0,) + tuple(p)
+        if len(p) != self.m:
+            raise ValueError(f"A point of the Kunz polyhedron must have {self.m - 1} or {self.m} coordinates.")
+        return p
 
     def is_point(self, p: tuple[int]) -> bool:
-        # Check if all elements in p are non-negative
+        """
+        Check whether a tuple is a point of the Kunz polyhedron.
+
+        The point satisfies p_i + p_j >= p_{i+j} for i + j < m and
+        p_i + p_j + 1 >= p_{i+j-m} for i + j >= m, with nonnegative coordinates.
+
+        Parameters:
+        p (tuple of int): The point, as a Kunz tuple or with k_0 = 0 prepended.
+
+        Returns:
+        bool: True if p is a point of the polyhedron.
+        """
+        p = tuple(p)
+        self._full_point(p)
         if any(x < 0 for x in p):
-            return False 
-        valid_point = True
-        # Iterate over all pairs (i, j) where i <= j
-        for i in range(len(p)):
-            for j in range(i, len(p)):
-                # Check conditions based on i + j
-                if i + j < self.m:
-                    if p[i] + p[j] >= p[i + j]:
-                        valid_point = valid_point and True
-                    else:
-                        return False
-                elif i + j >= self.m:
-                    if p[i] + p[j] + 1 >= p[i + j - self.m]:
-                        valid_point = valid_point and True
-                    else:
-                        return False        
-        return valid_point
+            return False
+        return all(p[i] + p[j] + c >= p[k] for i, j, k, c in self._inequalities(len(p)))
+
+    def is_points(self, points):
+        """
+        Check many tuples at once for membership in the Kunz polyhedron.
+
+        Each coordinate column is packed into one integer with a fixed-width
+        lane per point and a guard bit at the top of each lane. An inequality
+        p[i] + p[j] + c >= p[k] then holds in a lane exactly when the guard bit
+        survives (col_i + col_j + c + guard) - col_k, so every inequality is
+        checked for all points with a few big-integer operations. Converting
+        the rows still costs a pass per row, so on 20000 points the batch is
+        about 2x faster than calling is_point in a loop for m = 4 and about 5x
+        for m = 16 (the kunz_is_points benchmark), and less on small batches.
+        Any 2-D sequence of rows works, such as a list of tuples or a 2-D
+        NumPy array.
+
+        Parameters:
+        points (iterable): The rows, all Kunz tuples or all with k_0 = 0 prepended.
+
+        Returns:
+        list of bool: Whether each row is a point of the polyhedron.
+
+        Raises:
+        ValueError: If a row has the wrong number of coordinates or the rows have different lengths.
+        """
+        rows = [tuple(row) for row in points]
+        if not rows:
+            return []
+        width = len(rows[0])
+        self._full_point(rows[0])
+        if any(len(row) != width for row in rows):
+            raise ValueError("All points must have the same number of coordinates.")
+        if not width:
+            return [True] * len(rows)
+
+        nonnegative = [low >= 0 for low in map(min, rows)]
+        if not all(nonnegative):
+            zero = (0,) * width
+            rows = [row if ok else zero for row, ok in zip(rows, nonnegative)]
+        columns = list(zip(*rows))
+        largest = max(map(max, columns))
+        lane = next((lane for lane in _LANES if 2 * largest + 1 < 1 << (lane[0] - 1)), None)
+        if lane is None:
+            return [ok and self.is_point(row) for row, ok in zip(rows, nonnegative)]
+
+        bits, typecode = lane
+        n = len(rows)
+
+        def pack(values):
+            return int.from_bytes(array(typecode, values).tobytes(), 'little')
+
+        packed = [pack(column) for column in columns]
+        ones = pack([1] * n)
+        guard = ones << (bits - 1)
+        valid = guard
+        for i, j, k, c in self._inequalities(width):
+            valid &= (packed[i] + packed[j] + (ones if c else 0) + guard) - packed[k]
+        lanes = array(typecode)
+        lanes.frombytes(valid.to_bytes(n * bits // 8, 'little'))
+        return [ok and bool(value) for value, ok in zip(lanes, nonnegative)]
+
+    def _integer_points(self, genus, depth):
+        # Coordinates are chosen in the order k_1, k_2, ..., k_{m-1}. When k_t
+        # is chosen, every inequality among k_1, ..., k_t becomes a bound on it:
+        # k_t <= k_i + k_{t-i} from above, and k_t >= k_r - k_j - 1 from the
+        # pairs (j, t) with j <= t wrapping around to r = t + j - m >= 1. With a
+        # genus, the coordinates left must still sum to it with each at least 1.
+        m = self.m
+        k = [0] * m
+
+        def extend(t, total):
+            if t == m:
+                yield tuple(k[1:])
+                return
+            hi = min((k[i] + k[t - i] for i in range(1, t // 2 + 1)), default=None)
+            if depth is not None:
+                hi = depth if hi is None else min(hi, depth)
+            lo = 1
+            for j in range(max(1, m - t + 1), t):
+                lo = max(lo, k[t + j - m] - k[j] - 1)
+            if 2 * t > m:
+                lo = max(lo, k[2 * t - m] // 2)
+            if genus is not None:
+                rest = m - 1 - t
+                hi = genus - total - rest if hi is None else min(hi, genus - total - rest)
+                if not rest:
+                    lo = max(lo, genus - total)
+            for value in range(lo, hi + 1):
+                k[t] = value
+                yield from extend(t + 1, total + value)
+
+        return extend(1, 0)
+
+    def integer_points(self, genus=None, depth=None):
+        """
+        Iterate over the Kunz tuples of the numerical semigroups with multiplicity m.
+
+        These are the integer points of the polyhedron with every coordinate at
+        least 1, for which the genus is the sum of the coordinates and the depth
+        the largest one. The tuples are found by a depth-first search over the
+        m - 1 coordinates that turns the inequalities on the coordinates chosen
+        so far into bounds on the next one, so no tuple is built before it is
+        known to be a point.
+
+        Parameters:
+        genus (int or None): If given, only the points whose coordinates sum to genus.
+        depth (int or None): If given, only the points with every coordinate at most depth.
+
+        Yields:
+        tuple of int: Each Kunz tuple (k_1, ..., k_{m-1}), in lexicographic order.
+
+        Raises:
+        ValueError: If neither genus nor depth is given, as there are infinitely many points.
+        """
+        if genus is None and depth is None:
+            raise ValueError("A genus or a depth bound is needed to enumerate the integer points.")
+        if self.m == 1:
+            if not genus:
+                yield ()
+            return
+        yield from self._integer_points(genus, depth)
+
+    def count_integer_points(self, genus=None, depth=None):
+        """
+        Count the numerical semigroups with multiplicity m by genus or depth, without the semigroup tree.
+
+        Parameters:
+        genus (int or None): If given, only the semigroups of this genus.
+        depth (int or None): If given, only the semigroups of depth at most depth.
+
+        Returns:
+        int: The number of Kunz tuples yielded by integer_points.
+        """
+        return sum(1 for _ in self.integer_points(genus, depth))
+
+    def semigroups(self, genus=None, depth=None):
+        """
+        Iterate over the numerical semigroups with multiplicity m by genus or depth.
+
+        Each semigroup is built from its Apéry set only when it is reached, and
+        keeps that Apéry set for its later invariants.
+
+        Parameters:
+        genus (int or None): If given, only the semigroups of this genus.
+        depth (int or None): If given, only the semigroups of depth at most depth.
+
+        Yields:
+        NumericalSemigroup: Each numerical semigroup given by integer_points.
+        """
+        m = self.m
+        for p in self.integer_points(genus, depth):
+            yield NumericalSemigroup._from_apery_set([0] + [k * m + i for i, k in enumerate(p, start=1)])
+
+    def point(self, S: NumericalSemigroup) -> tuple[int]:
+        """
+        The point of the polyhedron given by a numerical semigroup of multiplicity m.
+
+        Parameters:
+        S (NumericalSemigroup): A numerical semigroup with multiplicity m.
+
+        Returns:
+        tuple of int: The Kunz tuple of S.
+        """
+        if S.multiplicity() != self.m:
+            raise ValueError(f"The numerical semigroup must have multiplicity {self.m}.")
+        return kunz_tuple(S)
+
+    def semigroup(self, p: tuple[int]) -> NumericalSemigroup:
+        """
+        The numerical semigroup given by an integer point of the polyhedron.
+
+        Points with a zero coordinate give semigroups of multiplicity below m.
+
+        Parameters:
+        p (tuple of int): The point, as a Kunz tuple or with k_0 = 0 prepended.
+
+        Returns:
+        NumericalSemigroup: The numerical semigroup whose Apéry set of m is (k_i * m + i).
+        """
+        p = self._full_point(p)
+        if p[0] != 0:
+            raise ValueError("The coordinate k_0 must be 0.")
+        return NumericalSemigroup.from_kunz_tuple(tuple(p[1:]))
@@ -13,16 +13,18 @@ from .poset import Poset
 from typing import Union
 
 def get_atom_monoid(T:Union[NumericalSet, NumericalSemigroup, Partition]) -> NumericalSemigroup:
+    if isinstance(T, NumericalSet):
+        return NumericalSemigroup._from_mask(T._atom_monoid_mask(), validate=False)
     gapset = T.atom_monoid_gaps()
     return NumericalSemigroup(gaps=gapset)
 
 def get_partition(T:Union[NumericalSet, NumericalSemigroup]) -> Partition:
-    return Partition(T.partition())
+    return Partition.from_numerical_set(T)
 
 def get_gap_poset(S:Union[NumericalSemigroup]) -> Poset:
     elements, relations = S.gap_poset()
-    return Poset(elements, relations)
+    return Poset(elements, relations, validate=False)
 
 def get_void_poset(S:Union[NumericalSemigroup]) -> Poset:
     elements, relations = S.void_poset()
-    return Poset(elements, relations)
\ No newline at end of file
+    return Poset(elements, relations, validate=False)
\ No newline at end of file
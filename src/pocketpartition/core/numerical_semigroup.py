@@ -1,26 +1,56 @@
 __all__ = ['NumericalSemigroup']
 
 from .numerical_set import NumericalSet
-from collections import Counter
-from ..utils.helpers import remove_sum_of_two_elements
-from functools import lru_cache
+from .apery import (
+    apery_set_from_generators,
+    apery_set_from_gaps_mask,
+    gaps_mask_from_apery_set,
+    check_apery_set,
+    minimal_generators_from_apery_set,
+    pseudofrobenius_numbers_from_apery_set,
+)
+from ..utils.cache import InternPool, cached_method, seed_method_cache
+from ..utils.bitset import BitSetView, mask_from_iterable, bits_to_list, popcount
 from math import ceil
 
+def _remove_generator(mask, generators, x):
+    """
+    Remove a minimal generator from a semigroup given as a gap mask and its minimal generators.
+
+    The minimal generators of S minus {x} are those of S other than x, plus
+    the candidates x + a (a a generator other than x), 2x and 3x that are not
+    a sum of two nonzero elements, each tested against the k generators in
+    O(k). This works on plain ints and lists and builds no NumericalSemigroup,
+    so random walks and tree descents can carry (mask, generators) from step
+    to step.
+
+    Parameters:
+    mask (int): The gap bitmask of S.
+    generators (list of int): The minimal generators of S, in increasing order.
+    x (int): The minimal generator to remove.
+
+    Returns:
+    tuple: (mask, generators) for S minus {x}, with the generators in increasing order.
+    """
+    mask |= 1 << x
+    rest = [a for a in generators if a != x]
+    new = []
+    # y is a sum of two nonzero elements exactly when y - g is a nonzero element
+    # for some minimal generator g < y of S minus {x}. Candidates are taken in
+    # increasing order, so the new generators below y are already known and
+    # each test costs O(k) bit lookups for k generators.
+    for y in sorted({x + a for a in rest} | {2 * x, 3 * x}):
+        if not any(g < y and not (mask >> (y - g)) & 1 for g in rest + new):
+            new.append(y)
+    return mask, sorted(rest + new)
+
 class NumericalSemigroup(NumericalSet):
-    _instances = {}
+    _instances = InternPool('NumericalSemigroup')
 
     def __new__(cls, gaps=None, generators=None):
         if generators is not None:
-            gaps_frozenset = frozenset(cls._compute_gaps_from_generators(generators))
-        else:
-            gaps_frozenset = frozenset(gaps)
-        
-        if gaps_frozenset in cls._instances:
-            return cls._instances[gaps_frozenset]
-        
-        instance = super(NumericalSemigroup, cls).__new__(cls, gaps=gaps_frozenset)
-        cls._instances[gaps_frozenset] = instance
-        return instance
+            return cls._from_apery_set(apery_set_from_generators(generators))
+        return cls._from_mask(mask_from_iterable(gaps))
     
     def __init__(self, gaps=None, generators=None):
         """
@@ -33,19 +63,104 @@ class NumericalSemigroup(NumericalSet):
         Raises:
         ValueError: If the atom monoid of the numerical set is not equal to the set itself.
         """
-        if generators is not None:
-            self._gaps = self._compute_gaps_from_generators(generators)
-        else:
-            super().__init__(gaps)
-            gaps = self._gaps
-            if self.atom_monoid_gaps() != gaps:
-                raise ValueError("The provided gaps do not form a numerical semigroup because the atom monoid is not equal to the set itself.")
-        
-        self._frobenius_number = max(self._gaps) if self._gaps else -1
+
+    def _validate(self):
+        """
+        Check that the gaps are closed under addition of elements.
+
+        The gap set belongs to a numerical semigroup when 0 is not a gap and no
+        sum s + t of elements lands on a gap. Only s <= F/2 needs checking, and
+        each s is tested against all t at once with one shifted AND.
+
+        Raises:
+        ValueError: If the atom monoid of the numerical set is not equal to the set itself.
+        """
+        mask = self._mask
+        frobenius_number = self.frobenius_number
+        elements = ~mask & ((1 << (frobenius_number + 1)) - 1)
+        half = elements & ((1 << (frobenius_number // 2 + 1)) - 1)
+        if mask & 1 or any((elements << s) & mask for s in bits_to_list(half & ~1)):
+            raise ValueError("The provided gaps do not form a numerical semigroup because the atom monoid is not equal to the set itself.")
+
+    @classmethod
+    def _from_apery_set(cls, apery):
+        """
+        Return the numerical semigroup with a given (already checked) Apéry set.
+
+        If the Apéry set is taken with respect to the multiplicity it is kept on
+        the instance, so invariants derived from it need no pass over the gaps.
+
+        Parameters:
+        apery (list of int): The Apéry set, indexed by residue.
+
+        Returns:
+        NumericalSemigroup: The numerical semigroup.
+        """
+        instance = cls._from_mask(gaps_mask_from_apery_set(apery), validate=False)
+        if '_apery' not in instance.__dict__ and instance.multiplicity() == len(apery):
+            instance._apery = tuple(apery)
+        return instance
+
+    @classmethod
+    def from_apery_set(cls, apery):
+        """
+        Construct a numerical semigroup from its Apéry set with respect to one of its elements.
+
+        Parameters:
+        apery (iterable of int): The Apéry set with respect to m, one element per
+            residue modulo m, where m is the number of elements.
+
+        Returns:
+        NumericalSemigroup: The numerical semigroup with this Apéry set.
+
+        Raises:
+        ValueError: If the elements do not form the Apéry set of a numerical semigroup.
+        """
+        elements = list(apery)
+        m = len(elements)
+        ordered = [None] * m
+        for w in elements:
+            if not isinstance(w, int) or ordered[w % m] is not None:
+                raise ValueError("The Apéry set must contain exactly one integer in each residue class.")
+            ordered[w % m] = w
+        check_apery_set(ordered)
+        return cls._from_apery_set(ordered)
+
+    @classmethod
+    def from_kunz_tuple(cls, kunz):
+        """
+        Construct a numerical semigroup from its Kunz coordinates.
+
+        Parameters:
+        kunz (tuple of int): The coordinates (k_1, ..., k_{m-1}), where the Apéry
+            set element congruent to i modulo m is k_i * m + i.
+
+        Returns:
+        NumericalSemigroup: The numerical semigroup with these Kunz coordinates.
+
+        Raises:
+        ValueError: If the tuple is not a point of the Kunz polyhedron.
+        """
+        m = len(kunz) + 1
+        apery = [0] + [k * m + i for i, k in enumerate(kunz, start=1)]
+        check_apery_set(apery)
+        return cls._from_apery_set(apery)
+
+    def _multiplicity_apery_set(self):
+        """
+        Apéry set of the multiplicity as a tuple indexed by residue, computed once per instance.
+
+        Returns:
+        tuple of int: The Apéry set, where entry r is the smallest element congruent to r modulo m.
+        """
+        apery = self.__dict__.get('_apery')
+        if apery is None:
+            apery = self._apery = tuple(apery_set_from_gaps_mask(self._mask, self.multiplicity()))
+        return apery
 
     @property
     def genus(self):
-        return len(self.gaps)
+        return popcount(self._mask)
     
     def __str__(self):
         return f"NumericalSemigroup(genus={self.genus})"
@@ -58,30 +173,19 @@ class NumericalSemigroup(NumericalSet):
         """
         Compute the gaps of the numerical semigroup given its generators.
 
+        The Apéry set of the smallest generator is computed first and the gaps
+        are read off from it, so the work is O(m * k) for m the smallest of the
+        k generators rather than a sieve up to their product.
+
         Parameters:
         generators (list of int): The generators of the numerical semigroup.
 
         Returns:
         set of int: The gaps of the numerical semigroup.
         """
-        # Compute the elements of the semigroup up to twice the maximum generator
-        semigroup = set()
-        reduced_gens = remove_sum_of_two_elements(set(generators))
-        product_of_gens = 1
-        for gen in reduced_gens:
-            product_of_gens *= gen
-        bound = product_of_gens
-        for i in range(bound):
-            for g in reduced_gens:
-                if i - g in semigroup or i - g == 0:
-                    semigroup.add(i)
-                    break
-
-        # Identify the gaps, excluding 0
-        gaps = set(range(1, bound)) - semigroup
-        return gaps
-
-    @lru_cache(maxsize=None)
+        return BitSetView(gaps_mask_from_apery_set(apery_set_from_generators(generators)))
+
+    @cached_method
     def apery_set(self, n):
         """
         Compute the Apéry set of the numerical set with respect to n.
@@ -92,23 +196,19 @@ class NumericalSemigroup(NumericalSet):
         Returns:
         set of int: The Apéry set with respect to n.
         """
-        gaps = self.gaps.copy()
         if not isinstance(n, int) or n < 0:
             raise ValueError("n must be a nonnegative integer")
         
-        if n in self.atom_monoid_gaps():
+        if n in self.gaps:
             raise ValueError("n must not be in the gaps of the atom monoid")
 
-        apery_set = set()
-        for k in range(n):
-            x = k
-            while x in gaps:
-                x += n
-            apery_set.add(x)
-
-        return apery_set
+        if n == 0:
+            return set()
+        if n == self.multiplicity():
+            return set(self._multiplicity_apery_set())
+        return set(apery_set_from_gaps_mask(self._mask, n))
 
-    @lru_cache(maxsize=None)
+    @cached_method
     def minimal_generating_set(self):
         """
         Compute the minimal generating set of the numerical semigroup.
@@ -116,57 +216,10 @@ class NumericalSemigroup(NumericalSet):
         Returns:
         list of int: The minimal generating set of the numerical semigroup.
         
-        The algorithm used here is based on the method described by Rosales and Vasco in their works on numerical semigroups.
-        """
-        generators = self._compute_generators_from_gaps()
-        generators.sort()
-        multiplicity = self.multiplicity()
-        
-        if multiplicity == 1:
-            return [1]
-        elif multiplicity == 2:
-            odd_gen = next(g for g in generators if g % 2 == 1)
-            return [2, odd_gen]
-
-        # Initial reduction based on congruence modulo multiplicity
-        aux = [multiplicity]
-        for i in range(1, multiplicity):
-            g = next((g for g in generators if g % multiplicity == i), None)
-            if g is not None:
-                aux.append(g)
-
-        aux.sort()
-        gen = set(aux)
-        
-        min_gens = list(remove_sum_of_two_elements(gen))
-        min_gens.sort()
-        return min_gens
-
-    def _compute_generators_from_gaps(self):
-        """
-        Compute the generators of the numerical semigroup given its gaps.
-
-        Returns:
-        list of int: The generators of the numerical semigroup.
+        The multiplicity m is a minimal generator, and so is every nonzero element
+        of the Apéry set of m that is not the sum of two others (Rosales and García-Sánchez).
         """
-        gaps = self.gaps.copy()
-        multiplicity = self.multiplicity()
-        generators = [multiplicity]
-        frobenius_number = max(gaps) if gaps else 0
-        equiv_classes = [0]
-
-        for i in range(multiplicity + 1, frobenius_number):
-            if i not in gaps and i % multiplicity not in equiv_classes:
-                generators.append(i)
-                equiv_classes.append(i % multiplicity)
-        
-        for i in range(frobenius_number + 1, frobenius_number + 1 + multiplicity):
-            if i % multiplicity not in equiv_classes:
-                generators.append(i)
-            if len(equiv_classes) == multiplicity:
-                break
-
-        return generators
+        return minimal_generators_from_apery_set(self._multiplicity_apery_set())
     
     def void(self):
         """
@@ -203,7 +256,7 @@ class NumericalSemigroup(NumericalSet):
         void_relations = [(y, x) for x in void for y in void if x <= y and (y - x) not in gaps]
         return (list(void), void_relations)
 
-    @lru_cache(maxsize=None)
+    @cached_method
     def effective_weight(self):
             """
             Calculates the effective weight of the numerical partition.
@@ -213,20 +266,16 @@ class NumericalSemigroup(NumericalSet):
             Returns:
                 int: The effective weight of the numerical partition.
             """
-            gaps = self.gaps.copy()
+            mask = self._mask
             def boxes_above(s):
-                above = []
-                for gap in gaps:
-                    if gap > s:
-                        above.append(gap - s)
-                return len(above)
+                return popcount(mask >> (s + 1))
             min_gens = self.minimal_generating_set()
             ewt = 0
             for gen in min_gens:
                 ewt += boxes_above(gen)
             return ewt
     
-    @lru_cache(maxsize=None)
+    @cached_method
     def apery_weight(self):
             """
             Calculates the Apery weight of the numerical partition.
@@ -238,16 +287,9 @@ class NumericalSemigroup(NumericalSet):
                 int: The apery weight of the numerical partition.
             """
             m = self.multiplicity()
-            gaps = self.gaps.copy()
+            mask = self._mask
             def boxes_above(s):
-                if gaps:
-                    if s > max(gaps):
-                        return 0
-                above = []
-                for gap in gaps:
-                    if gap > s:
-                        above.append(gap - s)
-                return len(above)
+                return popcount(mask >> (s + 1))
             apery_set = self.apery_set(m)
             apery_set_adjust = {m} | (apery_set - {0})
             awt = 0
@@ -255,25 +297,26 @@ class NumericalSemigroup(NumericalSet):
                 awt += boxes_above(gen)
             return awt
     
+    @cached_method
+    def _pseudofrobenius_numbers(self):
+        # Cached as a tuple so that no caller can change it for the next one.
+        return tuple(pseudofrobenius_numbers_from_apery_set(self._multiplicity_apery_set()))
+
     def pseudofrobenius_numbers(self):
             """
             Calculates the pseudofrobenius numbers
+
+            These are w - m for the elements w of the Apéry set of the multiplicity m
+            that are maximal with respect to the order of the semigroup, an O(m^2)
+            computation that is done once per instance. Each call returns a new list.
+
             Returns:
                 A list of unique pseudofrobenius numbers.
             """
-            hookset = []
-            small_elements = self.small_elements()
-            gaps = self.gaps.copy()
-            for s in small_elements:
-                for gap in gaps:
-                    if gap > s:
-                        hookset.append(gap - s)
-            element_counts = Counter(hookset)
-            unique_elements = [element for element, count in element_counts.items() if count == 1]
-            return unique_elements
+            return list(self._pseudofrobenius_numbers())
     
     def type(self):
-        return len(self.pseudofrobenius_numbers())
+        return len(self._pseudofrobenius_numbers())
     
     def depth(self):
         return ceil((self.frobenius_number + 1)/self.multiplicity())
@@ -296,9 +339,26 @@ class NumericalSemigroup(NumericalSet):
         if n not in msg:
             raise ValueError(f"{n} must be a minimal generator of the numerical semigroup.")
         
-        gaps = list(self.gaps.copy())
-        gaps.append(n)
-        return NumericalSemigroup(gaps=gaps)
+        return self._without_generator(n)
+
+    def _without_generator(self, x):
+        """
+        Build S minus {x} for a minimal generator x, passing on what is known from S.
+
+        The child's minimal generators come from the local update in
+        _remove_generator, and when x is not the multiplicity m its Apéry set of
+        m is the parent's with x + m in place of x. Both are stored on the
+        child, so the tree can be walked without recomputing them.
+        """
+        mask, generators = _remove_generator(self._mask, self.minimal_generating_set(), x)
+        child = NumericalSemigroup._from_mask(mask, validate=False)
+        seed_method_cache(child, 'minimal_generating_set', generators)
+        m = self.multiplicity()
+        if x != m and '_apery' not in child.__dict__:
+            apery = list(self._multiplicity_apery_set())
+            apery[x % m] = x + m
+            child._apery = tuple(apery)
+        return child
 
     def effective_generators(self):
         mingens = self.minimal_generating_set()
@@ -307,45 +367,46 @@ class NumericalSemigroup(NumericalSet):
         return effective_gens
     
     def get_children(self):
-        gaps = self.gaps.copy()
         effective_gens = self.effective_generators()
-        children = [NumericalSemigroup(gaps=list(gaps) + [egen]) for egen in effective_gens]
+        children = [self._without_generator(egen) for egen in effective_gens]
         return children
     
     def get_parent(self):
-        gaps = self.gaps.copy()
-        gaps = set(gaps)
-        gaps.remove(max(gaps))
-        return NumericalSemigroup(gaps)
+        return NumericalSemigroup._from_mask(self._mask ^ (1 << self.frobenius_number), validate=False)
+
+    @cached_method
+    def _special_gaps(self):
+        mask = self._mask
+        return tuple(p for p in self._pseudofrobenius_numbers() if not (mask >> (2 * p)) & 1)
 
     def special_gaps(self):
         """
         compute the gaps that can be added to S and still have a numerical semigroup.
+
+        These are the pseudofrobenius numbers p with 2p in S. Each call returns a new list.
         Returns:
             A list of special gaps.
         """
-        gaps = self.gaps.copy()
-        f = self.frobenius_number
-        pf = self.pseudofrobenius_numbers()
-        sgaps = []
-        for p in pf:
-            mult = [p * i for i in range(2, (f // p) + 1)]
-            if not any(m in gaps for m in mult):
-                sgaps.append(p)
-        return sgaps
+        return list(self._special_gaps())
     
     def add_specialgap(self, p):
         """
         Add a special gap to the numerical semigroup.
+
+        When p is larger than the multiplicity m, the child's Apéry set of m is
+        the parent's with p in place of p + m, so it is passed on directly.
         """
-        if p not in self.special_gaps():
+        if p not in self._special_gaps():
             raise ValueError(f"{p} is not a special gap for the numerical semigroup.")
-        gaps = self.gaps.copy()
-        gaps = set(gaps)
-        gaps.remove(p)
-        return NumericalSemigroup(gaps=gaps)
+        child = NumericalSemigroup._from_mask(self._mask & ~(1 << p), validate=False)
+        m = self.multiplicity()
+        if p > m and '_apery' not in child.__dict__:
+            apery = list(self._multiplicity_apery_set())
+            apery[p % m] = p
+            child._apery = tuple(apery)
+        return child
     
     def get_frobchildren(self):
-        good_specialgaps = [p for p in self.special_gaps() if p != self.frobenius_number]
+        good_specialgaps = [p for p in self._special_gaps() if p != self.frobenius_number]
         children = [self.add_specialgap(p) for p in good_specialgaps]
-        return children
\ No newline at end of file
+        return children
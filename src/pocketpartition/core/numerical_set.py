@@ -1,33 +1,71 @@
 __all__ = ['NumericalSet']  # Specify the items to be exported
 
+from ..utils.cache import InternPool
+from ..utils.bitset import BitSetView, mask_from_iterable, bits_to_list, lowest_bit
+
 class NumericalSet:
-    _instances: dict = {}
+    _instances = InternPool('NumericalSet')
 
     def __new__(cls, gaps):
-        gaps_frozenset = frozenset(gaps)
-        if gaps_frozenset in cls._instances:
-            return cls._instances[gaps_frozenset]
-        instance = super(NumericalSet, cls).__new__(cls)
-        cls._instances[gaps_frozenset] = instance
-        return instance
+        return cls._from_mask(mask_from_iterable(gaps))
 
     def __init__(self, gaps):
         """
         Initialize the numerical set with its gaps.
 
+        The gaps are stored as an integer bitmask (bit i is set when i is a gap),
+        which is also the key under which the instance is interned. All state
+        is set up in __new__, so interned instances are returned untouched.
+
         Parameters:
         gaps (list of int): The gaps of the numerical set.
         """
-        self._gaps = frozenset(gaps)
-        self._frobenius_number = max(self._gaps) if self._gaps else -1
+
+    @classmethod
+    def _from_mask(cls, mask, validate=True):
+        """
+        Return the interned instance whose gaps are the set bits of mask.
+
+        Parameters:
+        mask (int): The gap bitmask.
+        validate (bool): Whether to run the class's validation on a newly created instance.
+
+        Returns:
+        NumericalSet: The instance with these gaps.
+        """
+        instance = cls._instances.get(mask)
+        if instance is None:
+            instance = object.__new__(cls)
+            instance._mask = mask
+            if validate:
+                instance._validate()
+            cls._instances[mask] = instance
+        return instance
+
+    def _validate(self):
+        """
+        Hook for subclasses to reject gap sets; every gap set is a numerical set.
+        """
 
     @property
     def gaps(self):
-        return self._gaps
+        return BitSetView(self._mask)
 
     @property
     def frobenius_number(self):
-        return self._frobenius_number
+        return self._mask.bit_length() - 1
+
+    def __eq__(self, other):
+        if not isinstance(other, NumericalSet):
+            return NotImplemented
+        return type(self) is type(other) and self._mask == other._mask
+
+    def __hash__(self):
+        return hash(self._mask)
+
+    def __reduce__(self):
+        # Pickle as the mask so that unpickling goes through the intern pool.
+        return (type(self)._from_mask, (self._mask, False))
     
     def __str__(self):
         return f"NumericalSet(gaps={sorted(self.gaps)})"
@@ -42,13 +80,24 @@ class NumericalSet:
         Returns:
         set of int: The gaps of the atom monoid.
         """
-        gaps_atom_monoid = set()
-        gaps = self.gaps.copy()
-        max_gap = max(gaps) if gaps else 0
-        for x in range(max_gap + max_gap + 1):
-            if any(x + t in gaps for t in range(max_gap + 1) if t not in gaps):
-                gaps_atom_monoid.add(x)
-        return gaps_atom_monoid
+        return set(bits_to_list(self._atom_monoid_mask()))
+
+    def _atom_monoid_mask(self):
+        """
+        Compute the gap bitmask of the atom monoid.
+
+        x is a gap of the atom monoid when x + t is a gap for some element t <= F,
+        so the mask is the OR of the gap mask shifted down by each such t.
+
+        Returns:
+        int: The gap bitmask of the atom monoid.
+        """
+        mask = self._mask
+        elements = ~mask & ((1 << (self.frobenius_number + 1)) - 1)
+        atom_mask = 0
+        for t in bits_to_list(elements):
+            atom_mask |= mask >> t
+        return atom_mask
 
     def partition(self):
             """
@@ -60,33 +109,18 @@ class NumericalSet:
             - If the current number is not in gaps, move right (add one box to the current row).
             - Continue this process until reaching the maximum number in gaps.
             - Collect the lengths of each row at the end of the walk.
+
+            The row created at the i-th gap g (counting from 0) has g - i boxes,
+            so the walk is read off the sorted gaps directly.
             
             The resulting partition is returned as a list of integers in non-increasing order.
 
             Returns:
             list: A partition [a1, a2, ..., an] in non-increasing order, representing the profile of the walk.
             """
-            gaps = self.gaps.copy()
-            if not gaps:
-                return []
-
-            # Sort the set gaps
-            gaps = sorted(gaps)
-
-            # Initialize the current row and the partition list
-            current_row_length = 0
-            partition = []
-
-            for i in range(gaps[-1] + 1):
-                if i in gaps:
-                    if current_row_length > 0:
-                        partition.append(current_row_length)
-                else:
-                    current_row_length += 1  # Move right means incrementing the row length
-
-            # Ensure the partition is in descending order
-            partition.sort(reverse=True)
-
+            gaps = bits_to_list(self._mask)
+            partition = [gap - i for i, gap in enumerate(gaps) if gap > i]
+            partition.reverse()
             return partition
 
     def small_elements(self):
@@ -96,15 +130,10 @@ class NumericalSet:
         Returns:
         set of int: The small elements of the numerical set.
         """
-        gaps = self.gaps.copy()
-        if not gaps:
+        if not self._mask:
             return set()
-        frobenius_number = max(gaps)
-        small_elements = []
-        for s in range(frobenius_number):
-            if s not in gaps:
-                small_elements.append(s)
-        return small_elements
+        below_frobenius = (1 << self.frobenius_number) - 1
+        return bits_to_list(below_frobenius & ~self._mask)
     
     def multiplicity(self):
         """
@@ -113,8 +142,4 @@ class NumericalSet:
         Returns:
         int: The multiplicity of the numerical semigroup.
         """
-        small_elements = self.small_elements()
-        if not small_elements:
-            return 1
-        nonzero = [element for element in small_elements if element !=0]
-        return min(nonzero) if nonzero else self.frobenius_number + 1
\ No newline at end of file
+        return lowest_bit(~self._mask & ~1)
@@ -1,16 +1,18 @@
 __all__ = ['Partition']  # Specify the items to be exported
+from array import array
 from ..utils.helpers import flatten_list
-from functools import lru_cache
+from ..utils.bitset import mask_from_iterable, bits_to_list, lowest_bit
+from ..utils.cache import InternPool, cached_method, seed_method_cache
 
 class Partition:
-    _instances: dict = {}
+    _instances = InternPool('Partition')
 
     def __new__(cls, partition):
         partition_tuple = tuple(partition)
-        if partition_tuple in cls._instances:
-            return cls._instances[partition_tuple]
-        instance = super(Partition, cls).__new__(cls)
-        cls._instances[partition_tuple] = instance
+        instance = cls._instances.get(partition_tuple)
+        if instance is None:
+            instance = super(Partition, cls).__new__(cls)
+            cls._instances[partition_tuple] = instance
         return instance
 
     def __init__(self, partition):
@@ -38,19 +40,103 @@ class Partition:
 
     def __repr__(self):
         return f"Partition(size={sum(self.partition)})"
+
+    def __eq__(self, other):
+        if not isinstance(other, Partition):
+            return NotImplemented
+        return self._partition == other._partition
+
+    def __hash__(self):
+        return hash(tuple(self._partition))
     
     @property
     def partition(self):
         return self._partition
 
+    @staticmethod
+    def _parts_from_profile_mask(mask):
+        # The up step at position g, the i-th one, closes a row of g - i boxes.
+        parts = [g - i for i, g in enumerate(bits_to_list(mask)) if g > i]
+        parts.reverse()
+        return parts
+
+    @classmethod
+    def from_profile_mask(cls, mask):
+        """
+        Construct a partition from its profile as a 0/1 word.
+
+        Parameters:
+        mask (int): The word as an integer, bit i set when move i of the profile is up.
+
+        Returns:
+        Partition: The partition with this profile.
+        """
+        partition = cls(cls._parts_from_profile_mask(mask))
+        if partition.partition:
+            seed_method_cache(partition, 'profile_mask', mask >> lowest_bit(~mask))
+        return partition
+
+    @classmethod
+    def from_numerical_set(cls, T):
+        """
+        Construct the partition of a numerical set in O(F), as the profile word is its gap bitmask.
+
+        Parameters:
+        T (NumericalSet): The numerical set.
+
+        Returns:
+        Partition: The partition of T.
+        """
+        return cls.from_profile_mask(T._mask)
+
+    def to_numerical_set(self):
+        """
+        Return the numerical set whose gaps are the up steps of the profile.
+
+        Returns:
+        NumericalSet: The numerical set of the partition.
+        """
+        from .numerical_set import NumericalSet
+        return NumericalSet._from_mask(self.profile_mask())
+
+    @cached_method
+    def profile_mask(self):
+        """
+        Compute the profile of the partition as a packed 0/1 word (its Maya diagram).
+
+        Bit i is 1 when move i of the profile (see profile) is up and 0 when it
+        is right. The word has length n + partition[0] for n parts and ends
+        with an up move, so its length is the bit length of the integer. The
+        set bits are exactly the gaps of the corresponding numerical set.
+
+        Returns:
+        int: The profile word.
+        """
+        p = self.partition
+        n = len(p)
+        mask = 0
+        for i, part in enumerate(p):
+            mask |= 1 << (part + n - 1 - i)
+        return mask
+
+    def _conjugate_mask(self):
+        # Reverse the profile word and swap its right and up moves.
+        mask = self.profile_mask()
+        length = mask.bit_length()
+        complement = ~mask & ((1 << length) - 1)
+        return int(format(complement, f'0{length}b')[::-1], 2) if length else 0
+
     def conjugate_list(self):
         """
         Compute the conjugate partition of the partition.
 
+        Transposing the diagram reverses the profile and swaps right and up
+        moves, so the conjugate's word is the bit reversal of the complement.
+
         Returns:
         list of int: The conjugate partition of the partition.
         """
-        return [sum(1 for p in self.partition if p > i) for i in range(max(self.partition))]
+        return self._parts_from_profile_mask(self._conjugate_mask())
     
     def conjugate(self):
         """
@@ -59,97 +145,85 @@ class Partition:
         Returns:
         Partition: The conjugate partition of the partition.
         """
-        return Partition(self.conjugate_list())
+        return Partition.from_profile_mask(self._conjugate_mask())
+
+    @cached_method
+    def hook_length_array(self):
+        """
+        Compute all hook lengths as a flat ragged array.
+
+        Row i of the Ferrers diagram occupies values[offsets[i]:offsets[i + 1]].
+        Cells correspond to pairs (right move at a, up move at b) of the profile
+        word with a < b, and the hook length is b - a: the cell in row i and
+        column j pairs the up move closing row i with the j-th right move.
+
+        Returns:
+        tuple: (values, offsets), two array('q') objects.
+        """
+        mask = self.profile_mask()
+        ups = bits_to_list(mask)
+        ups.reverse()
+        rights = bits_to_list(~mask & ((1 << mask.bit_length()) - 1))
+        values = array('q')
+        offsets = array('q', [0])
+        for up, part in zip(ups, self.partition):
+            values.extend([up - right for right in rights[:part]])
+            offsets.append(len(values))
+        return values, offsets
     
-    @lru_cache(None)
+    @cached_method
     def hook_lengths(self):
         """
         Compute the hook length of a cell in the partition.
+
+        The nested lists are built on demand from hook_length_array.
         Returns:
         list of int: A list of hook lengths for each cell in the partition.
         """
-        p = self.partition
-        conj = self.conjugate_list()
-        return [[p[i]-(i+1)+conj[j]-(j+1)+1 for j in range(p[i])] for i in range(len(p))]
+        values, offsets = self.hook_length_array()
+        return [values[offsets[i]:offsets[i + 1]].tolist() for i in range(len(offsets) - 1)]
     
     def profile(self):
         """
         Compute the profile of the partition as a series of moves (Right and Up).
 
+        The moves are read off the profile word, starting at the bottom-left corner.
+
         Returns:
         list of str: A list of moves representing the profile of the partition.
         """
-        partition = self.partition
-        moves = []
-        n = len(partition)
-        max_width = partition[0]
-        
-        # Start at the bottom-left corner
-        current_row = n - 1
-        current_col = 0
-        
-        while current_row >= 0 and current_col < max_width:
-            # Move right until we reach the end of the row
-            while current_col < partition[current_row]:
-                moves.append((1,0))
-                current_col += 1
-            
-            # Move up until we reach a row that has boxes in the current column
-            while current_row >= 0 and (current_col >= partition[current_row]):
-                moves.append((0,1))
-                current_row -= 1
-        
-        return moves
+        word = bin(self.profile_mask())[:1:-1]
+        return [(0,1) if bit == '1' else (1,0) for bit in word] if self.partition else []
     
     def gaps(self):
         """
-        Compute the gaps in the profile of the partition.
+        Compute the gaps in the profile of the partition, the up moves of its profile word.
 
         Returns:
         list of int: A list of gaps in the profile.
         """
-        profile = self.profile()
-        i = 0
-        gap_set = []
-        for step in profile:
-            if step == (0,1):
-                gap_set.append(i)
-            i += 1
-        return gap_set
+        return bits_to_list(self.profile_mask())
     
     def non_gaps(self):
-        gaps = self.gaps()
-        frobenius_number = max(gaps)
-        nongaps = []
-        for s in range(frobenius_number):
-            if s not in gaps:
-                nongaps.append(s)
-        return nongaps
+        # The right moves of the profile word, all below its last up move.
+        mask = self.profile_mask()
+        return bits_to_list(~mask & ((1 << mask.bit_length()) - 1))
     
     def atom_partition(self):
         """
         Returns the atom partition of the given partition.
 
+        This is the partition of the numerical set whose gaps are the distinct
+        hook lengths: the distinct hooks are packed into a bitmask and the i-th
+        one, h, contributes a row of h - i boxes.
+
         Returns:
             list: The atom partition.
         """
-        hook_partition = self.hook_lengths()
-        hookset = [hook for row in hook_partition for hook in row]
-        if len(hookset) == 0:
-            return []
-        hookset.sort()
-        current_step = 0
-        partition = []
-        current_row = 0
-
-        while current_step <= max(hookset):
-            for i in range(current_step, max(hookset) + 1):
-                if i in hookset:
-                    partition.append(current_row)
-                    current_step = i + 1
-                    break
-                current_row += 1
-        partition.sort(reverse=True)
+        values, _ = self.hook_length_array()
+        hookset = bits_to_list(mask_from_iterable(values))
+        partition = [hook - i for i, hook in enumerate(hookset)]
+        partition.reverse()
         return partition
     
     def atom_monoid_gaps(self):
@@ -157,7 +231,17 @@ class Partition:
         return gapset
 
     def is_semigroup(self):
-        return self.atom_partition() == self.partition
+        """
+        Check whether the distinct hook lengths are the gaps of the partition's numerical set.
+
+        This holds exactly when that numerical set is a numerical semigroup, and
+        is checked by comparing the hook set bitmask with the profile word.
+
+        Returns:
+        bool: True if the partition is the partition of a numerical semigroup.
+        """
+        values, _ = self.hook_length_array()
+        return mask_from_iterable(values) == self.profile_mask()
     
     def display(self, show_hooks=False):
         """
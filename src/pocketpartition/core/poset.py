@@ -1,19 +1,106 @@
-from functools import lru_cache
+from ..utils.cache import InternPool, cached_method
+from ..utils.bitset import bits_to_list, lowest_bit, popcount
 
 class Poset:
-    _instances:dict = dict()  # Class-level dictionary to hold instances
+    _instances = InternPool('Poset')  # Class-level pool to hold instances
 
-    def __new__(cls, elements, relations):
+    def __new__(cls, elements, relations, validate=True):
         key = (frozenset(elements), frozenset(tuple(rel) for rel in relations))
-        if key not in cls._instances:
+        instance = cls._instances.get(key)
+        if instance is None:
             instance = super(Poset, cls).__new__(cls)
             cls._instances[key] = instance
-        return cls._instances[key]
+        return instance
 
-    def __init__(self, elements=None, relations=None):
-        self._elements = frozenset(elements) if elements else frozenset()
-        self._relations = frozenset(relations) if relations else frozenset()
-        self._validate_poset()
+    def __init__(self, elements=None, relations=None, validate=True):
+        """
+        Initialize the poset with its elements and its order relation.
+
+        The order is indexed as one bitmask row per element: bit j of the row of
+        the i-th element is set when (element_i, element_j) is a relation.
+        Validation runs on these rows with word-level operations, and can be
+        skipped by callers that build a valid order by construction and run
+        later through validate().
+
+        Parameters:
+        elements (iterable): The elements of the poset.
+        relations (iterable of tuple): The pairs (a, b) of related elements, including (a, a).
+        validate (bool): Whether to check that the relations form a partial order.
+
+        Raises:
+        ValueError: If validate is True and the relations are not a partial order.
+        """
+        if '_elements' not in self.__dict__:
+            self._elements = frozenset(elements) if elements else frozenset()
+            self._relations = frozenset(tuple(rel) for rel in relations) if relations else frozenset()
+            self._validated = False
+        if validate and not self._validated:
+            self.validate()
+
+    @classmethod
+    def from_cover_relations(cls, elements, covers):
+        """
+        Construct a poset from its cover relations by transitive and reflexive closure.
+
+        Parameters:
+        elements (iterable): The elements of the poset.
+        covers (iterable of tuple): The pairs (a, b) where b covers a, or any relation generating the order.
+
+        Returns:
+        Poset: The poset generated by the covers.
+
+        Raises:
+        ValueError: If the closure is not antisymmetric.
+        """
+        elements = list(elements)
+        order, index = cls._ordered_index(elements)
+        rows = [1 << i for i in range(len(order))]
+        for a, b in covers:
+            rows[index[a]] |= 1 << index[b]
+        rows = cls._closure_rows(rows)
+        relations = [(order[i], order[j]) for i, row in enumerate(rows) for j in bits_to_list(row)]
+        return cls(elements, relations)
+
+    @staticmethod
+    def _ordered_index(elements):
+        try:
+            order = sorted(elements)
+        except TypeError:
+            order = list(elements)
+        return order, {element: i for i, element in enumerate(order)}
+
+    @staticmethod
+    def _closure_rows(rows):
+        # Warshall's algorithm, one bitmask OR per (k, i) pair.
+        rows = list(rows)
+        for k in range(len(rows)):
+            bit = 1 << k
+            row_k = rows[k]
+            for i, row_i in enumerate(rows):
+                if row_i & bit:
+                    rows[i] = row_i | row_k
+        return rows
+
+    @cached_method
+    def _bitset_index(self):
+        """
+        Index the order as bitmask rows.
+
+        Returns:
+        tuple: (order, index, up, down) where order lists the elements, index
+        maps an element to its position, up[i] has bit j set when
+        (order[i], order[j]) is a relation and down is the transpose of up.
+        """
+        order, index = self._ordered_index(self._elements)
+        up = [0] * len(order)
+        down = [0] * len(order)
+        for a, b in self._relations:
+            if a not in index or b not in index:
+                raise ValueError(f"Relation ({a}, {b}) involves an element that is not in the poset.")
+            i, j = index[a], index[b]
+            up[i] |= 1 << j
+            down[j] |= 1 << i
+        return order, index, up, down
 
     @property
     def elements(self):
@@ -29,10 +116,25 @@ class Poset:
     def __str__(self):
         return self.__repr__()
 
-    def _validate_poset(self):
+    def __eq__(self, other):
+        if not isinstance(other, Poset):
+            return NotImplemented
+        return self._elements == other._elements and self._relations == other._relations
+
+    def __hash__(self):
+        return hash((self._elements, self._relations))
+
+    def validate(self):
+        """
+        Check that the relations form a partial order.
+
+        Raises:
+        ValueError: If reflexivity, antisymmetry or transitivity fails.
+        """
         self._check_reflexivity()
         self._check_antisymmetry()
         self._check_transitivity()
+        self._validated = True
 
     def add_element(self, element):
         new_elements = self._elements.union({element})
@@ -48,37 +150,218 @@ class Poset:
             raise ValueError("Both elements must be in the poset.")
 
     def _check_reflexivity(self):
-        for element in self._elements:
-            if (element, element) not in self._relations:
+        order, _, up, _ = self._bitset_index()
+        for i, element in enumerate(order):
+            if not (up[i] >> i) & 1:
                 raise ValueError(f"Reflexivity violated for element: {element}")
 
     def _check_antisymmetry(self):
-        for (a, b) in self._relations:
-            if (b, a) in self._relations and a != b:
+        order, _, up, down = self._bitset_index()
+        for i, a in enumerate(order):
+            both = up[i] & down[i] & ~(1 << i)
+            if both:
+                b = order[lowest_bit(both)]
                 raise ValueError(f"Antisymmetry violated for pair: ({a}, {b})")
 
     def _check_transitivity(self):
-        for (a, b) in self._relations:
-            for (c, d) in self._relations:
-                if b == c and (a, d) not in self._relations:
-                    raise ValueError(f"Transitivity violated for pairs: ({a}, {b}), ({c}, {d})")
+        # (a, b) and (b, d) imply (a, d): every row reachable from a row must be contained in it.
+        order, _, up, _ = self._bitset_index()
+        for i, row in enumerate(up):
+            for j in bits_to_list(row):
+                missing = up[j] & ~row
+                if missing:
+                    a, b, d = order[i], order[j], order[lowest_bit(missing)]
+                    raise ValueError(f"Transitivity violated for pairs: ({a}, {b}), ({b}, {d})")
     
-    @lru_cache(maxsize=None)
+    @cached_method
     def cover_relations(self):
+        """
+        Compute the cover relations (the transitive reduction) of the poset.
+
+        y covers x when x < y and no z has x < z < y; with strict up-sets as
+        bitmasks, the covers of x are its strict up-set minus the union of the
+        strict up-sets of its elements.
+
+        Returns:
+        set of tuple: The pairs (x, y) where y covers x.
+        """
+        order, _, up, _ = self._bitset_index()
+        strict = [row & ~(1 << i) for i, row in enumerate(up)]
         covers = set()
-        for (x, y) in self._relations:
-            if x != y:  # x < y
-                is_cover = True
-                for b in self._elements:
-                    if b == x or b == y:
-                        continue
-                    if (x, b) in self._relations and (b, y) in self._relations:
-                        is_cover = False
-                        break
-                if is_cover:
-                    covers.add((x, y))
+        for i, row in enumerate(strict):
+            above = 0
+            for j in bits_to_list(row):
+                above |= strict[j]
+            covers.update((order[i], order[j]) for j in bits_to_list(row & ~above))
         return covers
 
+    @cached_method
+    def _strict_index(self):
+        """
+        Strict up-sets and down-sets as bitmask rows, plus a linear extension.
+
+        A strict down-set is strictly contained in the down-set of every element
+        above it, so sorting by the size of the down-set gives a topological order.
+
+        Returns:
+        tuple: (order, up, down, topological) where up[i] and down[i] exclude i
+        and topological lists the indices from bottom to top.
+        """
+        order, _, up, down = self._bitset_index()
+        up = [row & ~(1 << i) for i, row in enumerate(up)]
+        down = [row & ~(1 << i) for i, row in enumerate(down)]
+        topological = sorted(range(len(order)), key=lambda i: popcount(down[i]))
+        return order, up, down, topological
+
+    def minimal_elements(self):
+        order, _, down, _ = self._strict_index()
+        return [order[i] for i, row in enumerate(down) if not row]
+
+    def maximal_elements(self):
+        order, up, _, _ = self._strict_index()
+        return [order[i] for i, row in enumerate(up) if not row]
+
+    @cached_method
+    def ranks(self):
+        """
+        Compute the rank of every element.
+
+        The rank of x is the length of the longest chain from a minimal element
+        to x, so minimal elements have rank 0. Elements are visited in
+        topological order, taking one more than the largest rank below.
+
+        Returns:
+        dict: A dictionary mapping each element to its rank.
+        """
+        order, _, down, topological = self._strict_index()
+        rank = [0] * len(order)
+        for i in topological:
+            below = bits_to_list(down[i])
+            rank[i] = 1 + max(rank[j] for j in below) if below else 0
+        return {order[i]: rank[i] for i in range(len(order))}
+
+    def height(self):
+        """
+        Compute the height of the poset, the number of elements in a longest chain.
+
+        Returns:
+        int: The height of the poset (0 for the empty poset).
+        """
+        ranks = self.ranks()
+        return max(ranks.values()) + 1 if ranks else 0
+
+    def maximal_chains(self):
+        """
+        Iterate over the maximal chains of the poset.
+
+        A maximal chain starts at a minimal element, ends at a maximal element
+        and moves along cover relations, so the chains are walked depth-first
+        on the cover rows.
+
+        Yields:
+        list: The elements of a maximal chain, from bottom to top.
+        """
+        order, up, down, _ = self._strict_index()
+        covers = []
+        for row in up:
+            above = 0
+            for j in bits_to_list(row):
+                above |= up[j]
+            covers.append(bits_to_list(row & ~above))
+        for start in (i for i, row in enumerate(down) if not row):
+            stack = [(start, [order[start]])]
+            while stack:
+                i, chain = stack.pop()
+                if not covers[i]:
+                    yield chain
+                    continue
+                for j in reversed(covers[i]):
+                    stack.append((j, chain + [order[j]]))
+
+    @cached_method
+    def width(self):
+        """
+        Compute the width of the poset, the size of a largest antichain.
+
+        By Dilworth's theorem the width is the number of elements minus the
+        size of a maximum matching in the bipartite graph with an edge from x to
+        y whenever x < y. The matching is grown by augmenting paths over the
+        strict up-set rows.
+
+        Returns:
+        int: The width of the poset.
+        """
+        order, up, _, _ = self._strict_index()
+        n = len(order)
+        match = [-1] * n  # match[j] is the element matched below j
+
+        def augment(i, seen):
+            for j in bits_to_list(up[i] & ~seen[0]):
+                seen[0] |= 1 << j
+                if match[j] < 0 or augment(match[j], seen):
+                    match[j] = i
+                    return True
+            return False
+
+        matching = sum(1 for i in range(n) if augment(i, [0]))
+        return n - matching
+
+    @cached_method
+    def antichains_count(self):
+        """
+        Count the antichains of the poset, including the empty antichain.
+
+        An antichain in a set of available elements either avoids an element x
+        or contains x and nothing comparable to x. The element splitting the
+        most comparabilities is chosen at each step, and counts are memoized on
+        the bitmask of available elements.
+
+        Returns:
+        int: The number of antichains.
+        """
+        order, up, down, _ = self._strict_index()
+        comparable = [u | d for u, d in zip(up, down)]
+        memo = {0: 1}
+
+        def count(available):
+            result = memo.get(available)
+            if result is None:
+                i = max(bits_to_list(available), key=lambda k: popcount(comparable[k] & available))
+                rest = available & ~(1 << i)
+                result = count(rest) + count(rest & ~comparable[i])
+                memo[available] = result
+            return result
+
+        return count((1 << len(order)) - 1)
+
+    @cached_method
+    def linear_extensions_count(self):
+        """
+        Count the linear extensions of the poset.
+
+        The extensions of the elements not yet placed are obtained by placing
+        any of its minimal elements first. Every such set is an up-set, and the
+        counts are memoized on its bitmask, so the work is proportional to the
+        number of up-sets times the number of elements.
+
+        Returns:
+        int: The number of linear extensions.
+        """
+        order, _, down, _ = self._strict_index()
+        memo = {0: 1}
+
+        def count(remaining):
+            result = memo.get(remaining)
+            if result is None:
+                result = 0
+                for i in bits_to_list(remaining):
+                    if not down[i] & remaining:
+                        result += count(remaining & ~(1 << i))
+                memo[remaining] = result
+            return result
+
+        return count((1 << len(order)) - 1)
+
     def display(self):
         print("Elements:", self._elements)
         print("Relations:", self._relations)
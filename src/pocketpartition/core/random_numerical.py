@@ -1,58 +1,148 @@
-from .numerical_semigroup import NumericalSemigroup
+__all__ = [
+    'RandomNumericalSemigroupWithGenus',
+    'RandomGraphWalk',
+    'RandomTreeWalk',
+    'RandomNumericalSemigroupsWithGenus',
+    'sample_rng',
+]
+
+from .numerical_semigroup import NumericalSemigroup, _remove_generator
+from ..utils.parallel import parallel_map
 import random
 
-def RandomNumericalSemigroupWithGenus(g):
+def _graph_walk(mask, generators, g, rng):
+    # Remove g uniformly chosen minimal generators, carrying (mask, generators).
+    for _ in range(g):
+        mask, generators = _remove_generator(mask, generators, rng.choice(generators))
+    return mask
+
+def _tree_walk(mask, generators, g, rng):
+    # Remove g uniformly chosen effective generators; None if a leaf is reached first.
+    for _ in range(g):
+        frob = mask.bit_length() - 1
+        effective_gens = [gen for gen in generators if gen > frob]
+        if not effective_gens:
+            return None
+        mask, generators = _remove_generator(mask, generators, rng.choice(effective_gens))
+    return mask
+
+def RandomNumericalSemigroupWithGenus(g, rng=None):
     """
     Generates a random numerical semigroup with a given genus.
         https://github.com/gap-packages/numericalsgps/blob/master/gap/random.gi
     Parameters:
     g (int): The genus of the numerical semigroup.
+    rng (random.Random or None): The random number generator; by default the random module.
 
     Returns:
     NumericalSemigroup: The generated numerical semigroup.
     """
-    s = NumericalSemigroup(generators={1})
-    for i in range(g):
-        mingens = s.minimal_generating_set()
-        x = random.choice(mingens)
-        s = s.remove_minimal_generator(x)
-    return s
+    mask = _graph_walk(0, [1], g, rng or random)
+    return NumericalSemigroup._from_mask(mask, validate=False)
 
-def RandomGraphWalk(start, g):
+def RandomGraphWalk(start, g, rng=None):
     """
     Generates a random numerical semigroup with a given genus.
         https://github.com/gap-packages/numericalsgps/blob/master/gap/random.gi
     Parameters:
     g (int): The genus of the numerical semigroup.
+    rng (random.Random or None): The random number generator; by default the random module.
 
     Returns:
     NumericalSemigroup: The generated numerical semigroup.
     """
-    s = start
-    for i in range(g):
-        mingens = s.minimal_generating_set()
-        x = random.choice(mingens)
-        s = s.remove_minimal_generator(x)
-    return s
+    mask = _graph_walk(start._mask, start.minimal_generating_set(), g, rng or random)
+    return NumericalSemigroup._from_mask(mask, validate=False)
 
-def RandomTreeWalk(start, g):
+def RandomTreeWalk(start, g, rng=None):
     """
     Generates a random numerical semigroup with a given genus.
         https://github.com/gap-packages/numericalsgps/blob/master/gap/random.gi
     Parameters:
     g (int): The genus of the numerical semigroup.
+    rng (random.Random or None): The random number generator; by default the random module.
 
     Returns:
     NumericalSemigroup: The generated numerical semigroup.
     """
-    s = start
-    for i in range(g):
-        mingens = s.minimal_generating_set()
-        frob = s.frobenius_number
-        effective_gens = [gen for gen in mingens if gen > frob]
-        if effective_gens:
-            x = random.choice(effective_gens)
-            s = s.remove_minimal_generator(x)
-        else:
-            return
-    return s
\ No newline at end of file
+    mask = _tree_walk(start._mask, start.minimal_generating_set(), g, rng or random)
+    if mask is None:
+        return
+    return NumericalSemigroup._from_mask(mask, validate=False)
+
+# Bulk sampling.
+#
+# Sample i of a run is drawn from its own random.Random seeded with the string
+# "<seed>:<i>", which Python hashes with SHA-512, so every sample depends only
+# on the run seed and its index. Samples are computed in chunks by the pool
+# and collected in index order, so the output is the same for any number of
+# processes and any chunk size.
+
+_WALKS = {'graph': _graph_walk, 'tree': _tree_walk}
+
+def sample_rng(seed, i):
+    """
+    Return the random number generator of sample i of a run.
+
+    Parameters:
+    seed (int): The run seed.
+    i (int): The sample index.
+
+    Returns:
+    random.Random: An independent generator for this sample.
+    """
+    return random.Random(f"{seed}:{i}")
+
+def _sample_chunk(task):
+    start_mask, start_generators, g, seed, start, stop, walk = task
+    walk = _WALKS[walk]
+    return [walk(start_mask, start_generators, g, sample_rng(seed, i)) for i in range(start, stop)]
+
+def RandomNumericalSemigroupsWithGenus(g, n, seed=None, start=None, walk='graph', processes=1, chunk_size=256):
+    """
+    Draw n random numerical semigroups of genus g as independent random walks.
+
+    Each walk removes g random minimal generators (walk='graph') or effective
+    generators (walk='tree'), as in RandomGraphWalk and RandomTreeWalk. The
+    intermediate steps are plain (mask, generators) pairs, so no
+    NumericalSemigroup is built, validated or interned until the end of a walk.
+    Sample i uses sample_rng(seed, i), so the samples are reproducible from
+    the seed alone and do not depend on processes or chunk_size.
+
+    Parameters:
+    g (int): The number of steps of each walk; the genus when starting from the natural numbers.
+    n (int): The number of samples.
+    seed (int or None): The run seed; by default a fresh one is drawn from the random module.
+    start (NumericalSemigroup or None): Where the walks start; by default the natural numbers.
+    walk (str): 'graph' or 'tree'.
+    processes (int or None): Number of worker processes; None uses every CPU.
+    chunk_size (int): Number of samples per task.
+
+    Returns:
+    list: The samples in index order. Tree walks that reach a leaf before g steps give None.
+
+    Raises:
+    ValueError: If walk is unknown or n, g or chunk_size is invalid.
+    """
+    if walk not in _WALKS:
+        raise ValueError(f"walk must be one of {sorted(_WALKS)}.")
+    if g < 0 or n < 0 or chunk_size < 1:
+        raise ValueError("g and n must be nonnegative and chunk_size positive.")
+    if seed is None:
+        seed = random.getrandbits(64)
+    if start is None:
+        start_mask, start_generators = 0, [1]
+    else:
+        start_mask, start_generators = start._mask, start.minimal_generating_set()
+
+    tasks = (
+        (start_mask, start_generators, g, seed, i, min(i + chunk_size, n), walk)
+        for i in range(0, n, chunk_size)
+    )
+    samples = []
+    for masks in parallel_map(_sample_chunk, tasks, processes=processes):
+        samples.extend(
+            None if mask is None else NumericalSemigroup._from_mask(mask, validate=False)
+            for mask in masks
+        )
+    return samples
@@ -0,0 +1,172 @@
+__all__ = [
+    'IterSemigroupPartitions',
+    'IterSemigroupPartitionsWithMaxSize',
+    'CountSemigroupPartitions',
+    'CountsSemigroupPartitionsWithMaxSize',
+]
+
+from collections import deque
+from .genus import _child_state
+from .partition import Partition
+from ..utils.parallel import resolve_processes, parallel_worklist
+
+# The partitions whose hook set is the gap set of a numerical semigroup are the
+# partitions of numerical semigroups, so they are enumerated on the semigroup
+# tree instead of among all partitions. The partition of S has one row of
+# x - i boxes for its i-th gap x, so the child S minus {x} obtained by removing
+# an effective generator x (which is larger than every gap) has size
+# size(S) + x - genus(S). Sizes strictly increase down the tree and with x, so
+# a branch is cut as soon as x - genus(S) exceeds the boxes left. Every row
+# has at least one box, so genus(S) <= size(S) and the generators that are
+# tried are at most n: the decomposition numbers are only kept up to n.
+
+_TASK_BUDGET = 20000
+
+def _root_state(n):
+    return ([y // 2 + 1 for y in range(n + 1)], 1, 1, 0)
+
+def _generators_within(state, genus, room):
+    # Effective generators x with x - genus <= room, in increasing order.
+    dec, conductor, multiplicity, _ = state
+    stop = min(conductor + multiplicity, genus + room + 1)
+    return [x for x in range(conductor, stop) if dec[x] == 1]
+
+def _walk_sizes(state, genus, size, max_size, budget=None, leftovers=None, leaf_counts=None):
+    """
+    Depth-first walk of the semigroups below a node whose partitions have at most max_size boxes.
+
+    If a budget is given, the walk stops after that many nodes and appends the
+    roots of the branches it did not enter to leftovers. If leaf_counts is
+    given, children that cannot have children of their own are not built or
+    yielded; leaf_counts[size] is incremented for each of them instead. A
+    child built with the generator x has children only if x - genus fits in
+    the boxes it leaves, since its own generators are larger than x.
+
+    Yields:
+    tuple: (state, genus, size) for every node of the pruned subtree.
+    """
+    yield state, genus, size
+    stack = [(state, genus, size, iter(_generators_within(state, genus, max_size - size)))]
+    visited = 1
+    while stack:
+        if budget is not None and visited >= budget:
+            for parent, parent_genus, parent_size, generators in stack:
+                leftovers.extend(
+                    (_child_state(parent, x), parent_genus + 1, parent_size + x - parent_genus)
+                    for x in generators
+                )
+            return
+        parent, parent_genus, parent_size, generators = stack[-1]
+        x = next(generators, None)
+        if x is None:
+            stack.pop()
+            continue
+        child_genus, child_size = parent_genus + 1, parent_size + x - parent_genus
+        if leaf_counts is not None and x - parent_genus > max_size - child_size:
+            leaf_counts[child_size] += 1
+            continue
+        child = _child_state(parent, x)
+        yield child, child_genus, child_size
+        visited += 1
+        stack.append((child, child_genus, child_size, iter(_generators_within(child, child_genus, max_size - child_size))))
+
+def IterSemigroupPartitionsWithMaxSize(n):
+    """
+    Iterate over the partitions of at most n boxes whose hook set is the gap set of a numerical semigroup.
+
+    Parameters:
+    n (int): The largest size.
+
+    Yields:
+    Partition: Each such partition, in depth-first order of the semigroup tree.
+    """
+    if n < 0:
+        return
+    for state, _, _ in _walk_sizes(_root_state(n), 0, 0, n):
+        yield Partition.from_profile_mask(state[3])
+
+def IterSemigroupPartitions(n):
+    """
+    Iterate over the partitions of n whose hook set is the gap set of a numerical semigroup.
+
+    These are the partitions for which Partition.is_semigroup holds, found on
+    the pruned semigroup tree rather than by testing every partition of n.
+
+    Parameters:
+    n (int): The size of the partitions.
+
+    Yields:
+    Partition: Each such partition.
+    """
+    if n < 0:
+        return
+    for state, _, size in _walk_sizes(_root_state(n), 0, 0, n):
+        if size == n:
+            yield Partition.from_profile_mask(state[3])
+
+def _count_subtree(state, genus, size, n, counts, budget=None, leftovers=None):
+    """
+    Add the number of semigroup partitions of each size in a subtree to counts.
+
+    Children without children of their own are counted from their parents
+    without being built. budget and leftovers are as in _walk_sizes.
+    """
+    for _, _, node_size in _walk_sizes(state, genus, size, n, budget, leftovers, counts):
+        counts[node_size] += 1
+    return counts
+
+def _count_task(task):
+    state, genus, size, n = task
+    leftovers = []
+    counts = _count_subtree(state, genus, size, n, [0] * (n + 1), _TASK_BUDGET, leftovers)
+    return counts, [(child, child_genus, child_size, n) for child, child_genus, child_size in leftovers]
+
+def CountsSemigroupPartitionsWithMaxSize(n, processes=1, tasks_per_process=16):
+    """
+    Count the semigroup partitions of each size up to n.
+
+    With more than one process the top of the tree is expanded breadth first
+    into subtrees that are counted in a process pool; a worker that exceeds
+    its node budget hands its unvisited branches back to the queue.
+
+    Parameters:
+    n (int): The largest size.
+    processes (int or None): Number of worker processes; None uses every CPU.
+    tasks_per_process (int): How many subtrees to aim for per worker, for load balancing.
+
+    Returns:
+    list of int: The list [c_0, c_1, ..., c_n], where c_k is the number of semigroup partitions of k.
+    """
+    if n < 0:
+        return []
+    processes = resolve_processes(processes)
+    counts = [0] * (n + 1)
+    if processes == 1:
+        return _count_subtree(_root_state(n), 0, 0, n, counts)
+
+    frontier = deque([(_root_state(n), 0, 0)])
+    while frontier and len(frontier) < processes * tasks_per_process:
+        state, genus, size = frontier.popleft()
+        counts[size] += 1
+        for x in _generators_within(state, genus, n - size):
+            frontier.append((_child_state(state, x), genus + 1, size + x - genus))
+    work = [(state, genus, size, n) for state, genus, size in frontier]
+    for subtree_counts in parallel_worklist(_count_task, work, processes):
+        for size, count in enumerate(subtree_counts):
+            counts[size] += count
+    return counts
+
+def CountSemigroupPartitions(n, processes=1):
+    """
+    Count the partitions of n whose hook set is the gap set of a numerical semigroup.
+
+    Parameters:
+    n (int): The size of the partitions.
+    processes (int or None): Number of worker processes; None uses every CPU.
+
+    Returns:
+    int: The number of semigroup partitions of n.
+    """
+    if n < 0:
+        return 0
+    return CountsSemigroupPartitionsWithMaxSize(n, processes)[n]
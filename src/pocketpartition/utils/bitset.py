@@ -0,0 +1,125 @@
+from collections.abc import Set
+
+__all__ = ['BitSetView', 'mask_from_iterable', 'bits_to_list', 'popcount', 'lowest_bit']
+
+try:
+    popcount = int.bit_count
+except AttributeError:  # Python < 3.10
+    def popcount(mask):
+        """
+        Count the set bits of a nonnegative integer.
+
+        Parameters:
+        mask (int): The bitmask.
+
+        Returns:
+        int: The number of set bits.
+        """
+        return bin(mask).count('1')
+
+
+def lowest_bit(mask):
+    """
+    Index of the lowest set bit of an integer.
+
+    Parameters:
+    mask (int): The bitmask. Negative integers are read in two's complement.
+
+    Returns:
+    int: The index of the lowest set bit, or -1 if the mask is zero.
+    """
+    return (mask & -mask).bit_length() - 1
+
+
+def mask_from_iterable(values):
+    """
+    Pack an iterable of nonnegative integers into an integer bitmask.
+
+    Bit i of the result is set exactly when i is one of the values.
+
+    Parameters:
+    values (iterable of int): The values to pack.
+
+    Returns:
+    int: The bitmask.
+
+    Raises:
+    ValueError: If one of the values is negative.
+    """
+    if isinstance(values, BitSetView):
+        return values.mask
+    values = list(values)
+    if not values:
+        return 0
+    if min(values) < 0:
+        raise ValueError("Only nonnegative integers can be stored in a bitmask.")
+    buffer = bytearray((max(values) >> 3) + 1)
+    for value in values:
+        buffer[value >> 3] |= 1 << (value & 7)
+    return int.from_bytes(buffer, 'little')
+
+
+def bits_to_list(mask):
+    """
+    Unpack a nonnegative integer bitmask into the sorted list of its set bits.
+
+    Parameters:
+    mask (int): The bitmask.
+
+    Returns:
+    list of int: The indices of the set bits in increasing order.
+    """
+    digits = bin(mask)[:1:-1]
+    bits = []
+    i = digits.find('1')
+    while i != -1:
+        bits.append(i)
+        i = digits.find('1', i + 1)
+    return bits
+
+
+class BitSetView(Set):
+    """
+    Read-only set view over an integer bitmask.
+
+    Membership is a single bit test and iteration yields the elements in
+    increasing order. Set operations with other sets return frozensets.
+    """
+    __slots__ = ('_mask',)
+
+    def __init__(self, mask):
+        self._mask = mask
+
+    @property
+    def mask(self):
+        return self._mask
+
+    @classmethod
+    def _from_iterable(cls, iterable):
+        return frozenset(iterable)
+
+    def __contains__(self, value):
+        try:
+            return value >= 0 and (self._mask >> value) & 1 == 1
+        except TypeError:
+            return False
+
+    def __iter__(self):
+        return iter(bits_to_list(self._mask))
+
+    def __len__(self):
+        return popcount(self._mask)
+
+    def __eq__(self, other):
+        if isinstance(other, BitSetView):
+            return self._mask == other._mask
+        return Set.__eq__(self, other)
+
+    def __hash__(self):
+        return hash(frozenset(self))
+
+    def __repr__(self):
+        return f"{type(self).__name__}({bits_to_list(self._mask)})"
+
+    def copy(self):
+        return self
@@ -0,0 +1,229 @@
+from collections import OrderedDict
+from functools import wraps
+from weakref import WeakValueDictionary
+
+__all__ = [
+    'InternPool',
+    'cached_method',
+    'seed_method_cache',
+    'configure_interning',
+    'intern_stats',
+    'cache_stats',
+    'clear_intern_pools',
+    'reset_stats',
+]
+
+INTERN_MODES = ('weak', 'lru', 'strong', 'off')
+
+_POOLS = {}
+_METHOD_STATS = {}
+
+class InternPool:
+    """
+    Pool of interned instances keyed by their defining value.
+
+    Modes:
+    - 'weak': keep an instance only while something else references it (default).
+    - 'lru': keep at most maxsize instances, evicting the least recently used.
+    - 'strong': keep every instance forever.
+    - 'off': never intern; every construction builds a new instance.
+
+    Equal instances compare and hash equal in every mode, so turning interning
+    off or evicting an instance only costs recomputation, never correctness.
+    """
+
+    def __init__(self, name, mode='weak', maxsize=None):
+        self.name = name
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.configure(mode, maxsize)
+        _POOLS[name] = self
+
+    def configure(self, mode='weak', maxsize=None):
+        """
+        Switch the pool to another mode, dropping the instances it holds.
+
+        Parameters:
+        mode (str): One of 'weak', 'lru', 'strong' or 'off'.
+        maxsize (int or None): Capacity of the pool in 'lru' mode.
+
+        Raises:
+        ValueError: If the mode is unknown or 'lru' is requested without a positive maxsize.
+        """
+        if mode not in INTERN_MODES:
+            raise ValueError(f"mode must be one of {INTERN_MODES}.")
+        if mode == 'lru' and (not isinstance(maxsize, int) or maxsize < 1):
+            raise ValueError("The 'lru' mode needs a positive integer maxsize.")
+        self.mode = mode
+        self.maxsize = maxsize if mode == 'lru' else None
+        if mode == 'weak':
+            self._store = WeakValueDictionary()
+        elif mode == 'lru':
+            self._store = OrderedDict()
+        else:
+            self._store = {}
+
+    def get(self, key, default=None):
+        instance = self._store.get(key)
+        if instance is None:
+            self.misses += 1
+            return default
+        self.hits += 1
+        if self.mode == 'lru':
+            self._store.move_to_end(key)
+        return instance
+
+    def __setitem__(self, key, instance):
+        if self.mode == 'off':
+            return
+        self._store[key] = instance
+        if self.mode == 'lru' and len(self._store) > self.maxsize:
+            self._store.popitem(last=False)
+            self.evictions += 1
+
+    def __getitem__(self, key):
+        instance = self.get(key)
+        if instance is None:
+            raise KeyError(key)
+        return instance
+
+    def __contains__(self, key):
+        return key in self._store
+
+    def __len__(self):
+        return len(self._store)
+
+    def clear(self):
+        self._store.clear()
+
+    def reset_stats(self):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def stats(self):
+        """
+        Report the size and hit rate of the pool.
+
+        Returns:
+        dict: The mode, size, maxsize, hits, misses, evictions and hit_rate of the pool.
+        """
+        lookups = self.hits + self.misses
+        return {
+            'mode': self.mode,
+            'size': len(self._store),
+            'maxsize': self.maxsize,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+        }
+
+    def __repr__(self):
+        return f"InternPool(name={self.name!r}, mode={self.mode!r}, size={len(self)})"
+
+def cached_method(method):
+    """
+    Cache a method's results on the instance it is called on.
+
+    Unlike functools.lru_cache on a method, the cache lives in the instance's
+    own __dict__, so it is freed together with the instance instead of keeping
+    the instance alive. Positional arguments must be hashable.
+
+    Parameters:
+    method (callable): The method to cache.
+
+    Returns:
+    callable: The caching method.
+    """
+    name = method.__name__
+    stats = _METHOD_STATS.setdefault(method.__qualname__, [0, 0])
+
+    @wraps(method)
+    def wrapper(self, *args):
+        try:
+            cache = self._method_cache
+        except AttributeError:
+            cache = self._method_cache = {}
+        key = (name, args)
+        try:
+            value = cache[key]
+        except KeyError:
+            stats[1] += 1
+            value = cache[key] = method(self, *args)
+            return value
+        stats[0] += 1
+        return value
+
+    return wrapper
+
+def seed_method_cache(instance, name, value, args=()):
+    """
+    Store a known result in the cache of a cached_method, unless one is already there.
+
+    Used when a result is cheaper to derive from a related object than to
+    compute, such as the minimal generators of a child in the semigroup tree.
+
+    Parameters:
+    instance (object): The instance whose cache receives the value.
+    name (str): The name of the cached method.
+    value (object): The result to store.
+    args (tuple): The positional arguments the result is for.
+    """
+    try:
+        cache = instance._method_cache
+    except AttributeError:
+        cache = instance._method_cache = {}
+    cache.setdefault((name, args), value)
+
+def configure_interning(mode='weak', maxsize=None, pools=None):
+    """
+    Set the interning mode of the instance pools.
+
+    Parameters:
+    mode (str): One of 'weak', 'lru', 'strong' or 'off'.
+    maxsize (int or None): Capacity of each pool in 'lru' mode.
+    pools (list of str or None): Names of the pools to configure, for example
+        ['NumericalSemigroup']; by default every pool.
+    """
+    for name in (pools if pools is not None else list(_POOLS)):
+        _POOLS[name].configure(mode, maxsize)
+
+def intern_stats():
+    """
+    Report the size and hit rate of every instance pool.
+
+    Returns:
+    dict: A dictionary mapping pool names to the output of InternPool.stats.
+    """
+    return {name: pool.stats() for name, pool in _POOLS.items()}
+
+def cache_stats():
+    """
+    Report the hit rate of every method decorated with cached_method.
+
+    Returns:
+    dict: A dictionary mapping method names to their hits, misses and hit_rate.
+    """
+    report = {}
+    for name, (hits, misses) in _METHOD_STATS.items():
+        calls = hits + misses
+        report[name] = {'hits': hits, 'misses': misses, 'hit_rate': hits / calls if calls else 0.0}
+    return report
+
+def clear_intern_pools():
+    """
+    Empty every instance pool. Instances that are still referenced stay valid.
+    """
+    for pool in _POOLS.values():
+        pool.clear()
+
+def reset_stats():
+    """
+    Reset the counters of every instance pool and cached method.
+    """
+    for pool in _POOLS.values():
+        pool.reset_stats()
+    for counters in _METHOD_STATS.values():
+        counters[0] = counters[1] = 0
@@ -0,0 +1,116 @@
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+
+__all__ = ['resolve_processes', 'parallel_map', 'parallel_worklist']
+
+_DONE = object()
+
+def resolve_processes(processes):
+    """
+    Resolve a worker count, where None means one worker per CPU.
+
+    Parameters:
+    processes (int or None): The requested number of worker processes.
+
+    Returns:
+    int: The number of worker processes to use.
+
+    Raises:
+    ValueError: If processes is not a positive integer or None.
+    """
+    if processes is None:
+        return os.cpu_count() or 1
+    if not isinstance(processes, int) or processes < 1:
+        raise ValueError("processes must be a positive integer or None.")
+    return processes
+
+def parallel_map(func, tasks, processes=None, ordered=True, window=None):
+    """
+    Apply func to each task in a process pool, yielding the results lazily.
+
+    Tasks are handed out one at a time and a new one is submitted whenever a
+    result comes back, so a slow task never holds up a fixed chunk of others
+    and at most window tasks are in flight. With a single process everything
+    runs in the calling process.
+
+    Parameters:
+    func (callable): A picklable function of one argument.
+    tasks (iterable): The arguments, consumed lazily.
+    processes (int or None): Number of worker processes; None uses every CPU.
+    ordered (bool): Yield results in task order rather than completion order.
+    window (int or None): Maximum number of tasks in flight, by default four per process.
+
+    Yields:
+    The value of func on each task.
+    """
+    processes = resolve_processes(processes)
+    tasks = iter(tasks)
+    if processes == 1:
+        for task in tasks:
+            yield func(task)
+        return
+
+    window = window or 4 * processes
+    with ProcessPoolExecutor(max_workers=processes) as pool:
+        if ordered:
+            pending = deque()
+            for task in tasks:
+                pending.append(pool.submit(func, task))
+                if len(pending) >= window:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        else:
+            pending = set()
+            exhausted = False
+            while True:
+                while not exhausted and len(pending) < window:
+                    task = next(tasks, _DONE)
+                    if task is _DONE:
+                        exhausted = True
+                    else:
+                        pending.add(pool.submit(func, task))
+                if not pending:
+                    return
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+
+def parallel_worklist(func, tasks, processes=None, window=None):
+    """
+    Run a work list in a process pool where tasks may split off new tasks.
+
+    func returns a pair (result, new_tasks). The new tasks go to the front of
+    the queue, so work that a task hands back is picked up by the next idle
+    worker before any fresh task is started.
+
+    Parameters:
+    func (callable): A picklable function of one argument returning (result, new_tasks).
+    tasks (iterable): The initial tasks.
+    processes (int or None): Number of worker processes; None uses every CPU.
+    window (int or None): Maximum number of tasks in flight, by default two per process.
+
+    Yields:
+    The result of every task, in completion order.
+    """
+    processes = resolve_processes(processes)
+    queue = deque(tasks)
+    if processes == 1:
+        while queue:
+            result, new_tasks = func(queue.popleft())
+            queue.extendleft(reversed(new_tasks))
+            yield result
+        return
+
+    window = window or 2 * processes
+    with ProcessPoolExecutor(max_workers=processes) as pool:
+        pending = set()
+        while queue or pending:
+            while queue and len(pending) < window:
+                pending.add(pool.submit(func, queue.popleft()))
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                result, new_tasks = future.result()
+                queue.extendleft(reversed(new_tasks))
+                yield result
@@ -0,0 +1,288 @@
+import atexit
+import json
+import os
+import sys
+import time
+from functools import wraps
+from .cache import intern_stats, cache_stats
+
+__all__ = ['profile', 'Profiler', 'DEFAULT_METHODS']
+
+# Methods timed by default, by defining class. A method is patched on the class
+# that defines it, so inherited methods are reported under the base class.
+DEFAULT_METHODS = {
+    'NumericalSet': [
+        '_from_mask', 'atom_monoid_gaps', 'partition', 'small_elements', 'multiplicity',
+    ],
+    'NumericalSemigroup': [
+        '_validate', '_from_apery_set', '_multiplicity_apery_set', 'apery_set',
+        'minimal_generating_set', 'pseudofrobenius_numbers', 'special_gaps',
+        'effective_weight', 'apery_weight', 'gap_poset', 'void_poset',
+        'remove_minimal_generator', 'get_children', 'add_specialgap', 'get_frobchildren',
+    ],
+    'Partition': [
+        '__new__', '__init__', 'conjugate_list', 'hook_length_array', 'hook_lengths',
+        'atom_partition', 'profile', 'gaps',
+    ],
+    'Poset': [
+        '__new__', '__init__', 'validate', 'cover_relations', 'ranks', 'width',
+        'antichains_count', 'linear_extensions_count',
+    ],
+}
+
+# Tree walks whose nodes are counted, as (module, function name, kind). A 'walk'
+# is a generator whose yielded nodes are counted; a 'children' function
+# returns the children of one node of a recursive search, which are counted.
+_TRAVERSALS = [
+    ('pocketpartition.core.genus', '_walk', 'walk'),
+    ('pocketpartition.core.catalog', '_walk', 'walk'),
+    ('pocketpartition.core.frobenius', '_walk', 'walk'),
+    ('pocketpartition.core.semigroup_partitions', '_walk_sizes', 'walk'),
+    ('pocketpartition.core.atom_monoid', '_children', 'children'),
+]
+
+_active = None
+
+def _classes():
+    from ..core.numerical_set import NumericalSet
+    from ..core.numerical_semigroup import NumericalSemigroup
+    from ..core.partition import Partition
+    from ..core.poset import Poset
+    return {cls.__name__: cls for cls in (NumericalSet, NumericalSemigroup, Partition, Poset)}
+
+def _module(suffix):
+    # The package may be imported as pocketpartition or as src.pocketpartition.
+    base = __name__.rsplit('.utils.', 1)[0]
+    return sys.modules.get(base + suffix[len('pocketpartition'):])
+
+def _delta(after, before, keys):
+    report = {}
+    for name, stats in after.items():
+        previous = before.get(name, {})
+        counts = {key: stats[key] - previous.get(key, 0) for key in keys}
+        lookups = counts['hits'] + counts['misses']
+        if lookups:
+            counts['hit_rate'] = counts['hits'] / lookups
+            report[name] = counts
+    return report
+
+class Profiler:
+    """
+    Count and time calls to the hot methods of the package while active.
+
+    Entering the profiler replaces the listed methods with timing wrappers
+    and exiting puts the originals back, so there is no cost at all outside
+    a profiling session. Times are inclusive: a method that calls another
+    timed method is charged for both. Intern pool and method cache counters
+    are reported as the change over the session, and the nodes yielded by
+    the streaming tree walks give a traversal rate. Work done in worker
+    processes is not seen.
+
+    Usage:
+        with profile() as prof:
+            CountWithGenus(18)
+        print(prof.report())
+        prof.to_json('profile.json')
+    """
+
+    def __init__(self, methods=None):
+        self._methods = DEFAULT_METHODS if methods is None else methods
+        self._timings = {}
+        self._patched = []
+        self._nodes = 0
+        self._elapsed = 0.0
+        self._start = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def start(self):
+        global _active
+        if _active is not None:
+            raise RuntimeError("Another profiler is already active.")
+        _active = self
+        try:
+            classes = _classes()
+            for class_name, names in self._methods.items():
+                cls = classes[class_name]
+                for name in names:
+                    if name in cls.__dict__:
+                        self._patch(cls, name, f"{class_name}.{name}")
+            for module_name, name, kind in _TRAVERSALS:
+                module = _module(module_name)
+                if module is not None and name in module.__dict__:
+                    self._patch_walk(module, name, kind)
+        except BaseException:
+            # Leave nothing patched and no profiler active.
+            self._unpatch()
+            _active = None
+            raise
+        self._pools_before = intern_stats()
+        self._caches_before = cache_stats()
+        self._start = time.perf_counter()
+
+    def stop(self):
+        global _active
+        if self._start is None:
+            return
+        self._elapsed += time.perf_counter() - self._start
+        self._start = None
+        self._pools_after = intern_stats()
+        self._caches_after = cache_stats()
+        self._unpatch()
+        _active = None
+
+    def _unpatch(self):
+        for owner, name, original in reversed(self._patched):
+            setattr(owner, name, original)
+        self._patched = []
+
+    def _timed(self, function, label):
+        timing = self._timings.setdefault(label, [0, 0.0])
+        clock = time.perf_counter
+
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            start = clock()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                timing[0] += 1
+                timing[1] += clock() - start
+
+        return wrapper
+
+    def _patch(self, cls, name, label):
+        original = cls.__dict__[name]
+        if isinstance(original, classmethod):
+            replacement = classmethod(self._timed(original.__func__, label))
+        elif isinstance(original, staticmethod):
+            replacement = staticmethod(self._timed(original.__func__, label))
+        else:
+            replacement = self._timed(original, label)
+        setattr(cls, name, replacement)
+        self._patched.append((cls, name, original))
+
+    def _patch_walk(self, module, name, kind='walk'):
+        original = module.__dict__[name]
+        profiler = self
+
+        if kind == 'children':
+            @wraps(original)
+            def walk(*args, **kwargs):
+                children = original(*args, **kwargs)
+                profiler._nodes += len(children)
+                return children
+        else:
+            @wraps(original)
+            def walk(*args, **kwargs):
+                for node in original(*args, **kwargs):
+                    profiler._nodes += 1
+                    yield node
+
+        setattr(module, name, walk)
+        self._patched.append((module, name, original))
+
+    def summary(self):
+        """
+        Summarize the session.
+
+        Returns:
+        dict: With keys 'elapsed' (seconds), 'methods' (calls, total and mean
+        seconds per method, slowest first), 'intern_pools' and 'method_caches'
+        (hits, misses and hit_rate over the session) and 'traversal' (nodes
+        walked and nodes per second of session time).
+        """
+        elapsed = self._elapsed
+        if self._start is not None:
+            elapsed += time.perf_counter() - self._start
+            pools, caches = intern_stats(), cache_stats()
+        else:
+            pools, caches = getattr(self, '_pools_after', {}), getattr(self, '_caches_after', {})
+        methods = {
+            label: {'calls': calls, 'time': total, 'mean': total / calls}
+            for label, (calls, total) in sorted(self._timings.items(), key=lambda item: -item[1][1])
+            if calls
+        }
+        return {
+            'elapsed': elapsed,
+            'methods': methods,
+            'intern_pools': _delta(pools, getattr(self, '_pools_before', {}), ('hits', 'misses')),
+            'method_caches': _delta(caches, getattr(self, '_caches_before', {}), ('hits', 'misses')),
+            'traversal': {
+                'nodes': self._nodes,
+                'nodes_per_second': self._nodes / elapsed if elapsed else 0.0,
+            },
+        }
+
+    def to_json(self, path=None):
+        """
+        Export the summary as JSON.
+
+        Parameters:
+        path (str or None): Where to write it; if None the JSON text is returned.
+
+        Returns:
+        str or None: The JSON text when no path is given.
+        """
+        text = json.dumps(self.summary(), indent=2)
+        if path is None:
+            return text
+        with open(path, 'w') as handle:
+            handle.write(text + '\n')
+
+    def report(self):
+        """
+        Format the summary as a plain-text table.
+
+        Returns:
+        str: The report.
+        """
+        summary = self.summary()
+        lines = [f"elapsed {summary['elapsed']:.4f} s"]
+        lines.append(f"{'method':<48} {'calls':>10} {'total (s)':>12} {'mean (us)':>12}")
+        for label, row in summary['methods'].items():
+            lines.append(f"{label:<48} {row['calls']:>10} {row['time']:>12.4f} {row['mean'] * 1e6:>12.2f}")
+        for title in ('intern_pools', 'method_caches'):
+            if summary[title]:
+                lines.append(f"{title:<48} {'hits':>10} {'misses':>12} {'hit rate':>12}")
+                for name, row in summary[title].items():
+                    lines.append(f"{name:<48} {row['hits']:>10} {row['misses']:>12} {row['hit_rate']:>12.2%}")
+        traversal = summary['traversal']
+        if traversal['nodes']:
+            lines.append(f"tree nodes walked: {traversal['nodes']} ({traversal['nodes_per_second']:.0f} per second)")
+        return '\n'.join(lines)
+
+def profile(methods=None):
+    """
+    Return a profiler to use as a context manager.
+
+    Parameters:
+    methods (dict or None): Class name to method names to time; by default DEFAULT_METHODS.
+
+    Returns:
+    Profiler: The profiler.
+    """
+    return Profiler(methods)
+
+def _profile_from_environment():
+    # POCKETPARTITION_PROFILE=1 profiles the whole run and prints the report at
+    # exit; any other value is taken as a path for the JSON summary.
+    setting = os.environ.get('POCKETPARTITION_PROFILE')
+    if not setting or setting == '0' or _active is not None:
+        return
+    profiler = profile()
+    profiler.start()
+
+    def finish():
+        profiler.stop()
+        if setting == '1':
+            print(profiler.report(), file=sys.stderr)
+        else:
+            profiler.to_json(setting)
+
+    atexit.register(finish)
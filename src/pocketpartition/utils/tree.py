@@ -1,3 +1,5 @@
+from collections import deque
+
 def bfs_at_depth(root, g):
     """
     Perform a BFS on a tree and return the nodes at depth g.
@@ -5,16 +7,19 @@ def bfs_at_depth(root, g):
     :param root: The starting node of the tree.
     :param g: The depth at which to collect nodes.
     :return: A list of nodes at depth g.
+
+    For numerical semigroups, core.genus.IterWithGenus and MapWithGenus walk
+    the same tree without keeping it in memory, optionally in parallel.
     """
     if g < 0:
         return []
 
     # Initialize the queue with the root node and its depth (0)
-    queue = [(root, 0)]
+    queue = deque([(root, 0)])
     result = []
 
     while queue:
-        current_node, depth = queue.pop(0)
+        current_node, depth = queue.popleft()
         
         # If we reach the desired depth, add the node to the result list
         if depth == g:
@@ -1,93 +1,182 @@
 from .tikz import generate_latex_table, generate_ferrers_tikz, generate_hasse_tikz
+from ..utils.parallel import parallel_map
+
 def generate_content_pages(label, subsections, data, partition, gap_poset, void_poset):
-    latex_code = f"\\subsection{{{label}}}\n"
+    parts = [f"\\subsection{{{label}}}\n"]
 
     # Top row: Invariants table and Partition diagram
-    latex_code += "\\noindent\\begin{minipage}{0.6\\textwidth}\n"
-    latex_code += "\\subsubsection*{Invariants}\n"
-    latex_code += "\\centering\n"
-    latex_code += generate_latex_table(data)
-    latex_code += "\\end{minipage}%\n"
-    latex_code += "\\begin{minipage}{0.4\\textwidth}\n"
-    latex_code += "\\subsubsection*{Partition}\n"
-    latex_code += "\\centering\n"
-    latex_code += generate_ferrers_tikz(partition, display_hooks=True, box_size=0.4)
-    latex_code += "\\end{minipage}\n"
-
-    latex_code += "\\vspace{1cm}\n"  # Add some vertical space
-    latex_code += "\\noindent \\newline"  # Ensure the next line starts at the left margin
+    parts.append("\\noindent\\begin{minipage}{0.6\\textwidth}\n")
+    parts.append("\\subsubsection*{Invariants}\n")
+    parts.append("\\centering\n")
+    parts.append(generate_latex_table(data))
+    parts.append("\\end{minipage}%\n")
+    parts.append("\\begin{minipage}{0.4\\textwidth}\n")
+    parts.append("\\subsubsection*{Partition}\n")
+    parts.append("\\centering\n")
+    parts.append(generate_ferrers_tikz(partition, display_hooks=True, box_size=0.4))
+    parts.append("\\end{minipage}\n")
+
+    parts.append("\\vspace{1cm}\n")  # Add some vertical space
+    parts.append("\\noindent \\newline")  # Ensure the next line starts at the left margin
 
     # Bottom row: Gap Poset and Void Poset in two columns
-    latex_code += "\\begin{minipage}{0.48\\textwidth}\n"
-    latex_code += "\\subsubsection*{Gap Poset}\n"
-    latex_code += "\\centering\n"
+    parts.append("\\begin{minipage}{0.48\\textwidth}\n")
+    parts.append("\\subsubsection*{Gap Poset}\n")
+    parts.append("\\centering\n")
     elements, relations = gap_poset
-    latex_code += generate_hasse_tikz(elements, relations, node_size=0.3, vertical_spacing=0.8, horizontal_spacing=0.8)
-    latex_code += "\\end{minipage}%\n"
-    latex_code += "\\hfill"  # Add horizontal space between posets
-    latex_code += "\\begin{minipage}{0.48\\textwidth}\n"
-    latex_code += "\\subsubsection*{Void Poset}\n"
-    latex_code += "\\centering\n"
+    parts.append(generate_hasse_tikz(elements, relations, node_size=0.3, vertical_spacing=0.8, horizontal_spacing=0.8))
+    parts.append("\\end{minipage}%\n")
+    parts.append("\\hfill")  # Add horizontal space between posets
+    parts.append("\\begin{minipage}{0.48\\textwidth}\n")
+    parts.append("\\subsubsection*{Void Poset}\n")
+    parts.append("\\centering\n")
     elements, relations = void_poset
-    latex_code += generate_hasse_tikz(elements, relations, node_size=0.3, vertical_spacing=0.8, horizontal_spacing=0.8)
-    latex_code += "\\end{minipage}\n"
+    parts.append(generate_hasse_tikz(elements, relations, node_size=0.3, vertical_spacing=0.8, horizontal_spacing=0.8))
+    parts.append("\\end{minipage}\n")
 
-    return latex_code
+    return ''.join(parts)
 
 def generate_partition_page(label, partition, size=0.4, hooks=True):
-    # Start the document
-    latex_code = ""
-
-    latex_code += f"\\section*{{{label}}}\n"
+    parts = [f"\\section*{{{label}}}\n"]
 
     # Center the partition diagram on the page
-    latex_code += "\\vfill\n"  # Add vertical space to push the diagram to the center
-    latex_code += "\\begin{center}\n"
-    latex_code += generate_ferrers_tikz(partition, display_hooks=hooks, box_size=size)
-    latex_code += "\\end{center}\n"
-    latex_code += "\\vfill\n"  # Add vertical space to balance the page
+    parts.append("\\vfill\n")  # Add vertical space to push the diagram to the center
+    parts.append("\\begin{center}\n")
+    parts.append(generate_ferrers_tikz(partition, display_hooks=hooks, box_size=size))
+    parts.append("\\end{center}\n")
+    parts.append("\\vfill\n")  # Add vertical space to balance the page
 
-    return latex_code
+    return ''.join(parts)
 
 def wrap_with_section(content:str, section_title:str):
-    latex_code = f"\\section{section_title}\n"
-    latex_code += content
-    return latex_code
+    return f"\\section{section_title}\n" + content
+
+def document_header():
+    """
+    Return the LaTeX preamble of a catalog, up to and including the table of contents.
+    """
+    parts = [
+        "\\documentclass[a4paper]{article}\n",
+        "\\usepackage[margin=0.5in]{geometry}\n",
+        "\\usepackage{booktabs}\n",
+        "\\usepackage{tikz}\n",
+        "\\usepackage{ytableau}\n",
+        "\\usepackage{hyperref}\n",
+        "\\usepackage{fancyhdr}\n",
+        "\\usepackage{multicol}\n",
+        "\\usepackage{titlesec}\n",
+
+        # Set up fancy headers and footers
+        "\\pagestyle{fancy}\n",
+        "\\fancyhf{}\n",
+        "\\fancyhead[L]{NumericalSemigroup Catalog}\n",
+        "\\fancyfoot[C]{\\thepage}\n",
+
+        # Adjust section formatting
+        "\\titleformat{\\section}{\\normalfont\\Large\\bfseries}{}{0em}{}\n",
+        "\\titleformat{\\subsection}{\\normalfont\\large\\bfseries}{}{0em}{}\n",
+
+        # Adjust spacing
+        "\\titlespacing*{\\section}{0pt}{12pt plus 4pt minus 2pt}{0pt plus 2pt minus 2pt}\n",
+        "\\titlespacing*{\\subsection}{0pt}{12pt plus 4pt minus 2pt}{0pt plus 2pt minus 2pt}\n",
+
+        # Start the document
+        "\\begin{document}\n",
+        "\\tableofcontents\n",
+        "\\newpage\n",
+    ]
+    return ''.join(parts)
+
+def document_footer():
+    return "\\end{document}\n"
 
 def wrap_with_headers_footers(content):
-    latex_code = "\\documentclass[a4paper]{article}\n"
-    latex_code += "\\usepackage[margin=0.5in]{geometry}\n"
-    latex_code += "\\usepackage{booktabs}\n"
-    latex_code += "\\usepackage{tikz}\n"
-    latex_code += "\\usepackage{ytableau}\n"
-    latex_code += "\\usepackage{hyperref}\n"
-    latex_code += "\\usepackage{fancyhdr}\n"
-    latex_code += "\\usepackage{multicol}\n"
-    latex_code += "\\usepackage{titlesec}\n"
-    
-    # Set up fancy headers and footers
-    latex_code += "\\pagestyle{fancy}\n"
-    latex_code += "\\fancyhf{}\n"
-    latex_code += "\\fancyhead[L]{NumericalSemigroup Catalog}\n"
-    latex_code += "\\fancyfoot[C]{\\thepage}\n"
-    
-    # Adjust section formatting
-    latex_code += "\\titleformat{\\section}{\\normalfont\\Large\\bfseries}{}{0em}{}\n"
-    latex_code += "\\titleformat{\\subsection}{\\normalfont\\large\\bfseries}{}{0em}{}\n"
-    
-    # Adjust spacing
-    latex_code += "\\titlespacing*{\\section}{0pt}{12pt plus 4pt minus 2pt}{0pt plus 2pt minus 2pt}\n"
-    latex_code += "\\titlespacing*{\\subsection}{0pt}{12pt plus 4pt minus 2pt}{0pt plus 2pt minus 2pt}\n"
-    
-    # Start the document
-    latex_code += "\\begin{document}\n"
-    latex_code += "\\tableofcontents\n"
-    latex_code += "\\newpage\n"
-
-    # Add the main content
-    latex_code += content
-
-    # End the document
-    latex_code += "\\end{document}\n"
-
-    return latex_code
\ No newline at end of file
+    return ''.join((document_header(), content, document_footer()))
+
+def semigroup_invariants(S):
+    """
+    Collect the invariants shown in the table of a catalog page.
+
+    Parameters:
+    S (NumericalSemigroup): The numerical semigroup.
+
+    Returns:
+    dict: The invariants, keyed by their column label.
+    """
+    return {
+        'Genus': S.genus,
+        'Frobenius': S.frobenius_number,
+        'Multiplicity': S.multiplicity(),
+        'Type': S.type(),
+        'Embedding dim.': len(S.minimal_generating_set()),
+    }
+
+def generate_semigroup_page(S, label=None):
+    """
+    Render the catalog page of a numerical semigroup.
+
+    The page shows the invariants table, the Ferrers diagram of the partition
+    with its hook lengths, and the Hasse diagrams of the gap and void posets.
+
+    Parameters:
+    S (NumericalSemigroup): The numerical semigroup.
+    label (str or None): The subsection title; by default the minimal generators.
+
+    Returns:
+    str: The LaTeX code of the page.
+    """
+    from ..core.numerical_functions import get_gap_poset, get_void_poset
+    from ..core.partition import Partition
+
+    if label is None:
+        generators = ', '.join(map(str, S.minimal_generating_set()))
+        label = f"$\\langle {generators} \\rangle$"
+    if S.genus:
+        hook_lengths = Partition(S.partition()).hook_lengths()
+        gap_poset = get_gap_poset(S)
+        void_poset = get_void_poset(S)
+        gap_poset = (sorted(gap_poset.elements), sorted(gap_poset.cover_relations()))
+        void_poset = (sorted(void_poset.elements), sorted(void_poset.cover_relations()))
+    else:
+        hook_lengths, gap_poset, void_poset = [], ([], []), ([], [])
+    page = generate_content_pages(label, None, semigroup_invariants(S), hook_lengths, gap_poset, void_poset)
+    return page + "\\newpage\n"
+
+def _render_page(task):
+    S, label = task
+    return generate_semigroup_page(S, label)
+
+def write_tex_catalog(semigroups, sink, labels=None, processes=1, window=None):
+    """
+    Write a LaTeX catalog of numerical semigroups, one page per semigroup.
+
+    The semigroups are consumed lazily and each page is written as soon as it
+    is rendered, so a whole genus layer can be cataloged without holding the
+    document in memory. With several processes the pages are rendered by a
+    worker pool with at most window pages in flight, and written in input order.
+
+    Parameters:
+    semigroups (iterable of NumericalSemigroup): The semigroups, for example IterWithGenus(g).
+    sink (str or file-like): A path to write to, or an object with a write method.
+    labels (iterable of str or None): Page titles; by default the minimal generators of each semigroup.
+    processes (int or None): Number of worker processes; None uses every CPU.
+    window (int or None): Maximum number of pages rendered ahead of the writer.
+
+    Returns:
+    int: The number of pages written.
+    """
+    if isinstance(sink, str):
+        with open(sink, 'w', encoding='utf-8') as handle:
+            return write_tex_catalog(semigroups, handle, labels, processes, window)
+
+    if labels is None:
+        tasks = ((S, None) for S in semigroups)
+    else:
+        tasks = zip(semigroups, labels)
+    sink.write(document_header())
+    count = 0
+    for page in parallel_map(_render_page, tasks, processes=processes, window=window):
+        sink.write(page)
+        count += 1
+    sink.write(document_footer())
+    return count
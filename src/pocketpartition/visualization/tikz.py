@@ -1,129 +1,224 @@
-from collections import defaultdict, deque
+from collections import deque
 
-def topological_sort(elements, relations):
-    # Initialize in-degree dictionary
-    in_degree = {element: 0 for element in elements}
+def _adjacency(elements, relations):
+    children = {element: [] for element in elements}
+    parents = {element: [] for element in elements}
     for parent, child in relations:
-        if parent not in in_degree or child not in in_degree:
+        if parent not in children or child not in children:
             raise ValueError(f"Element '{parent}' or '{child}' not found in elements list.")
-        in_degree[child] += 1
+        children[parent].append(child)
+        parents[child].append(parent)
+    return children, parents
+
+def topological_sort(elements, relations, children=None):
+    """
+    Sort the elements so that every parent comes before its children.
+
+    Kahn's algorithm on adjacency lists, so every relation is looked at once.
+    Elements on a cycle cannot be sorted and are appended at the end.
+
+    Parameters:
+    elements (list): The nodes.
+    relations (list of tuple): The edges (parent, child).
+    children (dict or None): Precomputed adjacency lists, mapping each element to its children.
+
+    Returns:
+    list: The elements in topological order.
+    """
+    if children is None:
+        children, _ = _adjacency(elements, relations)
+    in_degree = {element: 0 for element in elements}
+    for element in elements:
+        for child in children[element]:
+            in_degree[child] += 1
 
-    # Initialize queue with nodes having zero in-degree
     queue = deque([element for element in elements if in_degree[element] == 0])
     sorted_elements = []
 
     while queue:
         element = queue.popleft()
         sorted_elements.append(element)
-        for parent, child in relations:
-            if parent == element:
-                in_degree[child] -= 1
-                if in_degree[child] == 0:
-                    queue.append(child)
+        for child in children[element]:
+            in_degree[child] -= 1
+            if in_degree[child] == 0:
+                queue.append(child)
 
-    # If the sorted elements do not include all elements, add isolated elements
+    # If the sorted elements do not include all elements, add the remaining ones
     if len(sorted_elements) != len(elements):
-        for element in elements:
-            if element not in sorted_elements:
-                sorted_elements.append(element)
+        seen = set(sorted_elements)
+        sorted_elements.extend(element for element in elements if element not in seen)
 
     return sorted_elements
 
-def compute_layout(elements, relations):
-    sorted_elements = topological_sort(elements, relations)
+def _count_crossings(upper, lower, children):
+    # Edges between two consecutive levels cross when their endpoints are in
+    # opposite orders; count the inversions with a Fenwick tree.
+    position = {node: i for i, node in enumerate(lower)}
+    targets = []
+    for node in upper:
+        targets.extend(sorted(position[child] for child in children[node] if child in position))
+    tree = [0] * (len(lower) + 1)
+    crossings = 0
+    for seen, target in enumerate(targets):
+        i = target + 1
+        below = 0
+        while i > 0:
+            below += tree[i]
+            i -= i & -i
+        crossings += seen - below
+        i = target + 1
+        while i <= len(lower):
+            tree[i] += 1
+            i += i & -i
+    return crossings
+
+def _total_crossings(levels, children):
+    return sum(_count_crossings(levels[k], levels[k + 1], children) for k in range(len(levels) - 1))
+
+def _barycentric_sweep(levels, neighbours, reverse):
+    # Reorder each level by the mean position of its neighbours on the levels
+    # already placed; nodes without such neighbours keep their own position.
+    order = range(len(levels) - 1, -1, -1) if reverse else range(len(levels))
+    position = {}
+    for k in order:
+        level = levels[k]
+        scale = max(len(level) - 1, 1)
+        keys = []
+        for i, node in enumerate(level):
+            placed = [position[other] for other in neighbours[node] if other in position]
+            keys.append((sum(placed) / len(placed) if placed else i / scale, i))
+        level[:] = [node for _, node in sorted(zip(keys, level))]
+        for i, node in enumerate(level):
+            position[node] = i / scale
+
+def compute_ranks(elements, relations):
+    """
+    Compute the rank of every element of a Hasse diagram.
 
-    rank = {element: None for element in elements}
-    rank[sorted_elements[0]] = 0  # Start with the first element in topologically sorted order
+    Elements with no parent have rank 0 and every child sits one rank below
+    its lowest parent, i.e. the rank is the length of the longest path from a
+    source. Ranks are propagated along adjacency lists in topological order,
+    in O(V + R).
 
-    for element in sorted_elements:
-        if rank[element] is None:
-            rank[element] = 0  # Assign rank 0 to isolated or disconnected elements
-        for parent, child in relations:
-            if parent == element:
-                if rank[child] is None:
-                    rank[child] = rank[element] + 1
-                else:
-                    rank[child] = max(rank[child], rank[element] + 1)
+    Parameters:
+    elements (list): The nodes.
+    relations (list of tuple): The edges (parent, child).
 
-    # Group elements by their rank
-    levels = defaultdict(list)
+    Returns:
+    dict: A dictionary mapping each element to its rank.
+    """
+    children, _ = _adjacency(elements, relations)
+    rank = {element: 0 for element in elements}
+    for element in topological_sort(elements, relations, children):
+        for child in children[element]:
+            rank[child] = max(rank[child], rank[element] + 1)
+    return rank
+
+def compute_layout(elements, relations, crossing_passes=4):
+    """
+    Compute positions for drawing a Hasse diagram.
+
+    Elements are placed in rows by rank (see compute_ranks) and the rows are
+    reordered by barycentric sweeps, alternately downwards by the positions of
+    parents and upwards by the positions of children, keeping the order with
+    the fewest crossings between consecutive rows. Every sweep is linear in the
+    number of relations up to sorting the rows, so the layout scales to posets
+    with thousands of elements.
+
+    Parameters:
+    elements (list): The nodes.
+    relations (list of tuple): The edges (parent, child), typically the cover relations.
+    crossing_passes (int): Number of down-and-up sweeps; 0 keeps the rows in element order.
+
+    Returns:
+    dict: A dictionary mapping each element to its (x, y) position, with nodes
+    2 units apart in a row, rows centred on each other and rank r at y = -2r.
+    """
+    children, parents = _adjacency(elements, relations)
+    rank = compute_ranks(elements, relations)
+    levels = [[] for _ in range(max(rank.values()) + 1)] if rank else []
     for element in elements:
         levels[rank[element]].append(element)
 
-    # Calculate positions: x position based on the order within the rank, y position based on the rank
+    best = [list(level) for level in levels]
+    fewest = _total_crossings(best, children)
+    for _ in range(crossing_passes):
+        if not fewest:
+            break
+        _barycentric_sweep(levels, parents, reverse=False)
+        _barycentric_sweep(levels, children, reverse=True)
+        crossings = _total_crossings(levels, children)
+        if crossings < fewest:
+            best = [list(level) for level in levels]
+            fewest = crossings
+
+    width = max((len(level) for level in best), default=0)
     positions = {}
-    child_count = defaultdict(int)
-    for parent, child in relations:
-        child_count[parent] += 1
-
-    for level, nodes in levels.items():
-        for index, node in enumerate(nodes):
-            if level > 0:
-                # Align node directly below its parent if the parent has only one child
-                parent_x = None
-                for parent, child in relations:
-                    if child == node and rank[parent] == level - 1 and child_count[parent] == 1:
-                        if parent in positions:
-                            parent_x = positions[parent][0]
-                        break
-                if parent_x is not None:
-                    positions[node] = (parent_x, -level * 2)
-                else:
-                    # Use original positioning based on index
-                    x = 0 if index == 0 else positions[nodes[index - 1]][0] + 2
-                    positions[node] = (x, -level * 2)
-            else:
-                # Position root level nodes based on index
-                x = 0 if index == 0 else positions[nodes[index - 1]][0] + 2
-                positions[node] = (x, -level * 2)
-
+    for k, level in enumerate(best):
+        offset = width - len(level)
+        for i, node in enumerate(level):
+            positions[node] = (offset + 2 * i, -k * 2)
     return positions
 
-def generate_hasse_tikz(elements, relations, node_size=0.5, vertical_spacing=1.0, horizontal_spacing=1.0):
+def generate_hasse_tikz(elements, relations, node_size=0.5, vertical_spacing=1.0, horizontal_spacing=1.0, positions=None):
+    """
+    Generate TikZ code for a Hasse diagram.
+
+    Parameters:
+    elements (list): The nodes.
+    relations (list of tuple): The edges (parent, child) to draw.
+    node_size (float): The minimum node size in cm.
+    vertical_spacing (float): Scale of the y coordinates.
+    horizontal_spacing (float): Scale of the x coordinates.
+    positions (dict or None): Precomputed positions; by default compute_layout(elements, relations).
+
+    Returns:
+    str: The TikZ code of the diagram.
+    """
     if not elements:
         return ""
 
-    positions = compute_layout(elements, relations)
+    if positions is None:
+        positions = compute_layout(elements, relations)
 
     # Find the largest element
     largest_element = max(elements)
 
-    tikz_code = "\\begin{tikzpicture}\n"
+    parts = ["\\begin{tikzpicture}\n"]
 
     # Add nodes with positions
     for element, pos in positions.items():
         x = pos[0] * horizontal_spacing
         y = pos[1] * vertical_spacing
         if element == largest_element:
-            tikz_code += f"  \\node[draw, rectangle, minimum size={node_size}cm] ({element}) at ({x:.2f},{y:.2f}) {{{element}}};\n"
+            parts.append(f"  \\node[draw, rectangle, minimum size={node_size}cm] ({element}) at ({x:.2f},{y:.2f}) {{{element}}};\n")
         else:
-            tikz_code += f"  \\node[minimum size={node_size}cm] ({element}) at ({x:.2f},{y:.2f}) {{{element}}};\n"
+            parts.append(f"  \\node[minimum size={node_size}cm] ({element}) at ({x:.2f},{y:.2f}) {{{element}}};\n")
 
     if relations:
         # Draw the cover relations
-        tikz_code += "  % Draw the cover relations\n"
-        for i, j in relations:
-            tikz_code += f"  \\draw ({i}) -- ({j});\n"
+        parts.append("  % Draw the cover relations\n")
+        parts.extend(f"  \\draw ({i}) -- ({j});\n" for i, j in relations)
 
-    tikz_code += "\\end{tikzpicture}\n"
+    parts.append("\\end{tikzpicture}\n")
 
-    return tikz_code
+    return ''.join(parts)
 
 def generate_ferrers_tikz(hook_lengths, display_hooks=False, box_size=0.2):
-    tikz_code = "\\begin{tikzpicture}\n"
+    parts = ["\\begin{tikzpicture}\n"]
     
     for i, row in enumerate(hook_lengths):
         for j, hook in enumerate(row):
             x1, y1 = j * box_size, -i * box_size
             x2, y2 = (j + 1) * box_size, -(i + 1) * box_size
-            tikz_code += f"  \\draw ({x1:.2f}, {y1:.2f}) rectangle ({x2:.2f}, {y2:.2f});\n"
+            parts.append(f"  \\draw ({x1:.2f}, {y1:.2f}) rectangle ({x2:.2f}, {y2:.2f});\n")
             if display_hooks:
                 mid_x, mid_y = (x1 + x2) / 2, (y1 + y2) / 2
-                tikz_code += f"  \\node[font=\\tiny] at ({mid_x:.2f}, {mid_y:.2f}) {{{hook}}};\n"
+                parts.append(f"  \\node[font=\\tiny] at ({mid_x:.2f}, {mid_y:.2f}) {{{hook}}};\n")
     
-    tikz_code += "\\end{tikzpicture}\n"
+    parts.append("\\end{tikzpicture}\n")
     
-    return tikz_code
+    return ''.join(parts)
 
 def generate_latex_table(data):
     """
@@ -139,13 +234,14 @@ def generate_latex_table(data):
     values_raw = [data[label] for label in labels]
     values = [str(value) for value in values_raw]
 
-    latex_code = ''
-    latex_code += "\\begin{tabular}{|" + "c|" * len(labels) + "}\n"
-    latex_code += "\\toprule\n"
-    latex_code += " & ".join(labels) + " \\\\\n"
-    latex_code += "\\midrule\n"
-    latex_code += " & ".join(values) + " \\\\\n"
-    latex_code += "\\bottomrule\n"
-    latex_code += "\\end{tabular}\n"
-
-    return latex_code
+    parts = [
+        "\\begin{tabular}{|" + "c|" * len(labels) + "}\n",
+        "\\toprule\n",
+        " & ".join(labels) + " \\\\\n",
+        "\\midrule\n",
+        " & ".join(values) + " \\\\\n",
+        "\\bottomrule\n",
+        "\\end{tabular}\n",
+    ]
+
+    return ''.join(parts)
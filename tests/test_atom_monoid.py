@@ -0,0 +1,43 @@
+import unittest
+from collections import Counter
+from src.pocketpartition.core.numerical_set import NumericalSet
+from src.pocketpartition.core.numerical_semigroup import NumericalSemigroup
+from src.pocketpartition.core.numerical_functions import get_atom_monoid
+from src.pocketpartition.core.genus import IterWithMaxGenus
+from src.pocketpartition.core.atom_monoid import (
+    IterNumericalSetsWithAtomMonoid,
+    CountNumericalSetsWithAtomMonoid,
+)
+
+class TestAtomMonoid(unittest.TestCase):
+
+    def test_matches_brute_force(self):
+        for F in range(1, 11):
+            # Every numerical set with Frobenius number F, grouped by atom monoid
+            expected = Counter()
+            for bits in range(1 << (F - 1)):
+                T = NumericalSet._from_mask((1 << F) | (bits << 1))
+                expected[get_atom_monoid(T)] += 1
+            semigroups = [S for S in IterWithMaxGenus(F) if S.frobenius_number == F]
+            self.assertEqual(sum(CountNumericalSetsWithAtomMonoid(S) for S in semigroups), 2 ** (F - 1))
+            for S in semigroups:
+                found = list(IterNumericalSetsWithAtomMonoid(S))
+                self.assertEqual(len(found), expected[S])
+                self.assertEqual(len(set(found)), len(found))
+                self.assertTrue(all(get_atom_monoid(T) == S for T in found))
+                self.assertEqual(CountNumericalSetsWithAtomMonoid(S), expected[S])
+
+    def test_natural_numbers(self):
+        S = NumericalSemigroup(gaps=[])
+        self.assertEqual([T.gaps for T in IterNumericalSetsWithAtomMonoid(S)], [set()])
+        self.assertEqual(CountNumericalSetsWithAtomMonoid(S), 1)
+
+    def test_parallel_count(self):
+        for S in [NumericalSemigroup(gaps=range(1, 15)), NumericalSemigroup(generators=[5, 7, 9])]:
+            self.assertEqual(
+                CountNumericalSetsWithAtomMonoid(S, processes=2, split_depth=3),
+                CountNumericalSetsWithAtomMonoid(S),
+            )
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+import unittest
+from src.pocketpartition.core.batch import batch_invariants, BATCH_INVARIANTS
+from src.pocketpartition.core.genus import IterWithMaxGenus
+from src.pocketpartition.core.random_numerical import RandomNumericalSemigroupsWithGenus
+
+class TestBatchInvariants(unittest.TestCase):
+
+    def test_matches_methods(self):
+        semigroups = list(IterWithMaxGenus(7))
+        table = batch_invariants(iter(semigroups), chunk_size=10)
+        self.assertEqual(len(table), len(semigroups))
+        for i, S in enumerate(semigroups):
+            self.assertEqual(table.row(i), {
+                'frobenius_number': S.frobenius_number,
+                'genus': S.genus,
+                'multiplicity': S.multiplicity(),
+                'type': S.type(),
+                'depth': S.depth(),
+                'minimal_generating_set': S.minimal_generating_set(),
+                'effective_weight': S.effective_weight(),
+                'apery_weight': S.apery_weight(),
+            })
+
+    def test_wide_lanes(self):
+        # Genus 40 needs lanes of more than 64 bits.
+        semigroups = RandomNumericalSemigroupsWithGenus(40, 50, seed=2)
+        table = batch_invariants(semigroups, chunk_size=16)
+        for i, S in enumerate(semigroups):
+            self.assertEqual(table.row(i), {
+                'frobenius_number': S.frobenius_number,
+                'genus': S.genus,
+                'multiplicity': S.multiplicity(),
+                'type': S.type(),
+                'depth': S.depth(),
+                'minimal_generating_set': S.minimal_generating_set(),
+                'effective_weight': S.effective_weight(),
+                'apery_weight': S.apery_weight(),
+            })
+
+    def test_selected_columns(self):
+        table = batch_invariants(IterWithMaxGenus(4), ['genus', 'multiplicity'])
+        self.assertEqual(table.invariants, ('genus', 'multiplicity'))
+        self.assertEqual(sorted(table['genus']), [0, 1, 2, 2, 3, 3, 3, 3, 4, 4, 4, 4, 4, 4, 4])
+        with self.assertRaises(KeyError):
+            table['type']
+        with self.assertRaises(ValueError):
+            batch_invariants([], ['not_an_invariant'])
+        self.assertEqual(set(BATCH_INVARIANTS), set(batch_invariants([]).invariants))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,45 @@
+import gc
+import unittest
+from src.pocketpartition.core.numerical_semigroup import NumericalSemigroup
+from src.pocketpartition.utils.cache import configure_interning, intern_stats, cache_stats
+
+class TestInterning(unittest.TestCase):
+
+    def tearDown(self):
+        configure_interning('weak')
+
+    def test_weak_pool_releases_instances(self):
+        configure_interning('weak', pools=['NumericalSemigroup'])
+        S = NumericalSemigroup(gaps=[1, 2, 3, 5, 6, 7, 9, 10, 11])
+        self.assertIs(S, NumericalSemigroup(gaps=[1, 2, 3, 5, 6, 7, 9, 10, 11]))
+        self.assertEqual(intern_stats()['NumericalSemigroup']['size'], 1)
+        del S
+        gc.collect()
+        self.assertEqual(intern_stats()['NumericalSemigroup']['size'], 0)
+
+    def test_lru_pool_is_bounded(self):
+        configure_interning('lru', maxsize=3, pools=['NumericalSemigroup'])
+        semigroups = [NumericalSemigroup(gaps=range(1, n)) for n in range(1, 10)]
+        stats = intern_stats()['NumericalSemigroup']
+        self.assertEqual(stats['size'], 3)
+        self.assertEqual(stats['evictions'], 6)
+        self.assertEqual(semigroups[0], NumericalSemigroup(gaps=[]))
+
+    def test_interning_off(self):
+        configure_interning('off', pools=['NumericalSemigroup'])
+        S = NumericalSemigroup(gaps=[1, 3])
+        T = NumericalSemigroup(gaps=[1, 3])
+        self.assertIsNot(S, T)
+        self.assertEqual(S, T)
+        self.assertEqual(len({S, T}), 1)
+
+    def test_method_cache(self):
+        S = NumericalSemigroup(generators=[4, 6, 9])
+        before = cache_stats()['NumericalSemigroup.minimal_generating_set']['hits']
+        self.assertEqual(S.minimal_generating_set(), [4, 6, 9])
+        self.assertEqual(S.minimal_generating_set(), [4, 6, 9])
+        after = cache_stats()['NumericalSemigroup.minimal_generating_set']['hits']
+        self.assertGreaterEqual(after - before, 1)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+import os
+import tempfile
+import unittest
+from src.pocketpartition.core.catalog import build_catalog, SemigroupCatalog
+from src.pocketpartition.core.genus import IterWithGenus, IterWithMaxGenus, CountsWithMaxGenus
+
+class TestCatalog(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.directory = tempfile.TemporaryDirectory()
+        cls.path = os.path.join(cls.directory.name, 'genus9.cat')
+        build_catalog(cls.path, 9)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.directory.cleanup()
+
+    def test_counts_by_genus(self):
+        with SemigroupCatalog(self.path) as catalog:
+            self.assertEqual(len(catalog), sum(CountsWithMaxGenus(9)))
+            self.assertEqual([catalog.count(genus=g) for g in range(10)], CountsWithMaxGenus(9))
+
+    def test_queries(self):
+        semigroups = list(IterWithGenus(8))
+        with SemigroupCatalog(self.path) as catalog:
+            self.assertEqual(set(catalog.query(genus=8)), set(semigroups))
+            for m in range(1, 10):
+                expected = {S for S in semigroups if S.multiplicity() == m}
+                self.assertEqual(set(catalog.query(genus=8, multiplicity=m)), expected)
+            expected = {S for S in IterWithMaxGenus(9) if S.frobenius_number == 7}
+            self.assertEqual(set(catalog.query(frobenius_number=7)), expected)
+            self.assertEqual(catalog.count(frobenius_number=7), len(expected))
+
+    def test_frobenius_number_of_the_root(self):
+        semigroups = list(IterWithMaxGenus(9))
+        with SemigroupCatalog(self.path) as catalog:
+            for F in (-1, 0, 1):
+                expected = {S for S in semigroups if S.frobenius_number == F}
+                self.assertEqual(set(catalog.query(frobenius_number=F)), expected)
+                self.assertEqual(catalog.count(frobenius_number=F), len(expected))
+            self.assertEqual(catalog.count(frobenius_number=-1), 1)
+            self.assertEqual(catalog.count(frobenius_number=0), 0)
+
+    def test_parallel_build_is_identical(self):
+        path = os.path.join(self.directory.name, 'parallel.cat')
+        build_catalog(path, 9, processes=2, tasks_per_process=4)
+        with open(self.path, 'rb') as serial, open(path, 'rb') as parallel:
+            self.assertEqual(serial.read(), parallel.read())
+
+    def test_not_a_catalog(self):
+        path = os.path.join(self.directory.name, 'bad.cat')
+        with open(path, 'wb') as handle:
+            handle.write(b'not a catalog at all, just some bytes')
+        with self.assertRaises(ValueError):
+            SemigroupCatalog(path)
+
+if __name__ == '__main__':
+    unittest.main()
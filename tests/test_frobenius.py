@@ -0,0 +1,44 @@
+import unittest
+from collections import Counter
+from src.pocketpartition.core.numerical_semigroup import NumericalSemigroup
+from src.pocketpartition.core.genus import IterWithMaxGenus
+from src.pocketpartition.core.frobenius import (
+    WithFrobeniusNumber,
+    IterWithFrobeniusNumber,
+    CountWithFrobeniusNumber,
+)
+
+class TestFrobeniusTree(unittest.TestCase):
+
+    def test_matches_genus_tree(self):
+        # The genus of a semigroup is at most its Frobenius number
+        expected = Counter(S.frobenius_number for S in IterWithMaxGenus(13))
+        for F in range(-1, 14):
+            semigroups = WithFrobeniusNumber(F)
+            self.assertEqual(len(set(semigroups)), len(semigroups))
+            self.assertEqual(len(semigroups), expected[F])
+            self.assertTrue(all(S.frobenius_number == F for S in semigroups))
+            self.assertEqual(CountWithFrobeniusNumber(F), expected[F])
+
+    def test_tree_structure(self):
+        # Removing the multiplicity leads back up the tree to the ordinary semigroup
+        semigroups = set(IterWithFrobeniusNumber(11))
+        root = NumericalSemigroup(gaps=range(1, 12))
+        for S in semigroups - {root}:
+            m = S.multiplicity()
+            parent = NumericalSemigroup(gaps=set(S.gaps) | {m})
+            self.assertIn(parent, semigroups)
+            self.assertIn(m, parent.special_gaps())
+            self.assertIs(parent.add_specialgap(m), S)
+
+    def test_counts(self):
+        counts = [1, 1, 2, 2, 5, 4, 11, 10, 21, 22, 51, 40, 106, 103, 200, 205, 465, 405, 961, 900]
+        self.assertEqual([CountWithFrobeniusNumber(F) for F in range(1, 21)], counts)
+        self.assertEqual(CountWithFrobeniusNumber(0), 0)
+        self.assertEqual(CountWithFrobeniusNumber(-1), 1)
+
+    def test_parallel_count(self):
+        self.assertEqual(CountWithFrobeniusNumber(24, processes=2, tasks_per_process=4), CountWithFrobeniusNumber(24))
+
+if __name__ == '__main__':
+    unittest.main()
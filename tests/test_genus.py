@@ -0,0 +1,42 @@
+import unittest
+from src.pocketpartition.core.genus import (
+    WithGenus,
+    WithMaxGenus,
+    IterWithGenus,
+    IterWithMaxGenus,
+    CountWithGenus,
+    CountsWithMaxGenus,
+    MapWithGenus,
+)
+
+# Number of numerical semigroups of genus g (OEIS A007323).
+KNOWN_COUNTS = [1, 1, 2, 4, 7, 12, 23, 39, 67, 118, 204, 343, 592, 1001, 1693, 2857]
+
+class TestGenus(unittest.TestCase):
+
+    def test_counts(self):
+        self.assertEqual(CountsWithMaxGenus(len(KNOWN_COUNTS) - 1), KNOWN_COUNTS)
+        self.assertEqual(CountWithGenus(12), 592)
+        self.assertEqual(CountWithGenus(-1), 0)
+
+    def test_iterators_match_bfs(self):
+        for g in range(8):
+            semigroups = list(IterWithGenus(g))
+            self.assertEqual(len(semigroups), KNOWN_COUNTS[g])
+            self.assertEqual(set(semigroups), set(WithGenus(g)))
+            self.assertTrue(all(S.genus == g for S in semigroups))
+        self.assertEqual(set(IterWithMaxGenus(6)), set(WithMaxGenus(6)))
+
+    def test_parallel(self):
+        self.assertEqual(CountsWithMaxGenus(12, processes=2), KNOWN_COUNTS[:13])
+        genera = list(MapWithGenus(9, genus_of, processes=2))
+        self.assertEqual(genera, [9] * KNOWN_COUNTS[9])
+        # The default runs in process, so a lambda works
+        self.assertEqual(sorted(MapWithGenus(7, lambda S: S.genus)), [7] * KNOWN_COUNTS[7])
+
+def genus_of(S):
+    # Module-level so that it can be sent to worker processes.
+    return S.genus
+
+if __name__ == "__main__":
+    unittest.main()
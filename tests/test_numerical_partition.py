@@ -30,5 +30,63 @@ class TestNumericalSetPartition(unittest.TestCase):
             self.assertEqual(numerical_set_partition, partition_list, 
                              f"Test failed: {numerical_set_partition} != {partition_list}")
 
+    def test_profile_word(self):
+        for _ in range(100):
+            partition_list = generate_random_partition()
+            l = Partition(partition_list)
+            word = l.profile_mask()
+
+            # The word is the gap bitmask of the numerical set
+            T = l.to_numerical_set()
+            self.assertEqual(T._mask, word)
+            self.assertIs(Partition.from_numerical_set(T), l)
+            self.assertEqual([(0, 1) if (word >> i) & 1 else (1, 0) for i in range(word.bit_length())], l.profile())
+
+            # Conjugation transposes the diagram
+            conjugate = [sum(1 for part in partition_list if part > j) for j in range(partition_list[0])]
+            self.assertEqual(l.conjugate().partition, conjugate)
+
+            # Hook lengths from arm and leg lengths
+            hooks = [[(part - j - 1) + (conjugate[j] - i - 1) + 1 for j in range(part)] for i, part in enumerate(partition_list)]
+            self.assertEqual(l.hook_lengths(), hooks)
+
+class TestPartitionKernels(unittest.TestCase):
+
+    @staticmethod
+    def naive_profile(partition):
+        # Right and up moves from the bottom-left corner of the Ferrers diagram
+        moves = []
+        parts = list(reversed(partition))
+        previous = 0
+        for part in parts:
+            moves.extend(['R'] * (part - previous) + ['U'])
+            previous = part
+        return moves
+
+    @staticmethod
+    def naive_conjugate(partition):
+        return [sum(1 for part in partition if part > j) for j in range(partition[0])] if partition else []
+
+    def partitions(self):
+        yield from ([], [1], [7], [1, 1, 1, 1, 1], [3, 3, 3], [4, 1])
+        for _ in range(100):
+            yield generate_random_partition()
+
+    def test_kernels_match_naive_definitions(self):
+        for partition in self.partitions():
+            l = Partition(list(partition))
+            conjugate = self.naive_conjugate(partition)
+            self.assertEqual(l.conjugate().partition, conjugate)
+            self.assertEqual(l.conjugate_list(), conjugate)
+
+            values, offsets = l.hook_length_array()
+            hooks = [[(part - j - 1) + (conjugate[j] - i - 1) + 1 for j in range(part)] for i, part in enumerate(partition)]
+            self.assertEqual(values.tolist(), [h for row in hooks for h in row])
+            self.assertEqual(offsets.tolist(), [sum(partition[:i]) for i in range(len(partition) + 1)])
+
+            moves = self.naive_profile(partition)
+            self.assertEqual(l.gaps(), [i for i, move in enumerate(moves) if move == 'U'])
+            self.assertEqual(l.non_gaps(), [i for i, move in enumerate(moves) if move == 'R'])
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
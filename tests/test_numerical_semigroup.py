@@ -0,0 +1,159 @@
+import unittest
+import itertools
+import math
+from collections import Counter
+from src.pocketpartition.core.numerical_set import NumericalSet
+from src.pocketpartition.core.numerical_semigroup import NumericalSemigroup
+from src.pocketpartition.core.kunz import kunz_tuple, KunzPolyhedron
+from src.pocketpartition.core.genus import IterWithMaxGenus
+from src.pocketpartition.core.apery import (
+    frobenius_number_from_generators,
+    genus_from_generators,
+    type_from_generators,
+    invariants_from_generators,
+)
+
+class TestNumericalSemigroup(unittest.TestCase):
+
+    def test_gaps_view(self):
+        S = NumericalSemigroup(gaps=[1, 2, 4, 7])
+        self.assertEqual(S.gaps, {1, 2, 4, 7})
+        self.assertEqual(list(S.gaps), [1, 2, 4, 7])
+        self.assertIn(4, S.gaps)
+        self.assertNotIn(3, S.gaps)
+        self.assertEqual(S.genus, 4)
+        self.assertEqual(S.frobenius_number, 7)
+        self.assertEqual(S.multiplicity(), 3)
+        self.assertEqual(S.small_elements(), [0, 3, 5, 6])
+
+    def test_interning(self):
+        S = NumericalSemigroup(gaps={1, 2, 4, 7})
+        self.assertIs(S, NumericalSemigroup(gaps=[7, 4, 2, 1]))
+        self.assertIs(S, NumericalSemigroup(generators={3, 5}))
+        self.assertEqual(hash(S), hash(NumericalSemigroup(gaps=S.gaps)))
+        self.assertNotEqual(S, NumericalSet(gaps=[1, 2, 4, 7]))
+
+    def test_gaps_from_generators(self):
+        for generators in [{2, 3}, {3, 5}, {4, 6, 9}, {5, 7, 11, 13}, {6, 10, 15}]:
+            bound = 2 * max(generators) ** 2
+            elements = {0}
+            for n in range(1, bound):
+                if any(n - g in elements for g in generators if g <= n):
+                    elements.add(n)
+            expected = set(range(bound)) - elements
+            self.assertEqual(NumericalSemigroup(generators=generators).gaps, expected)
+        S = NumericalSemigroup(generators={11, 13, 17, 19})
+        self.assertEqual(S.frobenius_number, 42)
+        self.assertEqual(S.minimal_generating_set(), [11, 13, 17, 19])
+        with self.assertRaises(ValueError):
+            NumericalSemigroup(generators={4, 6})
+
+    def test_invariants_from_generators(self):
+        for k in (1, 2, 3, 4):
+            for generators in itertools.combinations(range(1, 21), k):
+                if math.gcd(*generators) != 1:
+                    continue
+                S = NumericalSemigroup(generators=generators)
+                self.assertEqual(frobenius_number_from_generators(generators), S.frobenius_number)
+                self.assertEqual(genus_from_generators(generators), S.genus)
+                self.assertEqual(type_from_generators(generators), S.type())
+        # Sylvester, and a triple with no coprime pair
+        self.assertEqual(frobenius_number_from_generators([999983, 1000003]), 999983 * 1000003 - 999983 - 1000003)
+        self.assertEqual(genus_from_generators([999983, 1000003]), 999982 * 1000002 // 2)
+        self.assertEqual(frobenius_number_from_generators([6, 10, 15]), 29)
+        S = NumericalSemigroup(generators=[1001, 1297, 1543, 2011])
+        self.assertEqual(frobenius_number_from_generators([1001, 1297, 1543, 2011]), S.frobenius_number)
+        self.assertEqual(genus_from_generators([1001, 1297, 1543, 2011]), S.genus)
+        self.assertEqual(invariants_from_generators([2011, 1543, 1297, 1001]), (S.frobenius_number, S.genus, S.type()))
+        with self.assertRaises(ValueError):
+            genus_from_generators([4, 6])
+        with self.assertRaises(ValueError):
+            frobenius_number_from_generators([2.5, 3])
+
+    def test_apery_and_kunz_constructors(self):
+        for S in IterWithMaxGenus(7):
+            m = S.multiplicity()
+            elements = [x for x in range(1, S.frobenius_number + m + 2) if x not in S.gaps]
+            expected = [x for x in elements if not any(x - y in elements for y in elements if y < x)]
+            self.assertEqual(S.minimal_generating_set(), expected)
+            self.assertIs(NumericalSemigroup.from_apery_set(S.apery_set(m)), S)
+            self.assertIs(NumericalSemigroup.from_kunz_tuple(kunz_tuple(S)), S)
+            self.assertIs(KunzPolyhedron(m).semigroup(kunz_tuple(S)), S)
+        self.assertEqual(NumericalSemigroup.from_kunz_tuple((3, 1)).gaps, {1, 2, 4, 7})
+        with self.assertRaises(ValueError):
+            NumericalSemigroup.from_apery_set([0, 1, 5])
+
+    def test_kunz_points(self):
+        def naive_is_point(m, p):
+            p = (0,) + tuple(p) if len(p) == m - 1 else tuple(p)
+            return min(p) >= 0 and all(p[i] + p[j] + (i + j >= m) >= p[(i + j) % m] for i in range(m) for j in range(i, m))
+        for m in range(1, 6):
+            P = KunzPolyhedron(m)
+            for width in (m - 1, m):
+                rows = list(itertools.product(range(-1, 4), repeat=width))
+                expected = [naive_is_point(m, p) if p else True for p in rows]
+                self.assertEqual(P.is_points(rows), expected)
+                self.assertEqual([P.is_point(p) for p in rows], expected)
+        self.assertEqual(KunzPolyhedron(3).is_points([(1, 2), (10 ** 12, 10 ** 12), (2 ** 70, 1)]), [True, True, False])
+        with self.assertRaises(ValueError):
+            KunzPolyhedron(3).is_points([(1, 1), (1, 1, 1)])
+
+        by_genus = Counter((S.multiplicity(), S.genus) for S in IterWithMaxGenus(10))
+        by_depth = Counter((S.multiplicity(), S.depth()) for S in IterWithMaxGenus(10))
+        for m in range(1, 12):
+            P = KunzPolyhedron(m)
+            for g in range(11):
+                semigroups = list(P.semigroups(genus=g))
+                self.assertEqual(len(set(semigroups)), by_genus[(m, g)])
+                self.assertTrue(all(S.multiplicity() == m and S.genus == g for S in semigroups))
+                self.assertEqual(P.count_integer_points(genus=g), by_genus[(m, g)])
+            if m <= 6:
+                self.assertEqual(P.count_integer_points(depth=1), by_depth[(m, 1)] + by_depth[(m, 0)])
+            if m <= 4:
+                self.assertEqual(P.count_integer_points(depth=2), sum(by_depth[(m, d)] for d in range(3)))
+        with self.assertRaises(ValueError):
+            next(KunzPolyhedron(3).integer_points())
+
+    def test_pseudofrobenius_and_special_gaps(self):
+        for S in IterWithMaxGenus(8):
+            gaps = S.gaps
+            elements = [s for s in range(1, S.frobenius_number + 1) if s not in gaps]
+            pf = [x for x in gaps if all(x + s not in gaps for s in elements)]
+            self.assertEqual(S.pseudofrobenius_numbers(), pf)
+            self.assertEqual(S.type(), len(pf))
+            self.assertEqual(S.special_gaps(), [x for x in pf if 2 * x not in gaps])
+            for child in S.get_frobchildren():
+                self.assertEqual(child.frobenius_number, S.frobenius_number)
+                self.assertEqual(child.genus, S.genus - 1)
+
+    def test_cached_lists_are_copies(self):
+        S = NumericalSemigroup(generators=[5, 7, 9])
+        pf, special = S.pseudofrobenius_numbers(), S.special_gaps()
+        S.pseudofrobenius_numbers().append(100)
+        S.special_gaps().clear()
+        T = NumericalSemigroup(gaps=S.gaps)  # the same interned instance
+        self.assertEqual(T.pseudofrobenius_numbers(), pf)
+        self.assertEqual(T.special_gaps(), special)
+        self.assertEqual(T.type(), len(pf))
+
+    def test_children_inherit_generators(self):
+        for S in IterWithMaxGenus(7):
+            for x in S.minimal_generating_set():
+                child = S.remove_minimal_generator(x)
+                gaps = set(child.gaps)
+                bound = child.frobenius_number + child.multiplicity() + 2
+                elements = [s for s in range(1, bound) if s not in gaps]
+                naive = [s for s in elements if not any(s - t in elements for t in elements if t < s)]
+                self.assertEqual(child.minimal_generating_set(), naive)
+                m = child.multiplicity()
+                apery = sorted(min(s for s in [0] + elements if s % m == r) for r in range(m))
+                self.assertEqual(sorted(child._multiplicity_apery_set()), apery)
+            self.assertEqual(len(S.get_children()), len(S.effective_generators()))
+
+    def test_invalid_gaps(self):
+        for _ in range(2):
+            with self.assertRaises(ValueError):
+                NumericalSemigroup(gaps=[2, 3])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+import unittest
+from src.pocketpartition.core.numerical_semigroup import NumericalSemigroup
+from src.pocketpartition.core.numerical_functions import get_gap_poset
+from src.pocketpartition.core.poset import Poset
+
+class TestPoset(unittest.TestCase):
+
+    def setUp(self):
+        # Divisibility on {1, 2, 3, 6}.
+        self.elements = [1, 2, 3, 6]
+        self.relations = [(a, b) for a in self.elements for b in self.elements if b % a == 0]
+
+    def test_cover_relations(self):
+        P = Poset(self.elements, self.relations)
+        self.assertEqual(P.cover_relations(), {(1, 2), (1, 3), (2, 6), (3, 6)})
+
+    def test_from_cover_relations(self):
+        P = Poset.from_cover_relations(self.elements, [(1, 2), (1, 3), (2, 6), (3, 6)])
+        self.assertEqual(P, Poset(self.elements, self.relations))
+
+    def test_invalid_relations(self):
+        with self.assertRaisesRegex(ValueError, "Reflexivity"):
+            Poset([1, 2], [(1, 1), (1, 2)])
+        with self.assertRaisesRegex(ValueError, "Antisymmetry"):
+            Poset([1, 2], [(1, 1), (2, 2), (1, 2), (2, 1)])
+        with self.assertRaisesRegex(ValueError, "Transitivity"):
+            Poset([1, 2, 3], [(1, 1), (2, 2), (3, 3), (1, 2), (2, 3)])
+
+    def test_lazy_validation(self):
+        relations = [(1, 1), (2, 2), (3, 3), (4, 4), (1, 2), (2, 3)]
+        P = Poset([1, 2, 3, 4], relations, validate=False)
+        with self.assertRaises(ValueError):
+            P.validate()
+        with self.assertRaises(ValueError):
+            Poset([1, 2, 3, 4], relations)
+
+    def test_gap_poset_covers(self):
+        S = NumericalSemigroup(generators=[5, 7, 9])
+        P = get_gap_poset(S)
+        P.validate()
+        relations = P.relations
+        naive = {
+            (x, y) for (x, y) in relations
+            if x != y and not any(z not in (x, y) and (x, z) in relations and (z, y) in relations for z in P.elements)
+        }
+        self.assertEqual(P.cover_relations(), naive)
+
+    def test_queries(self):
+        P = Poset(self.elements, self.relations)
+        self.assertEqual(P.ranks(), {1: 0, 2: 1, 3: 1, 6: 2})
+        self.assertEqual(P.height(), 3)
+        self.assertEqual(sorted(P.maximal_chains()), [[1, 2, 6], [1, 3, 6]])
+        self.assertEqual(P.width(), 2)
+        # Empty, four singletons and {2, 3}.
+        self.assertEqual(P.antichains_count(), 6)
+        self.assertEqual(P.linear_extensions_count(), 2)
+
+    def test_antichain_queries_on_chain_and_antichain(self):
+        chain = Poset.from_cover_relations(range(5), [(i, i + 1) for i in range(4)])
+        self.assertEqual((chain.width(), chain.antichains_count(), chain.linear_extensions_count()), (1, 6, 1))
+        antichain = Poset(range(5), [(i, i) for i in range(5)])
+        self.assertEqual((antichain.width(), antichain.antichains_count(), antichain.linear_extensions_count()), (5, 32, 120))
+
+if __name__ == '__main__':
+    unittest.main()
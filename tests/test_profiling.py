@@ -0,0 +1,58 @@
+import json
+import unittest
+from src.pocketpartition.core.numerical_semigroup import NumericalSemigroup
+from src.pocketpartition.core.genus import CountWithGenus, IterWithGenus
+from src.pocketpartition.core.frobenius import CountWithFrobeniusNumber
+from src.pocketpartition.core.semigroup_partitions import CountSemigroupPartitions
+from src.pocketpartition.core.atom_monoid import CountNumericalSetsWithAtomMonoid
+from src.pocketpartition.utils.profiling import profile
+
+class TestProfiling(unittest.TestCase):
+
+    def test_counts_calls_and_restores_methods(self):
+        original = NumericalSemigroup.__dict__['minimal_generating_set']
+        with profile() as prof:
+            semigroups = list(IterWithGenus(6))
+            for S in semigroups:
+                S.minimal_generating_set()
+        self.assertIs(NumericalSemigroup.__dict__['minimal_generating_set'], original)
+        summary = prof.summary()
+        self.assertEqual(summary['methods']['NumericalSemigroup.minimal_generating_set']['calls'], len(semigroups))
+        self.assertGreaterEqual(summary['traversal']['nodes'], len(semigroups))
+        self.assertIn('NumericalSemigroup', summary['intern_pools'])
+        self.assertEqual(json.loads(prof.to_json())['methods'].keys(), summary['methods'].keys())
+
+    def test_nothing_recorded_outside_session(self):
+        with profile() as prof:
+            pass
+        CountWithGenus(8)
+        self.assertEqual(prof.summary()['traversal']['nodes'], 0)
+        self.assertEqual(prof.summary()['methods'], {})
+
+    def test_single_active_profiler(self):
+        with profile():
+            with self.assertRaises(RuntimeError):
+                profile().start()
+
+    def test_counts_every_tree_walk(self):
+        with profile() as prof:
+            frobenius_count = CountWithFrobeniusNumber(12)
+        self.assertEqual(prof.summary()['traversal']['nodes'], frobenius_count)
+        with profile() as prof:
+            CountSemigroupPartitions(12)
+        self.assertGreater(prof.summary()['traversal']['nodes'], 0)
+        with profile() as prof:
+            count = CountNumericalSetsWithAtomMonoid(NumericalSemigroup(gaps=range(1, 9)))
+        self.assertGreaterEqual(prof.summary()['traversal']['nodes'], count)
+
+    def test_failed_start_restores_methods(self):
+        original = NumericalSemigroup.__dict__['minimal_generating_set']
+        prof = profile({'NumericalSemigroup': ['minimal_generating_set'], 'NoSuchClass': ['f']})
+        with self.assertRaises(KeyError):
+            prof.start()
+        self.assertIs(NumericalSemigroup.__dict__['minimal_generating_set'], original)
+        with profile():
+            pass
+
+if __name__ == '__main__':
+    unittest.main()
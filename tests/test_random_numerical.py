@@ -0,0 +1,46 @@
+import random
+import unittest
+from src.pocketpartition.core.numerical_semigroup import NumericalSemigroup, _remove_generator
+from src.pocketpartition.core.genus import IterWithMaxGenus
+from src.pocketpartition.core.random_numerical import (
+    RandomNumericalSemigroupWithGenus,
+    RandomNumericalSemigroupsWithGenus,
+    RandomTreeWalk,
+)
+
+class TestRandomNumerical(unittest.TestCase):
+
+    def test_remove_generator_matches_brute_force(self):
+        for S in IterWithMaxGenus(8):
+            generators = S.minimal_generating_set()
+            for x in generators:
+                gaps = set(S.gaps) | {x}
+                # Minimal generators are at most F + m, and both are at most max(gaps) + 1.
+                elements = [s for s in range(1, 2 * max(gaps) + 3) if s not in gaps]
+                expected = [s for s in elements if not any(s - t not in gaps for t in elements if t < s)]
+                mask = sum(1 << t for t in gaps)
+                self.assertEqual(_remove_generator(S._mask, generators, x), (mask, expected))
+
+    def test_single_sample_genus(self):
+        S = RandomNumericalSemigroupWithGenus(10, random.Random(3))
+        self.assertEqual(S.genus, 10)
+        self.assertEqual(S, NumericalSemigroup(gaps=list(S.gaps)))
+
+    def test_bulk_samples_are_reproducible(self):
+        samples = RandomNumericalSemigroupsWithGenus(12, 200, seed=11)
+        self.assertEqual(len(samples), 200)
+        self.assertTrue(all(S.genus == 12 for S in samples))
+        self.assertEqual(samples, RandomNumericalSemigroupsWithGenus(12, 200, seed=11, chunk_size=7))
+        self.assertEqual(samples, RandomNumericalSemigroupsWithGenus(12, 200, seed=11, processes=2, chunk_size=50))
+        self.assertNotEqual(samples, RandomNumericalSemigroupsWithGenus(12, 200, seed=12))
+
+    def test_bulk_tree_walk(self):
+        samples = RandomNumericalSemigroupsWithGenus(10, 50, seed=5, walk='tree')
+        for S in samples:
+            self.assertTrue(S is None or S.genus == 10)
+        self.assertIsNone(RandomTreeWalk(NumericalSemigroup(generators=[4, 5]), 1))
+        with self.assertRaises(ValueError):
+            RandomNumericalSemigroupsWithGenus(10, 5, walk='unknown')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,41 @@
+import unittest
+from src.pocketpartition.core.partition import Partition
+from src.pocketpartition.core.semigroup_partitions import (
+    IterSemigroupPartitions,
+    IterSemigroupPartitionsWithMaxSize,
+    CountSemigroupPartitions,
+    CountsSemigroupPartitionsWithMaxSize,
+)
+
+def partitions(n, largest=None):
+    largest = n if largest is None else largest
+    if n == 0:
+        yield []
+        return
+    for part in range(min(n, largest), 0, -1):
+        for rest in partitions(n - part, part):
+            yield [part] + rest
+
+class TestSemigroupPartitions(unittest.TestCase):
+
+    def test_matches_filtered_partitions(self):
+        for n in range(13):
+            expected = sorted(p for p in partitions(n) if Partition(list(p)).atom_partition() == p)
+            self.assertEqual(sorted(P.partition for P in IterSemigroupPartitions(n)), expected)
+            for p in partitions(n):
+                self.assertEqual(Partition(list(p)).is_semigroup(), p in expected)
+
+    def test_counts(self):
+        counts = [1, 1, 1, 2, 2, 3, 5, 5, 7, 10, 13, 14, 22, 23, 32, 42, 51, 59, 82]
+        self.assertEqual(CountsSemigroupPartitionsWithMaxSize(18), counts)
+        self.assertEqual(CountSemigroupPartitions(18), 82)
+        self.assertEqual(sum(1 for _ in IterSemigroupPartitionsWithMaxSize(18)), sum(counts))
+
+    def test_parallel_counts(self):
+        self.assertEqual(
+            CountsSemigroupPartitionsWithMaxSize(30, processes=2, tasks_per_process=4),
+            CountsSemigroupPartitionsWithMaxSize(30),
+        )
+
+if __name__ == '__main__':
+    unittest.main()
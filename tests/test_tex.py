@@ -0,0 +1,59 @@
+import io
+import unittest
+from src.pocketpartition.core.genus import IterWithGenus
+from src.pocketpartition.core.numerical_semigroup import NumericalSemigroup
+from src.pocketpartition.core.numerical_functions import get_gap_poset
+from src.pocketpartition.visualization.tikz import compute_layout, compute_ranks, generate_hasse_tikz
+from src.pocketpartition.visualization.tex import write_tex_catalog, wrap_with_headers_footers, generate_semigroup_page
+
+class TestTexCatalog(unittest.TestCase):
+
+    def test_streamed_catalog_matches_document(self):
+        semigroups = list(IterWithGenus(4))
+        sink = io.StringIO()
+        pages = write_tex_catalog(iter(semigroups), sink)
+        self.assertEqual(pages, len(semigroups))
+        content = ''.join(generate_semigroup_page(S) for S in semigroups)
+        self.assertEqual(sink.getvalue(), wrap_with_headers_footers(content))
+
+    def test_parallel_catalog_keeps_order(self):
+        serial, parallel = io.StringIO(), io.StringIO()
+        write_tex_catalog(IterWithGenus(4), serial)
+        write_tex_catalog(IterWithGenus(4), parallel, processes=2, window=3)
+        self.assertEqual(serial.getvalue(), parallel.getvalue())
+
+class TestHasseLayout(unittest.TestCase):
+
+    def setUp(self):
+        P = get_gap_poset(NumericalSemigroup(generators=[11, 13, 17, 19]))
+        self.elements = sorted(P.elements)
+        self.relations = sorted(P.cover_relations())
+
+    def test_ranks_follow_longest_paths(self):
+        rank = compute_ranks(self.elements, self.relations)
+        for parent, child in self.relations:
+            self.assertGreater(rank[child], rank[parent])
+        self.assertEqual(rank[max(self.elements)], 0)
+
+    def test_layout_places_rows_without_overlap(self):
+        positions = compute_layout(self.elements, self.relations)
+        self.assertEqual(set(positions), set(self.elements))
+        self.assertEqual(len(set(positions.values())), len(self.elements))
+        rank = compute_ranks(self.elements, self.relations)
+        for element, (x, y) in positions.items():
+            self.assertEqual(y, -2 * rank[element])
+
+    def test_precomputed_positions(self):
+        positions = compute_layout(self.elements, self.relations, crossing_passes=0)
+        self.assertEqual(
+            generate_hasse_tikz(self.elements, self.relations, positions=positions),
+            generate_hasse_tikz(self.elements, self.relations, positions=dict(positions)),
+        )
+        self.assertIn("\\draw (", generate_hasse_tikz(self.elements, self.relations))
+
+    def test_unknown_element(self):
+        with self.assertRaises(ValueError):
+            compute_layout([1, 2], [(1, 3)])
+
+if __name__ == '__main__':
+    unittest.main()